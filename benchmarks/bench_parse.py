@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+parse_issue_body 마이크로벤치마크
+
+큰 합성 Issue 본문에 대해 현재 토크나이저(scripts/parser.py)와
+이전의 줄 단위 if/elif 파서(아래 legacy_*)를 비교한다.
+
+    python benchmarks/bench_parse.py [--lines 20000] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from parser import parse_issue_body  # noqa: E402
+
+
+# -----------------------------
+# 이전 구현 (비교 기준)
+# -----------------------------
+def legacy_parse_time(time_str):
+    if not time_str:
+        return 0
+    hours = 0
+    minutes = 0
+    decimal_match = re.search(r'(\d+\.?\d*)h', time_str)
+    if decimal_match:
+        return int(float(decimal_match.group(1)) * 60)
+    hour_match = re.search(r'(\d+)\s*(?:h|시간)', time_str)
+    if hour_match:
+        hours = int(hour_match.group(1))
+    min_match = re.search(r'(\d+)\s*(?:m|분)', time_str)
+    if min_match:
+        minutes = int(min_match.group(1))
+    return hours * 60 + minutes
+
+
+def legacy_parse_issue_body(body):
+    body = re.sub(r'<!--.*?-->', '', body, flags=re.DOTALL)
+    result = {
+        'fitness': {'time': 0, 'note': ''},
+        'english': {'time': 0, 'note': ''},
+        'research': {'time': 0, 'note': ''},
+        'reading': {'title': '', 'note': ''}
+    }
+    for line in body.split('\n'):
+        line = line.strip()
+        if not line or line.startswith('#') or line.startswith('```'):
+            continue
+        if '💪' in line:
+            key, emoji = 'fitness', '💪'
+        elif '🗣️' in line or '🗣' in line:
+            key, emoji = 'english', '🗣️' if '🗣️' in line else '🗣'
+        elif '🔬' in line:
+            key, emoji = 'research', '🔬'
+        elif '📚' in line:
+            parts = line.split('📚', 1)[1].strip()
+            if not parts or parts in ['.', '-', '_', '~'] or len(parts.strip()) < 2:
+                continue
+            if '-' in parts:
+                result['reading']['title'] = parts.split('-')[0].strip()
+                result['reading']['note'] = parts.split('-', 1)[1].strip()
+            else:
+                result['reading']['title'] = parts
+            continue
+        else:
+            continue
+        parts = line.split(emoji, 1)[1].strip()
+        if not parts:
+            continue
+        time_part = parts.split('-')[0].strip() if '-' in parts else parts
+        result[key]['time'] = legacy_parse_time(time_part)
+        if '-' in parts:
+            result[key]['note'] = parts.split('-', 1)[1].strip()
+    return result
+
+
+# -----------------------------
+# 합성 입력
+# -----------------------------
+def synthetic_body(lines: int, seed: int = 0) -> str:
+    """습관 줄, 제목, 주석, 일반 텍스트가 섞인 큰 Issue 본문"""
+    rng = random.Random(seed)
+    times = ["1h", "45m", "1.5h", "2시간", "30분", "3h", ".", ""]
+    out = ["📅 2025-12-20", ""]
+    for i in range(lines):
+        kind = rng.randrange(8)
+        if kind == 0:
+            out.append(f"💪 {rng.choice(times)} - squat {i}")
+        elif kind == 1:
+            out.append(f"🗣️ {rng.choice(times)}")
+        elif kind == 2:
+            out.append(f"🔬 {rng.choice(times)} - VQE 회로 최적화 실험 {i}")
+        elif kind == 3:
+            out.append(f"📚 Quantum Computing {i % 7} - Ch.{i % 12} 양자 게이트")
+        elif kind == 4:
+            out.append(f"## 메모 {i}")
+        elif kind == 5:
+            out.append(f"<!-- 주석 {i} -->")
+        else:
+            out.append(f"오늘은 {i}번째 줄입니다. 특별한 내용 없음.")
+    return "\n".join(out)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--lines", type=int, default=20000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    body = synthetic_body(args.lines)
+    if parse_issue_body(body) != legacy_parse_issue_body(body):
+        print("⚠️ tokenizer and legacy parser disagree on the synthetic body")
+
+    results = {}
+    for name, fn in (("legacy", legacy_parse_issue_body), ("tokenizer", parse_issue_body)):
+        best = min(timeit.repeat(lambda: fn(body), number=1, repeat=args.repeat))
+        results[name] = best
+        print(f"{name:>10}: {best * 1000:8.2f} ms  ({args.lines / best:,.0f} lines/s)")
+    print(f"   speedup: {results['legacy'] / results['tokenizer']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
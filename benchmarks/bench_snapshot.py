@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스냅샷 로드 벤치마크
+
+여러 해 분량의 합성 통계를 연도 파티션 JSON(indent=2)과 .bin(packed)으로 저장해 두고
+모든 해를 읽는 경우(로드 → DailyColumns → 집계)를 두 방식으로 비교한다.
+
+    python benchmarks/bench_snapshot.py [--years 12] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import dashboard  # noqa: E402
+import packed  # noqa: E402
+import store  # noqa: E402
+from atomic import WriteBatch  # noqa: E402
+from columns import DailyColumns  # noqa: E402
+from synthetic import synthetic_stats  # noqa: E402
+
+
+def bench(label: str, fn, repeat: int) -> float:
+    best = min(timeit.repeat(fn, number=1, repeat=repeat))
+    print(f"{label:<34} {best * 1000:9.2f} ms")
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--years", type=int, default=12)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    stats = synthetic_stats(args.years)
+    now = datetime(2024, 12, 31, 12, tzinfo=dashboard.KST)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stats_file = os.path.join(tmp, "stats.json")
+        events_file = os.path.join(tmp, "events.jsonl")
+        with WriteBatch(fsync=False) as batch:
+            store.save_snapshot(stats, batch, stats_file)
+        partitions = [store.partition_path(year, stats_file) for year in stats["meta"]["partitions"]]
+        print(f"{len(stats['daily'])} days in {len(partitions)} partitions: "
+              f"JSON {sum(map(os.path.getsize, partitions)) / 1024:.0f} KiB, "
+              f"bin {sum(os.path.getsize(packed.packed_path(p)) for p in partitions) / 1024:.0f} KiB")
+
+        def from_json():
+            loaded = store.load_stats(stats_file, events_file)
+            return loaded, DailyColumns.from_daily(loaded["daily"])
+
+        def from_packed():
+            return packed.load(stats_file, events_file)
+
+        def aggregate(load):
+            loaded, cols = load()
+            return dashboard.aggregate(loaded, now, cols=cols)
+
+        # 두 방식의 집계 결과가 같은지
+        assert aggregate(from_json) == aggregate(from_packed)
+
+        json_load = bench("load: JSON", from_json, args.repeat)
+        packed_load = bench("load: .bin (mmap)", from_packed, args.repeat)
+        bench("load + aggregate: JSON", lambda: aggregate(from_json), args.repeat)
+        bench("load + aggregate: .bin", lambda: aggregate(from_packed), args.repeat)
+        print(f"load speedup: {json_load / packed_load:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스크립트 시작(import) 시간 벤치마크
+
+새 인터프리터에서 parser / dashboard 모듈을 import하는 시간을
+`python -X importtime`으로 재고, 누적 시간이 큰 import를 보여준다.
+
+    python benchmarks/bench_startup.py [--repeat 5] [--top 8]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+
+
+def importtime(module: str) -> list:
+    """[(누적 µs, import 이름)] - 한 번 실행한 -X importtime 출력"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=SCRIPTS, capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        rows.append((int(cumulative), name.rstrip()))
+    return rows
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--top", type=int, default=8)
+    args = arg_parser.parse_args()
+
+    for module in ("parser", "dashboard"):
+        runs = [importtime(module) for _ in range(args.repeat)]
+        # 첫 실행은 .pyc 생성이 섞일 수 있으므로 가장 빠른 실행 기준
+        best = min(runs, key=lambda rows: next(us for us, name in rows if name.strip() == module))
+        total = next(us for us, name in best if name.strip() == module)
+        print(f"import {module}: {total / 1000:.1f} ms")
+        for us, name in sorted(best, reverse=True)[1:args.top + 1]:
+            print(f"  {us / 1000:7.1f} ms {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+전체 파이프라인 벤치마크 (규모별, 결과는 JSON)
+
+synthetic.py로 N년 분량의 저장소(통계 스냅샷, 주간 로그, 독서 로그)를
+임시 디렉터리에 만들고 단계별로 따로 잰다.
+
+- parse:      issue 본문 --issues개 parse_issue_body
+- stats:      update_stats 한 번 (manifest + 필요한 파티션 + 로그 꼬리 로드, 이벤트 추가)
+- compact:    store.compact (로그를 스냅샷으로 접기, 바뀐 연도 파티션만 다시 씀)
+- weeklog:    update_weekly_log 한 번 (기록 중간 주의 하루 섹션 교체)
+- booklog:    update_book_log 한 번 (노트가 가장 많은 책)
+- render:     generate_dashboard (필요한 연도만 로드 + 집계 + README 문자열)
+- heatmap:    모든 해의 히트맵 격자 + 이모지 (일별 컬럼은 미리 로드)
+- fsck:       fsck.verify (모든 rollup/streak 재계산 비교)
+
+시간은 --repeat번 중 최소/중앙값, 메모리는 tracemalloc으로 따로 한 번 더 실행한 최대 할당량.
+JSON을 커밋마다 남겨 두고 --compare로 비교한다.
+
+    python benchmarks/bench_suite.py --years 5 10 50 --books 2000 -o bench.json
+    python benchmarks/bench_suite.py --years 10 --compare bench.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from collections import Counter
+from datetime import timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import columns  # noqa: E402
+import dashboard  # noqa: E402
+import fsck  # noqa: E402
+import heatmap  # noqa: E402
+import parser  # noqa: E402
+import store  # noqa: E402
+from atomic import WriteBatch  # noqa: E402
+from synthetic import day_records, issue_body, write_tree  # noqa: E402
+
+REPO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def measure(fn, repeat: int) -> dict:
+    """{best_ms, median_ms, peak_kib} - 시간은 tracemalloc 없이, 메모리는 따로 한 번"""
+    times = timeit.repeat(fn, number=1, repeat=repeat)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "best_ms": round(min(times) * 1000, 3),
+        "median_ms": round(statistics.median(times) * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def stages(records: list, issues: int, fsync: bool) -> dict:
+    """단계 이름 → 인자 없는 함수 (현재 디렉터리의 합성 저장소 대상)"""
+    bodies = [issue_body(when, data) for when, data in records[-issues:]]
+    last_when, last_data = records[-1]
+    new_day = last_when + timedelta(days=1)
+    mid_when, mid_data = next((when, data) for when, data in records[len(records) // 2:]
+                              if parser.render_day_section(when, data) is not None)
+    titles = Counter(data["reading"]["title"] for _, data in records if data["reading"]["note"])
+    top_title = titles.most_common(1)[0][0]
+    book_data = next(data for _, data in reversed(records) if data["reading"]["title"] == top_title)
+
+    def parse():
+        for body in bodies:
+            parser.parse_issue_body(body)
+
+    def stats():
+        with WriteBatch(fsync=fsync) as batch:
+            parser.update_stats(new_day, last_data, batch)
+
+    def compact():
+        with WriteBatch(fsync=fsync) as batch:
+            store.compact(batch)
+
+    def weeklog():
+        with WriteBatch(fsync=fsync) as batch:
+            parser.update_weekly_log(mid_when, mid_data, batch)
+
+    def booklog():
+        with WriteBatch(fsync=fsync) as batch:
+            parser.update_book_log(book_data, batch, new_day)
+
+    def render():
+        dashboard.generate_dashboard(new_day)
+
+    _, all_cols = dashboard.load_stats()
+    years = heatmap.all_years(all_cols, new_day.toordinal())
+
+    def heat():
+        for grid in heatmap.year_grids(all_cols, years, new_day.toordinal()):
+            heatmap.render_emoji(grid["cells"])
+
+    def verify():
+        drift = fsck.verify(*fsck.load())
+        assert not drift, drift[:3]
+
+    return {"parse": parse, "stats": stats, "compact": compact, "weeklog": weeklog,
+            "booklog": booklog, "render": render, "heatmap": heat, "fsck": verify}
+
+
+def run_scale(years: int, books: int, seed: int, issues: int, repeat: int, fsync: bool) -> dict:
+    records = list(day_records(years, books, seed))
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = write_tree(tmp, years, books, seed)
+        os.chdir(tmp)
+        try:
+            # 스크립트의 진행 메시지가 stdout의 JSON에 섞이지 않도록
+            with contextlib.redirect_stdout(sys.stderr):
+                results = {name: measure(fn, repeat) for name, fn in stages(records, issues, fsync).items()}
+        finally:
+            os.chdir(cwd)
+    return {
+        "years": years,
+        "days": len(stats["daily"]),
+        "books": len(stats["books"]),
+        "stages": results,
+    }
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": columns.np is not None,
+    }
+
+
+def report(result: dict, baseline: dict = None) -> None:
+    """사람이 읽는 표 (stderr) - baseline이 있으면 같은 규모의 best_ms 비율도"""
+    base = {s["years"]: s["stages"] for s in (baseline or {}).get("scales", [])}
+    for scale in result["scales"]:
+        print(f"{scale['years']}y: {scale['days']} days, {scale['books']} books", file=sys.stderr)
+        for name, m in scale["stages"].items():
+            line = f"  {name:<8} {m['best_ms']:10.2f} ms  (median {m['median_ms']:.2f})  peak {m['peak_kib']:9.1f} KiB"
+            old = base.get(scale["years"], {}).get(name)
+            if old and old["best_ms"]:
+                line += f"  {m['best_ms'] / old['best_ms']:.2f}x vs {baseline['env'].get('commit')}"
+            print(line, file=sys.stderr)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--years", type=int, nargs="+", default=[5, 10, 50])
+    arg_parser.add_argument("--books", type=int, default=1000, help="distinct book titles in the generator")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--issues", type=int, default=365, help="issue bodies per parse run")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--fsync", action="store_true", help="fsync writes like the real scripts")
+    arg_parser.add_argument("-o", "--output", metavar="FILE", help="write the JSON result here (default: stdout)")
+    arg_parser.add_argument("--compare", metavar="FILE", help="earlier JSON result to compare against")
+    args = arg_parser.parse_args()
+
+    result = {
+        "env": environment(),
+        "params": {"books": args.books, "seed": args.seed, "issues": args.issues,
+                   "repeat": args.repeat, "fsync": args.fsync},
+        "scales": [run_scale(years, args.books, args.seed, args.issues, args.repeat, args.fsync)
+                   for years in args.years],
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+    report(result, baseline)
+
+    text = json.dumps(result, indent=2) + "\n"
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+주간 로그 쓰기 벤치마크
+
+하루에 항목이 아주 많은 week 파일에서 하루치 섹션을 교체/삽입/추가할 때
+이전 방식(파일 전체 re.sub + re.finditer 후 재구성, 아래 legacy_merge)과
+weeklog.WeekFile(섹션 splice / append)을 비교한다.
+디스크 쓰기는 둘 다 파일 전체를 쓰지만 upsert_section은 fsync + rename까지 포함한다.
+
+    python benchmarks/bench_weeklog.py [--lines-per-day 500] [--repeat 5]
+"""
+
+import argparse
+import os
+import re
+import sys
+import tempfile
+import timeit
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from atomic import WriteBatch  # noqa: E402
+from weeklog import WeekFile, upsert_section  # noqa: E402
+
+
+def legacy_merge(content, date_str, day_section):
+    """이전 update_weekly_log의 병합 로직 (섹션 정규식 버그는 고친 상태)"""
+    date_pattern = f"## {date_str}[^\\n]*\\n.*?(?=\\n## |\\Z)"
+    content = re.sub(date_pattern, '', content, flags=re.DOTALL)
+    sections = {}
+    header = content.split('\n## ')[0].rstrip('\n')
+    section_pattern = r'## (\d{4}-\d{2}-\d{2})[^\n]*\n(.*?)(?=\n## |\Z)'
+    for match in re.finditer(section_pattern, content, re.DOTALL):
+        first_line = match.group(0).split('\n', 1)[0]
+        sections[match.group(1)] = f"{first_line}\n\n{match.group(2).strip()}\n\n"
+    sections[date_str] = day_section
+    new_content = header + "\n\n"
+    for _, section in sorted(sections.items()):
+        new_content += section
+    return new_content
+
+
+def day_section(d: date, lines: int) -> str:
+    body = "".join(f"🔬 **연구**: 1h - 실험 노트 {d.isoformat()} #{i}\n" for i in range(lines))
+    return f"## {d.isoformat()} ({d.strftime('%A')})\n\n{body}\n"
+
+
+def week_text(monday: date, days: int, lines: int) -> str:
+    header = f"# Week {monday.isocalendar()[1]} - {monday.year}.{monday.month:02d}\n\n"
+    return header + "".join(day_section(monday + timedelta(days=i), lines) for i in range(days))
+
+
+def bench(label: str, fn, repeat: int) -> float:
+    best = min(timeit.repeat(fn, number=1, repeat=repeat))
+    print(f"{label:<42} {best * 1000:9.3f} ms")
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--lines-per-day", type=int, default=500)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    monday = date(2025, 12, 15)
+    n = args.lines_per_day
+    six_days = week_text(monday, 6, n)
+    full_week = week_text(monday, 7, n)
+    mid = monday + timedelta(days=3)
+    last = monday + timedelta(days=6)
+
+    # round-trip: 읽고 그대로 쓰면 같은 바이트
+    assert WeekFile(full_week.encode("utf-8")).to_bytes() == full_week.encode("utf-8")
+    # 결과가 이전 방식과 같은지
+    for text, d in ((full_week, mid), (six_days, last)):
+        expected = legacy_merge(text, d.isoformat(), day_section(d, n))
+        week = WeekFile(text.encode("utf-8"))
+        week.set(d.isoformat(), day_section(d, n))
+        assert week.to_bytes().decode("utf-8") == expected, d
+
+    print(f"week file: 7 days x {n} lines ({len(full_week.encode('utf-8')) / 1024:.0f} KiB)")
+    replace = day_section(mid, n)
+    append = day_section(last, n)
+    bench("legacy: replace middle day", lambda: legacy_merge(full_week, mid.isoformat(), replace), args.repeat)
+    bench("WeekFile: replace middle day", lambda: WeekFile(full_week.encode("utf-8")).set(mid.isoformat(), replace), args.repeat)
+    bench("legacy: append last day", lambda: legacy_merge(six_days, last.isoformat(), append), args.repeat)
+    bench("WeekFile: append last day", lambda: WeekFile(six_days.encode("utf-8")).set(last.isoformat(), append), args.repeat)
+
+    # 디스크: 전체 재작성 vs splice/append
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "week.md")
+
+        def reset(text):
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+
+        def legacy_disk(text, d, section):
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(legacy_merge(content, d.isoformat(), section))
+
+        def upsert_disk(d, section):
+            with WriteBatch() as batch:
+                upsert_section(path, d.isoformat(), section, "", batch)
+
+        for label, text, d, section in (("replace middle day", full_week, mid, replace),
+                                        ("append last day", six_days, last, append)):
+            bench(f"legacy disk: {label}",
+                  lambda: (reset(text), legacy_disk(text, d, section)), args.repeat)
+            bench(f"upsert_section disk: {label}",
+                  lambda: (reset(text), upsert_disk(d, section)), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
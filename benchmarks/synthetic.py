@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 합성 기록 생성기 (결정적: 같은 인자면 항상 같은 결과)
+
+여러 해 분량의 하루치 기록(parse_issue_body 결과와 같은 모양)을 만들고,
+그것으로 issue 본문, 통계 스냅샷(manifest + 연도 파티션), 주간 로그, 독서 로그를
+실제 스크립트가 쓰는 형식 그대로 만든다.
+
+    python benchmarks/synthetic.py /tmp/tree --years 10 --books 2000
+"""
+
+import argparse
+import os
+import random
+import sys
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+import parser  # noqa: E402
+import store  # noqa: E402
+from atomic import WriteBatch  # noqa: E402
+
+# 기록의 마지막 날 (end를 주지 않으면 이 날 전날까지)
+DEFAULT_END = date(2025, 1, 1)
+
+
+def day_records(years: int, books: int = 50, seed: int = 0, end: date = DEFAULT_END):
+    """years년 동안 하루도 빠짐없이 (datetime, data) 생성 - 가끔 쉬는 날, 30% 정도는 독서"""
+    rng = random.Random(seed)
+    first = date(end.year - years, end.month, end.day)
+    for i in range((end - first).days):
+        d = first + timedelta(days=i)
+        rest = rng.random() < 0.15
+        reading = rng.random() < 0.3
+        data = {
+            "fitness": {"time": 0 if rest else rng.choice((0, 30, 45, 60)), "note": ""},
+            "english": {"time": 0 if rest else rng.choice((0, 20, 30)), "note": ""},
+            "research": {"time": 0 if rest else rng.choice((0, 60, 120, 180)), "note": ""},
+            "reading": {"title": f"Book {rng.randrange(books)}" if reading else "",
+                        "note": f"ch.{i % 12}" if reading and rng.random() < 0.8 else ""},
+        }
+        if data["research"]["time"] and rng.random() < 0.5:
+            data["research"]["note"] = f"experiment {i}"
+        yield datetime(d.year, d.month, d.day, tzinfo=parser.KST), data
+
+
+def issue_body(when: datetime, data: dict) -> str:
+    """daily-log issue 템플릿 모양의 본문 (parse_issue_body로 다시 읽으면 data와 같음)"""
+    lines = [f"📅 {when.strftime('%Y-%m-%d')}", ""]
+    for emoji, habit in (("💪", "fitness"), ("🗣️", "english"), ("🔬", "research")):
+        entry = data[habit]
+        value = parser.format_time(entry["time"]) if entry["time"] else "."
+        lines.append(f"{emoji} {value}" + (f" - {entry['note']}" if entry["note"] else ""))
+    title, note = data["reading"]["title"], data["reading"]["note"]
+    lines.append(f"📚 {title or '.'}" + (f" - {note}" if title and note else ""))
+    lines += ["", "<!--", "⏰ 시간 형식: 1h, 30m, 1.5h", "-->", ""]
+    return "\n".join(lines)
+
+
+def synthetic_stats(years: int, books: int = 50, seed: int = 0, end: date = DEFAULT_END) -> dict:
+    """day_records를 모두 반영한 통계 (meta.seq = 일수)"""
+    events = []
+    for seq, (when, data) in enumerate(day_records(years, books, seed, end), 1):
+        event = store.make_event(when, data)
+        event["seq"] = seq
+        events.append(event)
+    return store.replay(store.new_stats(), events)
+
+
+def write_tree(root: str, years: int, books: int = 50, seed: int = 0, end: date = DEFAULT_END) -> dict:
+    """
+    root 아래에 저장소와 같은 배치로 통계 스냅샷, 주간 로그, 독서 로그를 쓰고
+    통계를 반환. 파일마다 한 번씩만 쓰므로 수십 년 분량도 금방 만든다.
+    """
+    records = list(day_records(years, books, seed, end))
+    stats = synthetic_stats(years, books, seed, end)
+
+    weeks = {}
+    book_notes = {}
+    for when, data in records:
+        section = parser.render_day_section(when, data)
+        if section is not None:
+            path = parser.week_file_path(when)
+            weeks.setdefault(path, [parser.week_file_header(when)]).append(section)
+        title = data["reading"]["title"]
+        if title:
+            path = parser.book_file_path(title)
+            notes = book_notes.setdefault(path, [parser.book_file_header(title)])
+            if data["reading"]["note"]:
+                notes.append(parser.render_book_note(when, data))
+
+    cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        with WriteBatch(fsync=False) as batch:
+            store.save_snapshot(stats, batch)
+            for path, parts in list(weeks.items()) + list(book_notes.items()):
+                batch.write(path, "".join(parts))
+    finally:
+        os.chdir(cwd)
+    return stats
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("root", help="directory to write logs/ and books/ into")
+    arg_parser.add_argument("--years", type=int, default=10)
+    arg_parser.add_argument("--books", type=int, default=50, help="distinct book titles")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args()
+
+    stats = write_tree(args.root, args.years, args.books, args.seed)
+    print(f"✅ {len(stats['daily'])} days, {len(stats['books'])} books → {args.root}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원자적(crash-safe) 파일 쓰기
+
+WriteBatch에 쓰기를 모아 두었다가 commit()에서 스테이징 순서대로 반영한다.
+- write(): 같은 디렉토리의 임시 파일에 먼저 기록하고, commit 때 fsync 후 os.replace로 교체
+- append(): commit 때 파일 끝에 추가하고 fsync
+- 디렉토리는 commit마다 한 번씩만 fsync
+
+원자성은 파일 단위다: 중간에 프로세스가 죽어도 각 대상 파일은 이전 내용이거나 새 내용이고,
+잘린 파일(예: 반쯤 쓰인 stats.json)은 남지 않는다. 하지만 batch 전체가 한 번에
+반영되지는 않으므로 commit 도중에 죽으면 앞쪽 파일만 새 내용일 수 있다.
+그래서 호출하는 쪽이 순서를 정한다:
+- 통계 스냅샷은 연도 파티션을 먼저, manifest(stats.json)를 마지막에 쓴다.
+  manifest가 예전 것이면 meta.seq 뒤의 로그 꼬리를 다시 재생하는데, 이벤트 반영은
+  같은 날짜를 덮어쓰는 것이라 파티션에 이미 들어간 이벤트를 다시 적용해도 daily는 같다
+  (그 사이 어긋날 수 있는 연간 rollup은 fsck --repair가 daily에서 다시 만든다)
+- compact는 스냅샷을 먼저 쓰고 로그를 나중에 비우므로 이벤트가 두 번 반영되지 않는다
+- parse cache는 batch 마지막에 쓰므로 그 전에 죽으면 다음 실행이 같은 issue를 다시 반영한다.
+  주간 로그는 날짜 섹션을 통째로 바꾸므로 같은 내용이 되지만, 독서 로그의 메모는 한 번 더 붙을 수 있다
+
+file_lock()은 같은 머신에서 동시에 실행된 프로세스들이 read-modify-write를
+차례로 하도록 하는 배타적 잠금(fcntl.flock)이다.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from itertools import count
+
+from instrument import traced
+
+try:
+    import fcntl
+except ImportError:  # fcntl이 없는 플랫폼 (Windows): 잠금 없이 진행
+    fcntl = None
+
+
+def _fsync_dir(path: str) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:  # 디렉토리 fsync를 지원하지 않는 플랫폼
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+_temp_ids = count()
+
+
+def _create_temp(path: str) -> tuple:
+    """path와 같은 디렉토리에 임시 파일 생성 (tempfile 모듈 import 비용 없이), (fd, 경로) 반환"""
+    directory, name = os.path.split(path)
+    while True:
+        tmp = os.path.join(directory, f".{name}.{os.getpid()}.{next(_temp_ids)}.tmp")
+        try:
+            return os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), tmp
+        except FileExistsError:  # 예전에 중단된 실행이 남긴 파일
+            continue
+
+
+def _file_mode(path: str) -> int:
+    """교체할 파일의 권한 (새 파일이면 open()과 같은 0o666 & ~umask)"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _encode(data) -> bytes:
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+class WriteBatch:
+    """여러 파일 쓰기를 모아서 commit (파일마다 원자적, batch 전체는 아님 - 모듈 설명 참고)"""
+
+    def __init__(self, fsync: bool = True):
+        self.fsync = fsync
+        self._ops = []  # ("replace", path, tmp), ("append", path, data), ("remove", path, None) - 스테이징 순서대로
+        self._staged = {}  # path -> tmp (같은 파일을 다시 쓰면 앞의 임시 파일을 버림)
+
+    def __enter__(self) -> "WriteBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def write(self, path: str, data) -> None:
+        """path 전체를 data로 교체하도록 스테이징 (str은 UTF-8로 기록)"""
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = _create_temp(path)
+        with os.fdopen(fd, "wb") as f:
+            f.write(_encode(data))
+        # 임시 파일은 0600으로 만들었으므로 원래 파일 권한을 유지
+        os.chmod(tmp, _file_mode(path))
+
+        old = self._staged.pop(path, None)
+        if old is not None:
+            self._ops = [op for op in self._ops if op[2] != old]
+            os.unlink(old)
+        self._staged[path] = tmp
+        self._ops.append(("replace", path, tmp))
+
+    def append(self, path: str, data) -> None:
+        """commit 때 path 끝에 data를 추가하도록 스테이징"""
+        self._ops.append(("append", path, _encode(data)))
+
+    def remove(self, path: str) -> None:
+        """commit 때 path를 지우도록 스테이징 (없으면 무시)"""
+        self._ops.append(("remove", path, None))
+
+    @traced
+    def commit(self) -> None:
+        """임시 파일 fsync → rename, append → fsync, remove, 마지막에 디렉토리 fsync"""
+        directories = set()
+        for kind, path, payload in self._ops:
+            directory = os.path.dirname(path) or "."
+            if kind == "replace":
+                if self.fsync:
+                    fd = os.open(payload, os.O_RDONLY)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                os.replace(payload, path)
+                directories.add(directory)
+            elif kind == "remove":
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                directories.add(directory)
+            else:
+                os.makedirs(directory, exist_ok=True)
+                existed = os.path.exists(path)
+                with open(path, "ab") as f:
+                    f.write(payload)
+                    f.flush()
+                    if self.fsync:
+                        os.fsync(f.fileno())
+                if not existed:
+                    directories.add(directory)
+        if self.fsync:
+            for directory in sorted(directories):
+                _fsync_dir(directory)
+        self._ops = []
+        self._staged = {}
+
+    def abort(self) -> None:
+        """스테이징한 임시 파일 삭제 (대상 파일은 그대로)"""
+        for tmp in self._staged.values():
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+        self._ops = []
+        self._staged = {}
+
+
+def write_file(path: str, data, fsync: bool = True) -> None:
+    """파일 하나를 원자적으로 교체"""
+    with WriteBatch(fsync=fsync) as batch:
+        batch.write(path, data)
+
+
+_held_locks = {}  # 절대 경로 -> 이 프로세스 안에서 겹쳐 잡은 횟수
+
+
+@contextmanager
+def file_lock(path: str, timeout: float = 60.0, poll: float = 0.05):
+    """
+    path에 배타적 잠금을 잡고 실행, timeout초 안에 못 잡으면 TimeoutError.
+    같은 프로세스 안에서 다시 잡으면(예: 파이프라인이 잡은 채로 parser 호출) 그대로 통과
+    """
+    key = os.path.abspath(path)
+    if _held_locks.get(key):
+        _held_locks[key] += 1
+        try:
+            yield
+        finally:
+            _held_locks[key] -= 1
+        return
+
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    with open(path, "a") as f:
+        if fcntl is not None:
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(f"could not lock {path} within {timeout:.0f}s")
+                    time.sleep(poll)
+        _held_locks[key] = 1
+        try:
+            yield
+        finally:
+            _held_locks[key] = 0
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+stats['daily']의 컬럼형(columnar) 표현
+
+'YYYY-MM-DD' 문자열 키의 dict of dicts 대신
+- start: 첫 기록일의 ordinal (date.toordinal())
+- 습관별 분(minutes) 배열: array('H') 또는 NumPy uint16 (설치되어 있으면)
+- 독서 여부 배열: array('B')
+- 기록 여부 배열: array('B') (쉬는 날로 기록한 날과 기록이 없는 날 구분)
+로 하루를 몇 바이트에 담는다. 인덱스 i는 start + i 날짜에 해당하며
+기록이 없는 날은 0으로 채운다 (dense). 구간 합계, 활동일수, 스트릭은
+슬라이스/벡터 연산으로 계산한다.
+
+날짜 → 인덱스는 ordinal 뺄셈이고 구간 질의는 누적합(prefix sum) 차이이므로
+임의의 [start, end] 구간(최근 30/90/365일, 분기, 학기 등)이 O(1)이다.
+"""
+
+from array import array
+from datetime import date
+
+from store import HABITS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy는 선택 사항
+    np = None
+
+# array('H') 한 칸의 최대값 (하루 약 1092시간)
+MAX_MINUTES = 0xFFFF
+
+
+def _minutes(value) -> int:
+    try:
+        return max(0, min(MAX_MINUTES, int(value or 0)))
+    except (TypeError, ValueError):
+        return 0
+
+
+class DailyColumns:
+    """날짜 ordinal 인덱스 + 습관별 분 배열"""
+
+    def __init__(self, start: int, minutes: dict, reading: array, present: array = None):
+        self.start = start
+        self.minutes = minutes
+        self.reading = reading
+        self.present = present if present is not None else array("B", bytes(len(reading)))
+        self._prefix = None
+
+    def __len__(self) -> int:
+        return len(self.reading)
+
+    @property
+    def end(self) -> int:
+        """마지막 기록일 ordinal (비어 있으면 start - 1)"""
+        return self.start + len(self) - 1
+
+    @classmethod
+    def empty(cls) -> "DailyColumns":
+        return cls(0, {k: _new_column(0) for k in HABITS}, array("B"), array("B"))
+
+    @classmethod
+    def from_daily(cls, daily: dict) -> "DailyColumns":
+        """stats['daily']를 한 번 훑어 컬럼으로 변환 (날짜 키는 한 번씩만 파싱)"""
+        rows = []
+        for date_str, day_data in daily.items():
+            if not isinstance(day_data, dict):
+                continue
+            try:
+                o = date.fromisoformat(date_str).toordinal()
+            except (TypeError, ValueError):
+                continue
+            rows.append((o, day_data))
+        if not rows:
+            return cls.empty()
+
+        start = min(o for o, _ in rows)
+        n = max(o for o, _ in rows) - start + 1
+        cols = {k: array("H", bytes(2 * n)) for k in HABITS}
+        reading = array("B", bytes(n))
+        present = array("B", bytes(n))
+        for o, day_data in rows:
+            i = o - start
+            for k in HABITS:
+                cols[k][i] = _minutes(day_data.get(k))
+            reading[i] = 1 if day_data.get("reading") else 0
+            present[i] = 1
+
+        if np is not None:
+            cols = {k: np.frombuffer(cols[k], dtype=np.uint16) for k in HABITS}
+        return cls(start, cols, reading, present)
+
+    @classmethod
+    def concat(cls, parts: list) -> "DailyColumns":
+        """겹치지 않는 구간들(연도 파티션)을 날짜순으로 이어 붙임 (사이의 빈 날은 0)"""
+        parts = sorted((p for p in parts if len(p)), key=lambda p: p.start)
+        if not parts:
+            return cls.empty()
+        if len(parts) == 1:
+            return parts[0]
+        start = parts[0].start
+
+        def join(typecode, column):
+            out = array(typecode)
+            for p in parts:
+                out.frombytes(bytes(out.itemsize * (p.start - start - len(out))))
+                out.frombytes(memoryview(column(p)).tobytes())
+            return out
+
+        minutes = {k: join("H", lambda p, k=k: p.minutes[k]) for k in HABITS}
+        if np is not None:
+            minutes = {k: np.frombuffer(col, dtype=np.uint16) for k, col in minutes.items()}
+        return cls(start, minutes, join("B", lambda p: p.reading), join("B", lambda p: p.present))
+
+    # -----------------------------
+    # Lookups
+    # -----------------------------
+    def _slice(self, first: int, last: int) -> tuple:
+        """[first, last] ordinal 구간을 배열 인덱스 [a, b)로 (범위 밖은 잘라냄)"""
+        n = len(self)
+        a = min(n, max(0, first - self.start))
+        b = min(n, max(0, last - self.start + 1))
+        return a, max(a, b)
+
+    def day(self, ordinal: int) -> dict:
+        """하루치 기록 (daily 항목과 같은 모양, 범위 밖이면 0)"""
+        i = ordinal - self.start
+        if not 0 <= i < len(self):
+            return {k: 0 for k in HABITS} | {"reading": False}
+        return {k: int(self.minutes[k][i]) for k in HABITS} | {"reading": bool(self.reading[i])}
+
+    def set_day(self, ordinal: int, day_data: dict) -> None:
+        """하루치 기록 쓰기 (범위 밖이면 배열을 앞/뒤로 늘림)"""
+        if len(self) == 0:
+            self.start = ordinal
+        if ordinal < self.start:
+            self._grow(self.start - ordinal, 0)
+            self.start = ordinal
+        elif ordinal > self.end:
+            self._grow(0, ordinal - self.end)
+        i = ordinal - self.start
+        for k in HABITS:
+            self.minutes[k][i] = _minutes(day_data.get(k))
+        self.reading[i] = 1 if day_data.get("reading") else 0
+        self.present[i] = 1
+        self._prefix = None
+
+    def _grow(self, front: int, back: int) -> None:
+        self.minutes = {k: _pad(self.minutes[k], "H", front, back) for k in HABITS}
+        if np is not None:
+            self.minutes = {k: np.frombuffer(col, dtype=np.uint16) for k, col in self.minutes.items()}
+        self.reading = _pad(self.reading, "B", front, back)
+        self.present = _pad(self.present, "B", front, back)
+
+    def _prefix_sums(self) -> dict:
+        """
+        누적합 (처음 구간 질의 때 한 번만 O(n)으로 생성):
+        P[k][i] = 0..i-1일의 합이므로 [a, b) 구간은 P[k][b] - P[k][a]로 O(1)
+        """
+        if self._prefix is not None:
+            return self._prefix
+        mask = self.active_mask()
+        prefix = {}
+        if np is not None:
+            zero = np.zeros(1, dtype=np.int64)
+            for k in HABITS:
+                col = self.minutes[k]
+                prefix[k] = np.concatenate((zero, np.cumsum(col, dtype=np.int64)))
+                prefix["active:" + k] = np.concatenate((zero, np.cumsum(col > 0, dtype=np.int64)))
+            prefix["days"] = np.concatenate((zero, np.cumsum(mask, dtype=np.int64)))
+        else:
+            for k in HABITS:
+                col = self.minutes[k]
+                prefix[k] = _cumsum(col)
+                prefix["active:" + k] = _cumsum(1 if v else 0 for v in col)
+            prefix["days"] = _cumsum(mask)
+        self._prefix = prefix
+        return prefix
+
+    def _range(self, key: str, first: int, last: int) -> int:
+        a, b = self._slice(first, last)
+        p = self._prefix_sums()[key]
+        return int(p[b] - p[a])
+
+    def window_sum(self, habit: str, first: int, last: int) -> int:
+        """[first, last] 구간의 습관별 분 합계 (O(1))"""
+        return self._range(habit, first, last)
+
+    def window_active(self, habit: str, first: int, last: int) -> int:
+        """[first, last] 구간에서 해당 습관을 한 날 수 (O(1))"""
+        return self._range("active:" + habit, first, last)
+
+    def window(self, first: int, last: int) -> dict:
+        """[first, last] 구간 집계 - store.new_rollup()과 같은 모양"""
+        result = {k: self.window_sum(k, first, last) for k in HABITS}
+        result["days"] = self._range("days", first, last)
+        result["active"] = {k: self.window_active(k, first, last) for k in HABITS}
+        return result
+
+    def day_totals(self, first: int, last: int):
+        """
+        [first, last] 구간의 날짜별 습관 합계(분) - 길이 last - first + 1의 dense 배열,
+        기록 범위 밖은 0. NumPy면 uint32 배열, 아니면 array('I')
+        """
+        n = max(0, last - first + 1)
+        a, b = self._slice(first, last)
+        offset = self.start + a - first
+        if np is not None:
+            out = np.zeros(n, dtype=np.uint32)
+            for k in HABITS:
+                out[offset:offset + b - a] += self.minutes[k][a:b]
+            return out
+        out = array("I", bytes(4 * n))
+        if b > a:
+            f, e, r = (self.minutes[k][a:b] for k in HABITS)
+            out[offset:offset + b - a] = array("I", map(lambda x, y, z: x + y + z, f, e, r))
+        return out
+
+    def active_mask(self):
+        """하루라도 어떤 습관을 한 날이면 1인 배열"""
+        if np is not None:
+            mask = np.zeros(len(self), dtype=bool)
+            for k in HABITS:
+                mask |= self.minutes[k] > 0
+            return mask
+        f, e, r = (self.minutes[k] for k in HABITS)
+        return array("B", map(lambda x, y, z: 1 if (x or y or z) else 0, f, e, r))
+
+    def streaks(self) -> dict:
+        """
+        달력상 연속 활동일 기준 스트릭:
+        - best: 가장 긴 연속 구간
+        - current: 마지막 기록일에서 끝나는 연속 구간 (마지막 기록일이 쉬는 날이면 0)
+        """
+        if len(self) == 0:
+            return {"current": 0, "best": 0}
+        mask = self.active_mask()
+        if np is not None:
+            padded = np.concatenate(([0], mask.astype(np.int8), [0]))
+            edges = np.flatnonzero(np.diff(padded))
+            starts, ends = edges[0::2], edges[1::2]
+            if len(starts) == 0:
+                return {"current": 0, "best": 0}
+            lengths = ends - starts
+            current = int(lengths[-1]) if ends[-1] == len(self) else 0
+            return {"current": current, "best": int(lengths.max())}
+
+        best = 0
+        run = 0
+        for v in mask:
+            run = run + 1 if v else 0
+            if run > best:
+                best = run
+        return {"current": run, "best": best}
+
+
+def _new_column(n: int):
+    if np is not None:
+        return np.zeros(n, dtype=np.uint16)
+    return array("H", bytes(2 * n))
+
+
+def _pad(col, typecode: str, front: int, back: int) -> array:
+    """컬럼(array, NumPy 배열, memoryview 모두 가능)을 앞뒤로 0을 채운 새 array로"""
+    out = array(typecode, bytes(array(typecode).itemsize * front))
+    out.frombytes(memoryview(col).tobytes())
+    out.frombytes(bytes(out.itemsize * back))
+    return out
+
+
+def _cumsum(values) -> array:
+    out = array("q", [0])
+    total = 0
+    for v in values:
+        total += v
+        out.append(total)
+    return out
@@ -1,12 +1,40 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import os
+import hashlib
 import json
-from datetime import datetime, timedelta
-import pytz
+import os
+import re
+from collections import namedtuple
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+
+import columns
+import heatmap
+import instrument
+import packed
+import store
+from atomic import WriteBatch
+from columns import DailyColumns
+from instrument import traced
+from store import HABITS
+
+# 한국은 서머타임이 없으므로 고정 UTC+9 (pytz/tzdata 없이)
+KST = timezone(timedelta(hours=9), "KST")
+
+README_FILE = "README.md"
 
-KST = pytz.timezone("Asia/Seoul")
+# 마지막으로 렌더링한 입력의 지문 (같으면 렌더링 생략)
+FINGERPRINT_FILE = "logs/.dashboard-fingerprint"
+
+# 섹션별 입력 해시와 출력 해시 (입력이 같은 섹션은 다시 렌더링하지 않음)
+SECTIONS_FILE = "logs/.dashboard-sections.json"
+
+# 롤링 구간 섹션 (DASHBOARD_WINDOWS 환경 변수로 변경, 빈 값이면 섹션 생략)
+DEFAULT_WINDOWS = "30d,90d,365d"
+
+# 활동 히트맵 섹션 (DASHBOARD_HEATMAP 환경 변수: year=올해, all=모든 해, 빈 값이면 섹션 생략)
+DEFAULT_HEATMAP = "year"
 
 
 # -----------------------------
@@ -44,21 +72,6 @@ def ordinal_suffix(n: int) -> str:
     return f"{n}{suffix}"
 
 
-def get_habit_week_number(stats: dict) -> int:
-    """습관 시작 후 몇 주차인지 계산"""
-    daily = stats.get("daily", {})
-    if not daily:
-        return 1
-
-    first_date_str = min(daily.keys())
-    first_date = datetime.strptime(first_date_str, "%Y-%m-%d")
-    first_date = KST.localize(first_date)
-
-    now = datetime.now(KST)
-    days_diff = (now - first_date).days
-    return (days_diff // 7) + 1
-
-
 def progress_bar(count: int, target: int, width: int = 5) -> str:
     """고정폭 진행바 생성"""
     if target <= 0:
@@ -81,245 +94,153 @@ def safe_daily(stats: dict) -> dict:
     return daily if isinstance(daily, dict) else {}
 
 
-def has_any_activity(day_data: dict) -> bool:
-    return any(
-        [
-            day_data.get("fitness", 0) > 0,
-            day_data.get("english", 0) > 0,
-            day_data.get("research", 0) > 0,
-        ]
-    )
-
-
-def compute_week_stats(daily: dict, now: datetime) -> dict:
-    """이번 주(ISO week) 카운트/시간 계산"""
-    w = get_week_number(now)
-    y = now.year
-
-    counts = {"fitness": 0, "english": 0, "research": 0}
-    times = {"fitness": 0, "english": 0, "research": 0}
-
-    for date_str, day_data in daily.items():
-        if not date_str.startswith(f"{y}-"):
-            continue
-        try:
-            d = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            continue
-        if get_week_number(d) != w:
-            continue
-
-        for k in ["fitness", "english", "research"]:
-            minutes = int(day_data.get(k, 0) or 0)
-            if minutes > 0:
-                counts[k] += 1
-                times[k] += minutes
+def compute_week_stats(stats: dict, now: datetime) -> dict:
+    """이번 주(ISO week) 카운트/시간 - weekly rollup에서 O(1)로 읽음"""
+    rollup = store.get_rollup(stats, "weekly", store.week_key(now))
 
+    counts = {k: rollup["active"][k] for k in HABITS}
+    times = {k: rollup[k] for k in HABITS}
     total_time = times["fitness"] + times["english"] + times["research"]
     return {"counts": counts, "times": times, "total_time": total_time}
 
 
-def compute_month_stats(daily: dict, now: datetime) -> dict:
-    """이번 달 시간/일수 계산"""
-    prefix = f"{now.year}-{now.month:02d}"
-    times = {"fitness": 0, "english": 0, "research": 0}
-    days = {"fitness": 0, "english": 0, "research": 0}
-
-    for date_str, day_data in daily.items():
-        if not date_str.startswith(prefix):
-            continue
-        for k in ["fitness", "english", "research"]:
-            minutes = int(day_data.get(k, 0) or 0)
-            if minutes > 0:
-                times[k] += minutes
-                days[k] += 1
+def compute_month_stats(stats: dict, now: datetime) -> dict:
+    """이번 달 시간/일수 - monthly rollup에서 O(1)로 읽음"""
+    rollup = store.get_rollup(stats, "monthly", store.month_key(now))
 
+    times = {k: rollup[k] for k in HABITS}
+    days = {k: rollup["active"][k] for k in HABITS}
     return {"times": times, "days": days}
 
 
-def compute_year_stats(daily: dict, now: datetime) -> dict:
-    """올해 시간/활동일수 계산"""
-    prefix = f"{now.year}-"
-    times = {"fitness": 0, "english": 0, "research": 0}
-    active_days = set()
+def compute_year_stats(stats: dict, now: datetime) -> dict:
+    """올해 시간/활동일수 - yearly rollup에서 O(1)로 읽음"""
+    rollup = store.get_rollup(stats, "yearly", store.year_key(now))
 
-    for date_str, day_data in daily.items():
-        if not date_str.startswith(prefix):
-            continue
-        for k in ["fitness", "english", "research"]:
-            times[k] += int(day_data.get(k, 0) or 0)
-        if has_any_activity(day_data):
-            active_days.add(date_str)
+    times = {k: rollup[k] for k in HABITS}
+    return {"times": times, "active_days": rollup["days"]}
 
-    return {"times": times, "active_days": active_days}
 
+def day_icons(day_data: dict) -> str:
+    """하루치 기록을 이모지 라인으로 변환"""
+    icons = []
+    if int(day_data.get("fitness", 0) or 0) > 0:
+        icons.append("💪")
+    if int(day_data.get("english", 0) or 0) > 0:
+        icons.append("🗣️")
+    if int(day_data.get("research", 0) or 0) > 0:
+        icons.append("🔬")
+    if day_data.get("reading"):
+        icons.append("📚")
+    return " ".join(icons) if icons else "⬜"
 
-def compute_streak(daily: dict) -> dict:
-    """
-    스트릭 계산:
-    - 'daily'에 기록된 날짜 기준으로 연속 활동일수
-    - 마지막 날짜가 활동이면 current_streak 반영
-    """
-    if not daily:
-        return {"current": 0, "best": 0}
 
-    sorted_dates = sorted(daily.keys())
-    best = 0
-    temp = 0
-    current = 0
+# 대시보드 렌더링에 필요한 집계 결과 (dataclasses는 inspect까지 끌어와 import가 느려서 namedtuple)
+Aggregates = namedtuple("Aggregates", "habit_week_no streak week month year recent_7 windows")
 
-    for i, date_str in enumerate(sorted_dates):
-        day_data = daily.get(date_str, {})
-        active = has_any_activity(day_data)
-
-        if active:
-            temp += 1
-            best = max(best, temp)
-        else:
-            temp = 0
-
-        if i == len(sorted_dates) - 1 and active:
-            current = temp
-
-    return {"current": current, "best": best}
 
+def parse_windows(spec: str, now: datetime) -> list:
+    """
+    롤링 구간 설정을 (label, 시작 ordinal, 끝 ordinal) 목록으로 변환
+    - "30d": 오늘 포함 최근 30일
+    - "quarter": 이번 분기, "half": 이번 반기(학기)
+    알 수 없는 항목은 무시
+    """
+    today = now.toordinal()
+    windows = []
+    for token in (spec or "").split(","):
+        token = token.strip().lower()
+        if token.endswith("d") and token[:-1].isdigit() and int(token[:-1]) > 0:
+            n = int(token[:-1])
+            windows.append((f"Last {n} days", today - n + 1, today))
+        elif token == "quarter":
+            q = (now.month - 1) // 3
+            first = date(now.year, 3 * q + 1, 1).toordinal()
+            windows.append((f"Q{q + 1} {now.year}", first, today))
+        elif token == "half":
+            h = (now.month - 1) // 6
+            first = date(now.year, 6 * h + 1, 1).toordinal()
+            windows.append((f"H{h + 1} {now.year}", first, today))
+    return windows
+
+
+@traced
+def aggregate(stats: dict, now: datetime, windows: str = DEFAULT_WINDOWS,
+              cols: DailyColumns = None) -> Aggregates:
+    """
+    대시보드 집계 - daily 전체를 훑지 않는다:
+    - 이번 주/달/해는 이벤트마다 증분으로 갱신되는 weekly/monthly/yearly rollup에서 O(1)로 읽음
+    - 스트릭은 증분으로 관리되는 stats['streak'], 첫 기록일은 manifest의 meta.first_date
+    - 최근 7일과 롤링 구간만 일별 컬럼(cols, 없으면 로드된 'daily'에서 한 번 변환)에서
+      하루 조회와 누적합 차이로 구간당 O(1)
+    """
+    if cols is None:
+        cols = DailyColumns.from_daily(safe_daily(stats))
+    today = now.toordinal()
 
-def compute_recent_7days(daily: dict, now: datetime) -> list:
-    """최근 7일 활동 이모지 라인 생성"""
-    rows = []
+    recent_7 = []
     for i in range(6, -1, -1):
         d = now - timedelta(days=i)
-        date_str = d.strftime("%Y-%m-%d")
-        dd = daily.get(date_str, {}) or {}
-
-        icons = []
-        if int(dd.get("fitness", 0) or 0) > 0:
-            icons.append("💪")
-        if int(dd.get("english", 0) or 0) > 0:
-            icons.append("🗣️")
-        if int(dd.get("research", 0) or 0) > 0:
-            icons.append("🔬")
-        if dd.get("reading"):
-            icons.append("📚")
-
-        rows.append(
-            {
-                "md": d.strftime("%m/%d"),
-                "icons": " ".join(icons) if icons else "⬜",
-            }
-        )
-    return rows
+        recent_7.append({"md": d.strftime("%m/%d"), "icons": day_icons(cols.day(today - i))})
+
+    # 첫 기록일은 manifest에 있으므로 예전 해의 파티션을 읽지 않아도 됨
+    first_date = stats.get("meta", {}).get("first_date")
+    return Aggregates(
+        habit_week_no=1 if first_date is None else (today - date.fromisoformat(first_date).toordinal()) // 7 + 1,
+        streak=store.streak_summary(stats),
+        week=compute_week_stats(stats, now),
+        month=compute_month_stats(stats, now),
+        year=compute_year_stats(stats, now),
+        recent_7=recent_7,
+        windows=[{"label": label, **cols.window(first, last)} for label, first, last in parse_windows(windows, now)],
+    )
 
 
-def get_recent_books(stats: dict, n: int = 3) -> list:
-    books = stats.get("books", [])
-    if not isinstance(books, list):
+def heatmap_years(mode: str, cols: DailyColumns, now: datetime) -> list:
+    """히트맵을 그릴 연도 (오래된 해부터)"""
+    mode = (mode or "").strip().lower()
+    if mode in ("", "off", "none"):
         return []
-    valid = [b for b in books if isinstance(b, dict) and b.get("title")]
-    return sorted(valid, key=lambda x: x.get("last_read", ""), reverse=True)[:n]
-
-
-# -----------------------------
-# README generation
-# -----------------------------
-def generate_dashboard() -> str:
-    """README 대시보드 생성"""
-
-    stats_file = "logs/stats.json"
-    if not os.path.exists(stats_file):
-        return generate_initial_readme()
+    if mode == "all":
+        return heatmap.all_years(cols, now.toordinal())
+    return [now.year]
 
-    with open(stats_file, "r", encoding="utf-8") as f:
-        stats = json.load(f)
-
-    now = datetime.now(KST)
-    daily = safe_daily(stats)
-
-    # Targets (weekly)
-    weekly_targets = {"fitness": 3, "english": 4, "research": 5}
-
-    # Compute stats
-    habit_week_no = get_habit_week_number(stats)
-    habit_week_text = ordinal_suffix(habit_week_no)
-
-    streak = compute_streak(daily)
-    year_stats = compute_year_stats(daily, now)
-    month_stats = compute_month_stats(daily, now)
-    week_stats = compute_week_stats(daily, now)
-    recent_7 = compute_recent_7days(daily, now)
-    recent_books = get_recent_books(stats, n=3)
-
-    # Weekly rates
-    wc = week_stats["counts"]
-    wt = week_stats["times"]
-    total_week_time = week_stats["total_time"]
-
-    fitness_rate = get_achievement_rate(wc["fitness"], weekly_targets["fitness"])
-    english_rate = get_achievement_rate(wc["english"], weekly_targets["english"])
-    research_rate = get_achievement_rate(wc["research"], weekly_targets["research"])
-
-    # Build sections (keep lines short to avoid horizontal scrolling)
-    hero_line = clamp(
-        f"🔥 **Streak**: **{streak['current']} days**  •  🏆 **Best**: **{streak['best']} days**  •  📅 **Total Active**: **{len(year_stats['active_days'])} days**",
-        120,
-    )
-
-    week_table = f"""### 📅 This Week · {habit_week_text} Week
-
-| Habit | Progress | Goal | Status |
-|---|---:|---:|---:|
-| 💪 Fitness | {progress_bar(wc["fitness"], weekly_targets["fitness"])} | {wc["fitness"]} / {weekly_targets["fitness"]} | {fitness_rate}% |
-| 🗣️ English | {progress_bar(wc["english"], weekly_targets["english"])} | {wc["english"]} / {weekly_targets["english"]} | {english_rate}% |
-| 🔬 Research | {progress_bar(wc["research"], weekly_targets["research"])} | {wc["research"]} / {weekly_targets["research"]} | {research_rate}% |
 
-**⏱ Total:** **{format_time(total_week_time)}** active this week
-"""
+def needed_years(now: datetime, windows: str = DEFAULT_WINDOWS) -> list:
+    """렌더링에 필요한 연도 파티션: 올해, 최근 7일과 이번 주(월~일, 해를 걸칠 수 있음), 롤링 구간"""
+    today = now.toordinal()
+    monday = today - now.weekday()
+    firsts = [today - 6, monday, date(now.year, 1, 1).toordinal()]
+    firsts += [first for _, first, _ in parse_windows(windows, now)]
+    last_year = date.fromordinal(monday + 6).year
+    return [str(y) for y in range(date.fromordinal(min(firsts)).year, last_year + 1)]
 
-    month_t = month_stats["times"]
-    month_d = month_stats["days"]
-    month_section = f"""### 📈 This Month ({now.month}월)
 
-| 💪 Fitness | 🗣️ English | 🔬 Research |
-|:--:|:--:|:--:|
-| **{format_time(month_t["fitness"])}** | **{format_time(month_t["english"])}** | **{format_time(month_t["research"])}** |
-| {month_d["fitness"]} day(s) | {month_d["english"]} day(s) | {month_d["research"]} day(s) |
-"""
+@traced
+def load_stats(years: list = None) -> tuple:
+    """
+    (stats, 일별 컬럼) - years(None이면 전부)의 연도 파티션만.
+    압축 사본(.bin)이 맞으면 mmap, 아니면 JSON
+    """
+    loaded = packed.load(years=years)
+    if loaded is not None:
+        return loaded
+    stats = store.load_stats(years=years)
+    return stats, DailyColumns.from_daily(safe_daily(stats))
 
-    year_t = year_stats["times"]
-    year_section = f"""### 🏆 {now.year} Overview
 
-<div align="center">
+# -----------------------------
+# README sections
+# -----------------------------
+# 주간 목표 횟수
+WEEKLY_TARGETS = {"fitness": 3, "english": 4, "research": 5}
 
-| Active Days | 💪 Fitness | 🗣️ English | 🔬 Research |
-|---:|---:|---:|---:|
-| **{len(year_stats["active_days"])}** | {format_time(year_t["fitness"])} | {format_time(year_t["english"])} | **{format_time(year_t["research"])}** |
+# 섹션 사이 구분선
+DIVIDER = "<br/>\n\n---\n\n<br/>\n\n"
 
-</div>
-"""
 
-    last7_lines = []
-    for r in recent_7:
-        last7_lines.append(f"`{r['md']}`  {r['icons']}")
-    last7_block = "\n".join(last7_lines)
-
-    books_section = ""
-    if recent_books:
-        books_section = "### 📚 Reading\n\n"
-        for b in recent_books:
-            title = b.get("title", "").strip()
-            last_read = b.get("last_read", "").strip()
-            notes = b.get("notes")
-            if last_read:
-                books_section += f"- **{title}** _(last: {last_read})_\n"
-            else:
-                books_section += f"- **{title}**\n"
-            if notes:
-                # notes가 길어질 수 있으니 한 줄로만
-                books_section += f"  - {clamp(str(notes).strip(), 120)}\n"
-        books_section += "\n"
-
-    # Final README
-    readme = f"""<div align="center">
+def render_header(d: dict) -> str:
+    return """<div align="center">
 
 # 🎯 Daily Momentum
 
@@ -331,39 +252,46 @@ def generate_dashboard() -> str:
 
 ## 📊 Progress Dashboard
 
-<div align="center">
+"""
+
+
+def render_hero(d: dict) -> str:
+    streak, year = d["streak"], d["year"]
+    return f"""<div align="center">
 
 🔥 **Streak:** **{streak['current']} days** &nbsp; • &nbsp;
 🏆 **Best:** **{streak['best']} days** &nbsp; • &nbsp;
-📅 **Total Active:** **{len(year_stats['active_days'])} days**
+📅 **Total Active:** **{year['active_days']} days**
 
 </div>
 
-<br/>
-
----
+""" + DIVIDER
 
-<br/>
 
-### 📅 This Week · {habit_week_text} Week
+def render_week(d: dict) -> str:
+    week = d["week"]
+    wc = week["counts"]
+    rows = "\n".join(
+        f"| {label} | {progress_bar(wc[k], WEEKLY_TARGETS[k])} | {wc[k]} / {WEEKLY_TARGETS[k]} | {get_achievement_rate(wc[k], WEEKLY_TARGETS[k])}% |"
+        for k, label in (("fitness", "💪 Fitness"), ("english", "🗣️ English"), ("research", "🔬 Research"))
+    )
+    return f"""### 📅 This Week · {ordinal_suffix(week['no'])} Week
 
 *Focus on consistency. Progress resets every Monday.*
 
 | Habit | Progress | Goal | Completion |
 |---|---:|---:|---:|
-| 💪 Fitness | {progress_bar(wc["fitness"], weekly_targets["fitness"])} | {wc["fitness"]} / {weekly_targets["fitness"]} | {fitness_rate}% |
-| 🗣️ English | {progress_bar(wc["english"], weekly_targets["english"])} | {wc["english"]} / {weekly_targets["english"]} | {english_rate}% |
-| 🔬 Research | {progress_bar(wc["research"], weekly_targets["research"])} | {wc["research"]} / {weekly_targets["research"]} | {research_rate}% |
+{rows}
 
-**⏱ Total time:** **{format_time(total_week_time)}** this week
+**⏱ Total time:** **{format_time(week["total_time"])}** this week
 
-<br/>
+""" + DIVIDER
 
----
 
-<br/>
-
-### 📈 This Month · {now.strftime('%B')}
+def render_month(d: dict) -> str:
+    month = d["month"]
+    month_t, month_d = month["times"], month["days"]
+    return f"""### 📈 This Month · {month['name']}
 
 *Accumulated effort over the current month.*
 
@@ -372,13 +300,13 @@ def generate_dashboard() -> str:
 | **{format_time(month_t["fitness"])}** | **{format_time(month_t["english"])}** | **{format_time(month_t["research"])}** |
 | {month_d["fitness"]} day(s) | {month_d["english"]} day(s) | {month_d["research"]} day(s) |
 
-<br/>
-
----
+""" + DIVIDER
 
-<br/>
 
-### 🏆 {now.year} Overview
+def render_year(d: dict) -> str:
+    year = d["year"]
+    year_t = year["times"]
+    return f"""### 🏆 {year['year']} Overview
 
 *High-level snapshot of the year so far.*
 
@@ -386,28 +314,74 @@ def generate_dashboard() -> str:
 
 | Active Days | 💪 Fitness | 🗣️ English | 🔬 Research |
 |---:|---:|---:|---:|
-| **{len(year_stats["active_days"])}** | {format_time(year_t["fitness"])} | {format_time(year_t["english"])} | **{format_time(year_t["research"])}** |
+| **{year["active_days"]}** | {format_time(year_t["fitness"])} | {format_time(year_t["english"])} | **{format_time(year_t["research"])}** |
 
 </div>
 
-<br/>
+""" + DIVIDER
 
----
 
-<br/>
+def render_windows(d: dict) -> str:
+    if not d["windows"]:
+        return ""
+    window_rows = "\n".join(
+        f"| {w['label']} | **{w['days']}** | {format_time(w['fitness'])} | {format_time(w['english'])} | {format_time(w['research'])} |"
+        for w in d["windows"]
+    )
+    return f"""### 🪟 Rolling Windows
+
+| Window | Active Days | 💪 Fitness | 🗣️ English | 🔬 Research |
+|---|---:|---:|---:|---:|
+{window_rows}
+
+""" + DIVIDER
 
-### 📆 Last 7 Days
+
+def render_last7(d: dict) -> str:
+    last7_block = "\n".join(f"`{r['md']}`  {r['icons']}" for r in d["recent_7"])
+    return f"""### 📆 Last 7 Days
 
 {last7_block}
 
-<br/>
+""" + DIVIDER
 
----
 
-<br/>
+def render_heatmap(d: dict) -> str:
+    grids = d["heatmap"]
+    if not grids:
+        return ""
+    current = grids[-1]
+    out = f"""### 🗓️ {current['year']} Activity
+
+<div align="center">
+
+{heatmap.render_emoji(current['cells'])}
+
+<sub>{current['active']} active days &nbsp; • &nbsp; {heatmap.legend()}</sub>
+
+</div>
+
+"""
+    # 지난 해들은 접어 둠 (최근 해부터)
+    for g in reversed(grids[:-1]):
+        out += f"""<details>
+<summary><b>{g['year']}</b> · {g['active']} active days</summary>
 
 <div align="center">
 
+{heatmap.render_emoji(g['cells'])}
+
+</div>
+
+</details>
+
+"""
+    return out + DIVIDER
+
+
+def render_quick_start(d: dict) -> str:
+    return """<div align="center">
+
 ### 🎮 Quick Start
 
 **[➕ Log today](../../issues/new/choose)**
@@ -439,7 +413,11 @@ def generate_dashboard() -> str:
 
 ---
 
-<div align="center">
+"""
+
+
+def render_footer(d: dict) -> str:
+    return """<div align="center">
 
 **📈 Consistency is the key to momentum! 🚀**
 
@@ -447,8 +425,146 @@ def generate_dashboard() -> str:
 
 </div>
 """
-    
-    return readme
+
+
+# README 섹션: 이름, 의존하는 입력(section_inputs의 키), 렌더러 - 이 순서로 README에 놓인다
+Section = namedtuple("Section", "name deps render")
+
+SECTIONS = (
+    Section("header", (), render_header),
+    Section("hero", ("streak", "year"), render_hero),
+    Section("week", ("week",), render_week),
+    Section("month", ("month",), render_month),
+    Section("year", ("year",), render_year),
+    Section("windows", ("windows",), render_windows),
+    Section("last7", ("recent_7",), render_last7),
+    Section("heatmap", ("heatmap",), render_heatmap),
+    Section("quick_start", (), render_quick_start),
+    Section("footer", (), render_footer),
+)
+
+# 섹션 본문을 README 안에서 감싸는 표시 (렌더링 결과에는 보이지 않음)
+SECTION_RE = re.compile(r"<!-- dashboard:(\w+) -->\n(.*?)<!-- /dashboard:\1 -->\n", re.S)
+
+
+def section_block(name: str, body: str) -> str:
+    return f"<!-- dashboard:{name} -->\n{body}<!-- /dashboard:{name} -->\n"
+
+
+def section_inputs(agg: Aggregates, now: datetime, grids: list = ()) -> dict:
+    """섹션들이 의존하는 입력 - 날짜에서 나오는 제목(주차, 달 이름, 연도)과 히트맵 격자도 포함"""
+    return {
+        "streak": agg.streak,
+        "year": {"year": now.year, **agg.year},
+        "week": {"no": agg.habit_week_no, **agg.week},
+        "month": {"name": now.strftime("%B"), **agg.month},
+        "windows": agg.windows,
+        "recent_7": agg.recent_7,
+        "heatmap": list(grids),
+    }
+
+
+@lru_cache(maxsize=None)
+def renderer_digest() -> bytes:
+    """섹션 템플릿(이 파일과 heatmap)이 바뀌면 모든 섹션 캐시가 무효가 되도록"""
+    h = hashlib.sha256()
+    for path in (__file__, heatmap.__file__):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.digest()
+
+
+def section_hash(section: Section, inputs: dict) -> str:
+    h = hashlib.sha256(renderer_digest())
+    h.update(section.name.encode("utf-8") + b"\0")
+    h.update(json.dumps([inputs[k] for k in section.deps], sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
+
+
+def output_hash(body: str) -> str:
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+@traced
+def render_sections(inputs: dict, cache: dict = None, current: dict = None) -> tuple:
+    """
+    ({name: 본문}, {name: 캐시 항목}, 다시 렌더링한 섹션 이름 목록).
+    cache[name]의 입력 해시가 같고 current(지금 README의 섹션 본문)가 그때 쓴 그대로면
+    렌더링하지 않고 current를 재사용한다
+    """
+    cache = cache or {}
+    current = current or {}
+    bodies, entries, rendered = {}, {}, []
+    for section in SECTIONS:
+        key = section_hash(section, inputs)
+        old = cache.get(section.name) or {}
+        body = current.get(section.name)
+        if body is None or old.get("inputs") != key or old.get("output") != output_hash(body):
+            body = section.render({k: inputs[k] for k in section.deps})
+            rendered.append(section.name)
+        bodies[section.name] = body
+        entries[section.name] = {"inputs": key, "output": output_hash(body)}
+    return bodies, entries, rendered
+
+
+def splice(readme: str, bodies: dict) -> str:
+    """
+    README의 섹션 표시 사이만 새 본문으로 바꿈 (표시 밖의 내용은 그대로).
+    표시가 하나라도 없으면(첫 렌더링, 예전 README) SECTIONS 순서로 새로 조립
+    """
+    if readme is not None and {m.group(1) for m in SECTION_RE.finditer(readme)} >= bodies.keys():
+        return SECTION_RE.sub(
+            lambda m: section_block(m.group(1), bodies[m.group(1)]) if m.group(1) in bodies else m.group(0),
+            readme,
+        )
+    return "".join(section_block(s.name, bodies[s.name]) for s in SECTIONS)
+
+
+def readme_sections(readme: str) -> dict:
+    """README에 들어 있는 섹션 본문 {name: 본문}"""
+    if not readme:
+        return {}
+    return {m.group(1): m.group(2) for m in SECTION_RE.finditer(readme)}
+
+
+# -----------------------------
+# README generation
+# -----------------------------
+def dashboard_sections(now: datetime = None, windows: str = None, stats: dict = None,
+                       cache: dict = None, current: dict = None, heatmap_mode: str = None) -> tuple:
+    """
+    섹션별 본문 - render_sections와 같은 반환값.
+    stats가 주어지면 디스크에서 다시 읽지 않고, 지난 해들은 롤링 구간이 겹치는 연도의 파티션만 읽는다
+    (히트맵이 모든 해면 전부)
+    """
+    if now is None:
+        now = datetime.now(KST)
+    if windows is None:
+        windows = os.environ.get("DASHBOARD_WINDOWS", DEFAULT_WINDOWS)
+    if heatmap_mode is None:
+        heatmap_mode = os.environ.get("DASHBOARD_HEATMAP", DEFAULT_HEATMAP)
+
+    years = None if heatmap_mode.strip().lower() == "all" else needed_years(now, windows)
+    if stats is not None:
+        # 방금 반영한 stats에 없는 연도만 더 읽음
+        store.ensure_years(stats, years)
+        cols = DailyColumns.from_daily(safe_daily(stats))
+    else:
+        # 스냅샷 + 아직 접히지 않은 이벤트 로그 꼬리
+        stats, cols = load_stats(years)
+
+    agg = aggregate(stats, now, windows, cols)
+    grids = heatmap.year_grids(cols, heatmap_years(heatmap_mode, cols, now), now.toordinal())
+    return render_sections(section_inputs(agg, now, grids), cache, current)
+
+
+def generate_dashboard(now: datetime = None, windows: str = None, stats: dict = None,
+                       heatmap_mode: str = None) -> str:
+    """README 대시보드 전체 (캐시 없이 모든 섹션 렌더링)"""
+    if stats is None and not store.has_stats():
+        return generate_initial_readme()
+    bodies, _, _ = dashboard_sections(now, windows, stats, heatmap_mode=heatmap_mode)
+    return splice(None, bodies)
 
 def generate_initial_readme():
     """초기 README 생성"""
@@ -494,13 +610,109 @@ def generate_initial_readme():
 </div>
 """
 
+@traced
+def input_fingerprint(now: datetime, windows: str, heatmap_mode: str = DEFAULT_HEATMAP) -> str:
+    """
+    README 출력이 의존하는 입력의 지문:
+    - 통계 스냅샷(manifest, manifest에 있는 연도 파티션 JSON과 그 .bin) + 이벤트 로그
+      (파일 바이트 그대로 - manifest만 파싱해서 파티션 목록을 얻음). 파티션만 바뀌어도
+      (손으로 고치거나 fsck --repair, rebuild.py) manifest는 그대로일 수 있으므로 파티션도 포함
+    - 렌더러 코드 (dashboard/store/columns/packed/heatmap)
+    - 날짜 버킷: 오늘 날짜(KST)가 주/월/연/최근 7일/롤링 구간/히트맵을 모두 결정
+    - 롤링 구간, 히트맵 설정
+    """
+    partitions = []
+    for year in store.read_manifest().get("meta", {}).get("partitions", []):
+        path = store.partition_path(year)
+        partitions += [path, packed.packed_path(path)]
+
+    h = hashlib.sha256()
+    for path in (store.STATS_FILE, *partitions, store.EVENTS_FILE, __file__, store.__file__, columns.__file__,
+                 packed.__file__, heatmap.__file__):
+        h.update(os.path.basename(path).encode("utf-8") + b"\0")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    h.update(chunk)
+        h.update(b"\0")
+    h.update(now.strftime("%Y-%m-%d").encode("utf-8") + b"\0")
+    h.update(windows.encode("utf-8") + b"\0")
+    h.update(heatmap_mode.encode("utf-8"))
+    return h.hexdigest()
+
+
+def read_fingerprint() -> str:
+    if not os.path.exists(FINGERPRINT_FILE):
+        return ""
+    with open(FINGERPRINT_FILE, "r", encoding="utf-8") as f:
+        return f.read().strip()
+
+
+def read_section_cache() -> dict:
+    if not os.path.exists(SECTIONS_FILE):
+        return {}
+    try:
+        with open(SECTIONS_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+@traced
+def update_readme(force: bool = False, stats: dict = None) -> bool:
+    """
+    README 갱신, 내용이 바뀌었으면 True.
+    pipeline처럼 방금 반영한 stats를 넘기면 stats.json을 다시 읽지 않음.
+    입력이 바뀐 섹션만 다시 렌더링해 README의 섹션 표시 사이에 끼워 넣는다
+    """
+    now = datetime.now(KST)
+    windows = os.environ.get("DASHBOARD_WINDOWS", DEFAULT_WINDOWS)
+    heatmap_mode = os.environ.get("DASHBOARD_HEATMAP", DEFAULT_HEATMAP)
+
+    # 입력이 그대로면 렌더링도 파일 쓰기도 하지 않음
+    fingerprint = input_fingerprint(now, windows, heatmap_mode)
+    if not force and os.path.exists(README_FILE) and read_fingerprint() == fingerprint:
+        print("⏭️ Dashboard inputs unchanged, skipping")
+        return False
+
+    current = None
+    if os.path.exists(README_FILE):
+        with open(README_FILE, "r", encoding="utf-8") as f:
+            current = f.read()
+
+    entries = None
+    if stats is None and not store.has_stats():
+        readme_content = generate_initial_readme()
+        note = ""
+    else:
+        # --force면 캐시를 무시하고 모든 섹션을 다시 렌더링
+        cache = {} if force else read_section_cache()
+        sections = readme_sections(current)
+        bodies, entries, rendered = dashboard_sections(now, windows, stats, cache, sections, heatmap_mode)
+        readme_content = splice(current, bodies)
+        note = f" ({len(rendered)}/{len(SECTIONS)} sections rendered)"
+
+    with WriteBatch() as batch:
+        if current != readme_content:
+            batch.write(README_FILE, readme_content)
+        if entries is not None:
+            batch.write(SECTIONS_FILE, json.dumps(entries, indent=2, sort_keys=True) + "\n")
+        batch.write(FINGERPRINT_FILE, fingerprint + "\n")
+
+    print(("✅ Dashboard updated" if current != readme_content else "✅ Dashboard already up to date") + note)
+    return current != readme_content
+
+
 def main():
-    readme_content = generate_dashboard()
-    
-    with open('README.md', 'w', encoding='utf-8') as f:
-        f.write(readme_content)
-    
-    print("✅ Dashboard updated")
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="README dashboard generator")
+    arg_parser.add_argument("--force", action="store_true", help="render even if the inputs are unchanged")
+    instrument.add_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    with instrument.session("dashboard", args.trace, args.profile):
+        update_readme(args.force)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+전체 기록 내보내기 (pandas, DuckDB 등 외부 분석용)
+
+한 행 = (date, habit, minutes, note). 분은 통계(stats.json + 이벤트 로그)에서,
+메모는 stats.json에 남지 않으므로 update_weekly_log가 쓴 주간 로그
+(logs/YYYY/MM/week-NN.md)에서 다시 읽는다. 행은 제너레이터로 하나씩 만들어
+바로 쓰므로 전체 표를 메모리에 올리지 않는다. 주간 로그도 한 번에 한 파일만 읽는다.
+
+    python scripts/export.py --format csv > history.csv
+    python scripts/export.py --format ndjson --since 2025-01-01 -o history.ndjson
+    python scripts/export.py --format parquet -o history.parquet   # pyarrow 필요
+
+- 습관(fitness, english, research)은 분이 0보다 큰 날만,
+  독서(reading)는 책을 기록한 날만 (minutes는 비움, note는 "제목 - 메모")
+"""
+
+import os
+import sys
+from datetime import date
+
+import store
+from parser import week_file_path
+from store import HABITS
+from weeklog import WeekFile, section_entries
+
+COLUMNS = ("date", "habit", "minutes", "note")
+
+# parquet으로 쓸 때 한 번에 모으는 행 수 (메모리 상한)
+PARQUET_CHUNK = 10000
+
+
+def section_notes(section: str) -> dict:
+    """주간 로그의 하루 섹션에서 {습관: 메모} (독서는 "제목 - 메모" 그대로)"""
+    notes = {}
+    for habit, (value, note) in section_entries(section).items():
+        if habit == "reading":
+            notes[habit] = f"{value} - {note}" if note else value
+        else:
+            notes[habit] = note
+    return notes
+
+
+def week_notes(dates):
+    """날짜순 date_str들에 대해 (date_str, {습관: 메모})를 생성 - 주간 로그는 한 번에 한 파일만 읽음"""
+    current_path = None
+    sections = {}
+    for date_str in dates:
+        path = week_file_path(date.fromisoformat(date_str))
+        if path != current_path:
+            current_path = path
+            sections = dict(WeekFile.load(path).sections()) if os.path.exists(path) else {}
+        section = sections.get(date_str)
+        yield date_str, section_notes(section) if section else {}
+
+
+def iter_rows(stats: dict = None, since: str = None, until: str = None):
+    """(date, habit, minutes, note) 행을 날짜순으로 하나씩 생성"""
+    if stats is None:
+        stats = store.load_stats()
+    daily = stats.get("daily", {})
+    dates = sorted(d for d in daily if (since is None or d >= since) and (until is None or d <= until))
+    for date_str, notes in week_notes(dates):
+        day_data = daily[date_str]
+        for habit in HABITS:
+            minutes = int(day_data.get(habit, 0) or 0)
+            if minutes > 0:
+                yield (date_str, habit, minutes, notes.get(habit, ""))
+        title = day_data.get("reading")
+        if title:
+            yield (date_str, "reading", None, notes.get("reading") or title)
+
+
+# -----------------------------
+# Writers
+# -----------------------------
+def write_csv(rows, out) -> int:
+    import csv
+
+    writer = csv.writer(out)
+    writer.writerow(COLUMNS)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_ndjson(rows, out) -> int:
+    import json
+
+    count = 0
+    for row in rows:
+        out.write(json.dumps(dict(zip(COLUMNS, row)), ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def write_parquet(rows, path: str) -> int:
+    """PARQUET_CHUNK 행씩 row group으로 기록 (pyarrow가 있을 때만)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([("date", pa.string()), ("habit", pa.string()),
+                        ("minutes", pa.int32()), ("note", pa.string())])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) == PARQUET_CHUNK:
+                writer.write_table(pa.Table.from_arrays(list(map(list, zip(*chunk))), schema=schema))
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            writer.write_table(pa.Table.from_arrays(list(map(list, zip(*chunk))), schema=schema))
+            count += len(chunk)
+    return count
+
+
+def main():
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Export the full habit history, one row per (date, habit)")
+    arg_parser.add_argument("--format", choices=("csv", "ndjson", "parquet"), default="csv")
+    arg_parser.add_argument("-o", "--output", metavar="FILE", help="output file (default: stdout; required for parquet)")
+    arg_parser.add_argument("--since", metavar="YYYY-MM-DD", help="first date to export")
+    arg_parser.add_argument("--until", metavar="YYYY-MM-DD", help="last date to export")
+    args = arg_parser.parse_args()
+
+    rows = iter_rows(since=args.since, until=args.until)
+    if args.format == "parquet":
+        if not args.output:
+            arg_parser.error("--format parquet needs --output")
+        try:
+            count = write_parquet(rows, args.output)
+        except ImportError:
+            arg_parser.error("--format parquet needs pyarrow (pip install pyarrow)")
+    else:
+        writer = write_csv if args.format == "csv" else write_ndjson
+        if args.output:
+            with open(args.output, "w", encoding="utf-8", newline="") as out:
+                count = writer(rows, out)
+        else:
+            count = writer(rows, sys.stdout)
+    print(f"✅ Exported {count} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+통계 일관성 검사 (fsck)
+
+weekly/monthly/yearly rollup과 streak는 이벤트마다 증분(delta)으로만 갱신되므로
+한 번 어긋나면 스스로 바로잡히지 않는다. daily를 DailyColumns로 한 번 바꿔 두고
+(연도 파티션의 .bin이 있으면 mmap 그대로) 모든 주/월/연 구간을 누적합 차이로 다시 계산해
+저장된 값과 비교한다. 구간 하나가 O(1)이므로 전체 검사는 일수에 선형이다.
+
+    python scripts/fsck.py             # 검사만, 어긋나면 exit 1
+    python scripts/fsck.py --repair    # 어긋나면 daily에서 rollup/streak를 다시 만들어 저장
+
+- 고쳤으면 step output 'repaired'가 true (README가 고치기 전 통계로 렌더링됐으므로 다시 렌더링)
+
+- 양쪽 다 0인 구간(기록이 없는 주, 쉬는 날만 있는 달)은 비교하지 않는다
+- daily 자체가 맞는지는 rebuild.py --check (주간 로그와 비교)로 확인한다
+"""
+
+import sys
+import time
+from datetime import date, timedelta
+
+import packed
+import store
+from atomic import WriteBatch, file_lock
+from columns import DailyColumns
+from parser import write_github_output
+
+
+def load():
+    """(stats, DailyColumns) - 모든 연도, 파티션 .bin이 짝이 맞으면 mmap, 아니면 JSON + 로그 꼬리"""
+    loaded = packed.load()
+    if loaded is not None:
+        return loaded
+    stats = store.load_stats()
+    return stats, DailyColumns.from_daily(stats.get("daily", {}))
+
+
+def _month_after(d: date) -> date:
+    return date(d.year + d.month // 12, d.month % 12 + 1, 1)
+
+
+def buckets(cols: DailyColumns):
+    """기록 범위를 덮는 (bucket, key, 첫 ordinal, 마지막 ordinal) - 주는 월요일부터"""
+    if len(cols) == 0:
+        return
+    first, last = date.fromordinal(cols.start), date.fromordinal(cols.end)
+
+    d = first - timedelta(days=first.weekday())
+    while d <= last:
+        yield "weekly", store.week_key(d), d.toordinal(), d.toordinal() + 6
+        d += timedelta(days=7)
+
+    d = first.replace(day=1)
+    while d <= last:
+        nxt = _month_after(d)
+        yield "monthly", store.month_key(d), d.toordinal(), nxt.toordinal() - 1
+        d = nxt
+
+    for year in range(first.year, last.year + 1):
+        yield "yearly", str(year), date(year, 1, 1).toordinal(), date(year, 12, 31).toordinal()
+
+
+def expected_rollups(cols: DailyColumns) -> dict:
+    """{bucket: {key: rollup}} - daily에서 다시 계산한 값"""
+    expected = {"weekly": {}, "monthly": {}, "yearly": {}}
+    for bucket, key, first, last in buckets(cols):
+        expected[bucket][key] = cols.window(first, last)
+    return expected
+
+
+def _is_zero(rollup: dict) -> bool:
+    return rollup == store.new_rollup()
+
+
+def verify(stats: dict, cols: DailyColumns) -> list:
+    """저장된 rollup/streak와 daily에서 계산한 값의 차이를 사람이 읽을 줄로"""
+    lines = []
+    for bucket, expected in expected_rollups(cols).items():
+        stored = stats.get(bucket, {})
+        for key in sorted(expected.keys() | stored.keys()):
+            want = expected.get(key, store.new_rollup())
+            have = store.get_rollup(stats, bucket, key)
+            if want != have and not (_is_zero(want) and _is_zero(have)):
+                lines.append(f"{bucket} {key}: stored {have} != daily {want}")
+
+    want, have = cols.streaks(), store.streak_summary(stats)
+    if want != have:
+        lines.append(f"streak: stored {have} != daily {want}")
+    return lines
+
+
+def repair() -> dict:
+    """daily에서 rollup과 streak를 다시 만들어 스냅샷으로 저장 (로그 꼬리도 합쳐짐)"""
+    stats = store.load_stats()
+    store.rebuild_rollups(stats)
+    store.rebuild_streak(stats)
+    with WriteBatch() as batch:
+        store.replace_snapshot(stats, batch)
+    return stats
+
+
+def main():
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Verify rollups and streak against the daily records")
+    arg_parser.add_argument("--repair", action="store_true", help="rebuild rollups and streak from daily on drift")
+    args = arg_parser.parse_args()
+
+    if not store.has_stats():
+        print("ℹ️ No stats yet", file=sys.stderr)
+        return
+
+    # --repair면 검사와 저장 사이에 다른 반영이 끼어들지 않도록 처음부터 잠금
+    with file_lock(store.LOCK_FILE):
+        started = time.perf_counter()
+        stats, cols = load()
+        drift = verify(stats, cols)
+        elapsed = time.perf_counter() - started
+        for line in drift[:20]:
+            print(line)
+        if not drift:
+            write_github_output("repaired", "false")
+            print(f"✅ {len(cols)} days consistent ({elapsed * 1000:.0f} ms)", file=sys.stderr)
+            return
+        print(f"⚠️ {len(drift)} rollup/streak value(s) differ from daily", file=sys.stderr)
+        if not args.repair:
+            sys.exit(1)
+
+        stats = repair()
+        remaining = verify(stats, DailyColumns.from_daily(stats["daily"]))
+        if remaining:
+            print(f"❌ {len(remaining)} value(s) still differ after repair", file=sys.stderr)
+            sys.exit(1)
+        write_github_output("repaired", "true")
+        print("🔧 Rollups and streak rebuilt from daily", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+연간 활동 히트맵 (GitHub 잔디 모양: 월요일 시작 주 53열 × 요일 7행)
+
+하루 칸의 단계는 그날 습관별 분의 합으로 정한다 (LEVELS 경계, 0~4).
+DailyColumns의 dense 배열(날짜 ordinal 인덱스)에서 필요한 모든 해를 덮는 구간의
+하루 합계를 한 번에 만들고 단계도 한 번에 매긴 뒤 (NumPy면 벡터 연산,
+없으면 array 한 번 순회) 연도별로 잘라 쓴다. 날짜 키 조회나 strftime은 없다.
+
+격자는 '0'~'4' 단계 문자열(칸 순서는 주 → 요일)로 주고받으므로 그대로 해시하거나
+캐시할 수 있다. 해당 연도 밖의 칸과 아직 오지 않은 날은 OUTSIDE.
+
+    python scripts/heatmap.py               # 올해, 이모지
+    python scripts/heatmap.py --all         # 모든 해
+    python scripts/heatmap.py --all --svg logs/heatmap   # 연도별 YYYY.svg
+"""
+
+import os
+import sys
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime
+
+from columns import DailyColumns, np
+from instrument import traced
+
+# 하루 합계(분) 단계 경계: 0 / 1~59 / 60~119 / 120~239 / 240~
+LEVELS = (1, 60, 120, 240)
+
+# 격자 밖(다른 해, 아직 오지 않은 날) 칸
+OUTSIDE = "."
+
+# 단계별 이모지 (격자 밖은 전각 공백으로 자리만 차지)
+EMOJI = {OUTSIDE: "　", "0": "⬜", "1": "🟨", "2": "🟧", "3": "🟥", "4": "🟪"}
+
+# 단계별 SVG 색 (GitHub 잔디 팔레트)
+COLORS = {"0": "#ebedf0", "1": "#9be9a8", "2": "#40c463", "3": "#30a14e", "4": "#216e39"}
+
+# 0~4 단계 바이트 → '0'~'4'
+_DIGITS = bytes.maketrans(bytes(range(5)), b"01234")
+
+
+def levels(totals):
+    """하루 합계 배열 → 단계(0~4) uint8 배열"""
+    if np is not None:
+        return np.searchsorted(np.asarray(LEVELS, dtype=np.uint32), totals, side="right").astype(np.uint8)
+    return array("B", map(lambda t: bisect_right(LEVELS, t), totals))
+
+
+def year_bounds(year: int) -> tuple:
+    """(격자 첫 칸 ordinal(1월 1일이 속한 주의 월요일), 1월 1일, 12월 31일, 격자 마지막 칸 ordinal)"""
+    jan1, dec31 = date(year, 1, 1), date(year, 12, 31)
+    return (jan1.toordinal() - jan1.weekday(), jan1.toordinal(),
+            dec31.toordinal(), dec31.toordinal() + 6 - dec31.weekday())
+
+
+@traced
+def year_grids(cols: DailyColumns, years: list, today: int) -> list:
+    """
+    [{"year", "cells", "active"}] - years(정수) 순서대로.
+    cells: 주 → 요일 순서의 단계 문자열 (7 × 53 또는 54칸), active: 그 해 활동한 날 수
+    """
+    if not years:
+        return []
+    first = year_bounds(min(years))[0]
+    last = year_bounds(max(years))[3]
+    # 전체 구간을 한 번에: 하루 합계 → 단계 → '0'~'4' 바이트
+    digits = memoryview(levels(cols.day_totals(first, last))).tobytes().translate(_DIGITS).decode("ascii")
+
+    grids = []
+    for year in years:
+        grid_first, jan1, dec31, grid_last = year_bounds(year)
+        shown = min(dec31, today)
+        a, b = jan1 - first, shown - first + 1
+        body = digits[a:b] if b > a else ""
+        cells = OUTSIDE * (jan1 - grid_first) + body
+        cells += OUTSIDE * (grid_last - grid_first + 1 - len(cells))
+        grids.append({"year": year, "cells": cells, "active": len(body) - body.count("0")})
+    return grids
+
+
+def rows(cells: str) -> list:
+    """격자 문자열 → 요일별 행 7개 (월~일)"""
+    return [cells[d::7] for d in range(7)]
+
+
+def render_emoji(cells: str) -> str:
+    """이모지 격자 (행마다 <br/>로 줄바꿈, 마크다운 문단 안에서도 칸이 유지되도록)"""
+    table = str.maketrans(EMOJI)
+    return "<br/>\n".join(row.translate(table) for row in rows(cells))
+
+
+def legend() -> str:
+    return "Less " + " ".join(EMOJI[c] for c in "01234") + " More"
+
+
+def render_svg(grid: dict, cell: int = 11, gap: int = 2) -> str:
+    """GitHub 잔디 모양 SVG (격자 밖 칸은 그리지 않음)"""
+    cells = grid["cells"]
+    weeks = len(cells) // 7
+    step = cell + gap
+    rects = []
+    for i, c in enumerate(cells):
+        if c == OUTSIDE:
+            continue
+        x, y = (i // 7) * step, (i % 7) * step
+        rects.append(f'<rect x="{x}" y="{y}" width="{cell}" height="{cell}" rx="2" fill="{COLORS[c]}"/>')
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{weeks * step - gap}" height="{7 * step - gap}" '
+        f'role="img" aria-label="{grid["year"]}: {grid["active"]} active days">\n'
+        + "\n".join(rects)
+        + "\n</svg>\n"
+    )
+
+
+def all_years(cols: DailyColumns, today: int) -> list:
+    """첫 기록이 있는 해부터 올해까지"""
+    this_year = date.fromordinal(today).year
+    if len(cols) == 0:
+        return [this_year]
+    return list(range(min(date.fromordinal(cols.start).year, this_year), this_year + 1))
+
+
+def main():
+    import argparse
+
+    import dashboard
+    import store
+    from atomic import WriteBatch
+
+    arg_parser = argparse.ArgumentParser(description="Yearly activity heatmap")
+    arg_parser.add_argument("--all", action="store_true", help="every year since the first record")
+    arg_parser.add_argument("--svg", metavar="DIR", help="write DIR/YYYY.svg instead of printing emoji")
+    args = arg_parser.parse_args()
+
+    if not store.has_stats():
+        print("ℹ️ No stats yet", file=sys.stderr)
+        return
+
+    today = datetime.now(dashboard.KST).toordinal()
+    this_year = date.fromordinal(today).year
+    _, cols = dashboard.load_stats(None if args.all else [str(this_year)])
+    grids = year_grids(cols, all_years(cols, today) if args.all else [this_year], today)
+
+    if args.svg:
+        with WriteBatch() as batch:
+            for grid in grids:
+                batch.write(os.path.join(args.svg, f"{grid['year']}.svg"), render_svg(grid))
+        print(f"✅ {len(grids)} heatmap(s) → {args.svg}", file=sys.stderr)
+        return
+    for grid in reversed(grids):
+        print(f"{grid['year']} · {grid['active']} active days")
+        print(render_emoji(grid["cells"]).replace("<br/>", ""))
+        print()
+
+
+if __name__ == "__main__":
+    main()
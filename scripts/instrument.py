@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단계별 시간/메모리 계측 (opt-in)
+
+parser/dashboard/store의 단계 함수들은 @traced로 감싸 두었고, 계측이 꺼져 있으면
+전역 변수 하나만 확인하고 원래 함수를 그대로 부른다. 켜면 호출 경로(부모 > 자식)별로
+호출 수, 총/최대 시간, 프로세스 최대 RSS를 모으고, 끝날 때 JSON 파일과
+$GITHUB_STEP_SUMMARY용 마크다운 표로 남긴다 (step summary가 없으면 stderr).
+
+    DAILY_TRACE=trace.json python scripts/pipeline.py --queue -   # 또는 --trace trace.json
+    DAILY_TRACE=1 ...                                             # JSON 없이 표만
+    DAILY_PROFILE=cprofile,tracemalloc ...                        # 또는 --profile
+
+- cprofile: 실행 전체를 cProfile로 - 누적 시간 상위 함수를 JSON/표에, JSON 옆에 .pstats
+- tracemalloc: 단계별 최대 할당량(peak_kib)과 끝날 때 할당이 가장 큰 줄들
+  (할당마다 추적하므로 시간이 몇 배 느려진다 - 시간과 메모리는 따로 재는 편이 낫다)
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TRACE_ENV = "DAILY_TRACE"
+PROFILE_ENV = "DAILY_PROFILE"
+
+# JSON/표에 남길 cProfile 함수, tracemalloc 줄 수
+TOP_N = 15
+
+# 켜져 있을 때의 Session (꺼져 있으면 None)
+_session = None
+
+
+def _max_rss_kib() -> int:
+    """프로세스 최대 RSS (resource가 없는 플랫폼이면 0)"""
+    if resource is None:
+        return 0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KiB
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+class Session:
+    """한 번의 실행에서 모은 구간들 - 경로(이름 튜플) → 집계"""
+
+    def __init__(self, command: str, profile: set):
+        self.command = command
+        self.profile = profile
+        self.spans = {}  # path -> {"calls", "total", "max", "rss", "peak"} (처음 나온 순서 유지)
+        self.stack = []  # [(path, 시작 시각, 시작 시 할당량, 그동안의 최대 할당량)]
+        self.started = time.perf_counter()
+        self.error = None
+        self.profiler = None
+
+    def enter(self, name: str) -> None:
+        path = (self.stack[-1][0] if self.stack else ()) + (name,)
+        # 부모가 자식보다 먼저 나오도록 들어갈 때 자리를 잡아 둠
+        self.spans.setdefault(path, {"calls": 0, "total": 0.0, "max": 0.0, "rss": 0, "peak": None})
+        current = peak = 0
+        if "tracemalloc" in self.profile:
+            import tracemalloc
+
+            current, peak = tracemalloc.get_traced_memory()
+            # 부모가 지금까지 본 최대값을 넘겨 두고, 이 구간의 최대값은 새로 잼
+            if self.stack:
+                self.stack[-1][3] = max(self.stack[-1][3], peak)
+            tracemalloc.reset_peak()
+            peak = current
+        self.stack.append([path, time.perf_counter(), current, peak])
+
+    def exit(self) -> None:
+        path, started, current, peak = self.stack.pop()
+        elapsed = time.perf_counter() - started
+        span = self.spans[path]
+        span["calls"] += 1
+        span["total"] += elapsed
+        span["max"] = max(span["max"], elapsed)
+        span["rss"] = max(span["rss"], _max_rss_kib())
+        if "tracemalloc" in self.profile:
+            import tracemalloc
+
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            span["peak"] = max(span["peak"] or 0, peak - current)
+            if self.stack:
+                self.stack[-1][3] = max(self.stack[-1][3], peak)
+
+
+def traced(fn=None, name: str = None):
+    """
+    단계 함수 데코레이터 - 구간 이름은 '파일이름.함수이름' (python scripts/x.py로 실행해도 같음).
+    @traced 또는 @traced(name="...")
+    """
+    if fn is None:
+        return lambda f: traced(f, name)
+    label = name or f"{os.path.splitext(os.path.basename(fn.__code__.co_filename))[0]}.{fn.__qualname__}"
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        session = _session
+        if session is None:
+            return fn(*args, **kwargs)
+        session.enter(label)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            session.exit()
+
+    return wrapper
+
+
+@contextmanager
+def span(name: str):
+    """함수로 나누지 않은 구간 계측 (꺼져 있으면 아무것도 하지 않음)"""
+    session = _session
+    if session is None:
+        yield
+        return
+    session.enter(name)
+    try:
+        yield
+    finally:
+        session.exit()
+
+
+def add_arguments(arg_parser) -> None:
+    """--trace, --profile 옵션 (주지 않으면 DAILY_TRACE, DAILY_PROFILE 환경 변수)"""
+    arg_parser.add_argument("--trace", metavar="FILE",
+                            help=f"time each stage and write the spans as JSON ('1' for the summary only; env {TRACE_ENV})")
+    arg_parser.add_argument("--profile", metavar="MODES",
+                            help=f"with --trace: cprofile and/or tracemalloc, comma-separated (env {PROFILE_ENV})")
+
+
+@contextmanager
+def session(command: str, trace: str = None, profile: str = None):
+    """
+    command 실행 전체를 계측 (trace가 없고 DAILY_TRACE도 비어 있으면 아무것도 하지 않음).
+    예외로 끝나도 그때까지의 구간과 오류를 남기고 예외는 그대로 올린다
+    """
+    global _session
+    trace = trace or os.environ.get(TRACE_ENV, "")
+    if not trace or _session is not None:
+        yield
+        return
+    profile = profile if profile is not None else os.environ.get(PROFILE_ENV, "")
+    modes = {m.strip().lower() for m in profile.split(",") if m.strip()}
+
+    current = Session(command, modes)
+    if "tracemalloc" in modes:
+        import tracemalloc
+
+        tracemalloc.start()
+    if "cprofile" in modes:
+        import cProfile
+
+        current.profiler = cProfile.Profile()
+        current.profiler.enable()
+    _session = current
+    try:
+        with span(command):
+            yield
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _session = None
+        finish(current, None if trace.lower() in ("1", "true", "yes") else trace)
+
+
+def finish(current: Session, output: str = None) -> dict:
+    """프로파일러를 멈추고 결과를 JSON(output)과 마크다운 표로 남김"""
+    result = {
+        "command": current.command,
+        "argv": sys.argv[1:],
+        "total_ms": round((time.perf_counter() - current.started) * 1000, 3),
+        "max_rss_kib": _max_rss_kib(),
+        "error": current.error,
+        "spans": [
+            {
+                "path": " > ".join(path),
+                "depth": len(path) - 1,
+                "calls": s["calls"],
+                "total_ms": round(s["total"] * 1000, 3),
+                "max_ms": round(s["max"] * 1000, 3),
+                "rss_kib": s["rss"],
+                **({"peak_kib": round(s["peak"] / 1024, 1)} if s["peak"] is not None else {}),
+            }
+            for path, s in current.spans.items()
+        ],
+    }
+
+    if current.profiler is not None:
+        current.profiler.disable()
+        result["cprofile"] = top_functions(current.profiler)
+        if output:
+            current.profiler.dump_stats(os.path.splitext(output)[0] + ".pstats")
+    if "tracemalloc" in current.profile:
+        import tracemalloc
+
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        result["tracemalloc"] = [
+            {"line": str(stat.traceback[0]), "size_kib": round(stat.size / 1024, 1), "count": stat.count}
+            for stat in snapshot.statistics("lineno")[:TOP_N]
+        ]
+
+    if output:
+        import json
+
+        from atomic import write_file
+
+        write_file(output, json.dumps(result, indent=2, ensure_ascii=False) + "\n", fsync=False)
+    write_summary(markdown(result))
+    return result
+
+
+def top_functions(profiler) -> list:
+    """누적 시간 상위 TOP_N 함수 (계측 코드 자체는 빼고)"""
+    import pstats
+
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, func), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        if filename == __file__ or filename.endswith("contextlib.py"):
+            continue
+        rows.append({
+            "function": f"{os.path.basename(filename)}:{line}({func})",
+            "calls": calls,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3),
+        })
+    rows.sort(key=lambda r: r["cumtime_ms"], reverse=True)
+    return rows[:TOP_N]
+
+
+def markdown(result: dict) -> str:
+    """step summary용 표"""
+    status = f"❌ {result['error']}" if result["error"] else "✅"
+    lines = [
+        f"### ⏱️ {result['command']} · {result['total_ms']:.1f} ms · max RSS {result['max_rss_kib'] / 1024:.1f} MiB {status}",
+        "",
+        "| Stage | Calls | Total | Max | Max RSS | Peak alloc |",
+        "|---|---:|---:|---:|---:|---:|",
+    ]
+    for s in result["spans"]:
+        name = "&nbsp;&nbsp;" * s["depth"] + "`" + s["path"].rsplit(" > ", 1)[-1] + "`"
+        peak = f"{s['peak_kib']:.1f} KiB" if "peak_kib" in s else "-"
+        lines.append(f"| {name} | {s['calls']} | {s['total_ms']:.2f} ms | {s['max_ms']:.2f} ms "
+                     f"| {s['rss_kib'] / 1024:.1f} MiB | {peak} |")
+
+    if result.get("cprofile"):
+        lines += ["", "<details>", "<summary><b>cProfile</b> (cumulative)</summary>", "",
+                  "| Function | Calls | Own | Cumulative |", "|---|---:|---:|---:|"]
+        lines += [f"| `{r['function']}` | {r['calls']} | {r['tottime_ms']:.2f} ms | {r['cumtime_ms']:.2f} ms |"
+                  for r in result["cprofile"]]
+        lines += ["", "</details>"]
+    if result.get("tracemalloc"):
+        lines += ["", "<details>", "<summary><b>tracemalloc</b> (live at exit)</summary>", "",
+                  "| Line | Size | Blocks |", "|---|---:|---:|"]
+        lines += [f"| `{r['line']}` | {r['size_kib']:.1f} KiB | {r['count']} |" for r in result["tracemalloc"]]
+        lines += ["", "</details>"]
+    return "\n".join(lines) + "\n"
+
+
+def write_summary(text: str) -> None:
+    """$GITHUB_STEP_SUMMARY에 추가 (없으면 stderr)"""
+    summary = os.environ.get("GITHUB_STEP_SUMMARY")
+    if not summary:
+        print(text, file=sys.stderr)
+        return
+    with open(summary, "a", encoding="utf-8") as f:
+        f.write(text + "\n")
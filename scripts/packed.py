@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+연도 파티션의 압축 바이너리 사본 (logs/stats/YYYY.bin)
+
+파티션(logs/stats/YYYY.json)을 쓸 때 같은 batch에서 함께 기록된다. dashboard는 이 파일이
+있고 파티션 JSON과 짝이 맞으면(헤더의 JSON 해시가 같으면) 하루 하나씩 중첩된 JSON을
+파싱하는 대신 이 파일을 mmap해서 습관별 분 배열을 그대로 DailyColumns로 쓴다.
+사람이 읽는 원본은 계속 JSON이다.
+
+레이아웃 (정수는 기록한 머신의 바이트 순서, 헤더에 표시):
+    header   HEADER: magic, 포맷 버전, 바이트 순서, rollup 스키마 버전, start ordinal, 일수 n,
+             파티션 JSON의 sha256, rest 길이
+    rest     daily를 뺀 나머지 (그 해 날짜들의 weekly/monthly) - JSON
+    padding  2바이트 정렬
+    columns  습관별 uint16 × n, reading uint8 × n, present uint8 × n
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+from collections.abc import MutableMapping
+from datetime import date
+
+import store
+from columns import DailyColumns, np
+from instrument import traced
+from store import HABITS
+
+MAGIC = b"DMSTATS"
+FORMAT_VERSION = 2
+BYTEORDER = b"L" if sys.byteorder == "little" else b"B"
+HEADER = struct.Struct("<7sBcxQqI32sI")
+
+
+def packed_path(json_file: str) -> str:
+    """logs/stats/2025.json → logs/stats/2025.bin"""
+    return os.path.splitext(json_file)[0] + ".bin"
+
+
+def pack(part: dict, json_bytes: bytes) -> bytes:
+    """파티션을 바이너리로 (json_bytes: 같이 기록하는 파티션 JSON 내용)"""
+    cols = DailyColumns.from_daily(part.get("daily", {}))
+    rest = json.dumps({k: v for k, v in part.items() if k != "daily"},
+                      ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, BYTEORDER, store.ROLLUP_VERSION, cols.start, len(cols),
+                         hashlib.sha256(json_bytes).digest(), len(rest))
+    parts = [header, rest, b"\0" * ((HEADER.size + len(rest)) % 2)]
+    parts += [memoryview(cols.minutes[k]).tobytes() for k in HABITS]
+    parts += [memoryview(cols.reading).tobytes(), memoryview(cols.present).tobytes()]
+    return b"".join(parts)
+
+
+def load_partition(json_file: str):
+    """파티션 .bin을 mmap해서 (daily를 뺀 파티션, DailyColumns) - 없거나 JSON과 짝이 맞지 않으면 None"""
+    path = packed_path(json_file)
+    if not os.path.exists(path) or not os.path.exists(json_file):
+        return None
+    h = hashlib.sha256()
+    with open(json_file, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < HEADER.size:
+            return None
+        # ACCESS_COPY: 로그 꼬리를 재생할 때 쓰기는 프로세스 메모리에만 반영
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    magic, version, byteorder, rollups, start, n, digest, rest_len = HEADER.unpack_from(buf)
+    if (magic, version, byteorder, rollups) != (MAGIC, FORMAT_VERSION, BYTEORDER, store.ROLLUP_VERSION) \
+            or digest != h.digest():
+        return None
+    offset = HEADER.size + rest_len
+    offset += offset % 2
+    if len(buf) != offset + n * (2 * len(HABITS) + 2):
+        return None
+
+    rest = json.loads(buf[HEADER.size:HEADER.size + rest_len])
+    view = memoryview(buf)
+    minutes = {}
+    for k in HABITS:
+        if np is not None:
+            minutes[k] = np.frombuffer(buf, dtype=np.uint16, count=n, offset=offset)
+        else:
+            minutes[k] = view[offset:offset + 2 * n].cast("H")
+        offset += 2 * n
+    reading = view[offset:offset + n]
+    present = view[offset + n:offset + 2 * n]
+    return rest, DailyColumns(start, minutes, reading, present)
+
+
+@traced
+def load(stats_file: str = store.STATS_FILE, events_file: str = store.EVENTS_FILE, years=None):
+    """
+    manifest + 필요한 연도(store.years_to_load)의 .bin을 mmap해서 (stats, DailyColumns) 반환 -
+    로그 꼬리까지 재생한 최신 상태. 파일이 없거나 JSON과 짝이 맞지 않으면 None (JSON으로 읽으면 됨)
+    """
+    if not os.path.exists(stats_file):
+        return None
+    stats = store.read_manifest(stats_file)
+    meta = stats["meta"]
+    if "daily" in stats or (meta.get("rollups"), meta.get("books")) != (store.ROLLUP_VERSION, store.BOOKS_VERSION):
+        return None
+
+    tail = list(store.read_events(meta["seq"], events_file))
+    wanted = store.years_to_load(stats, years, tail)
+    while True:
+        stats.update(daily={}, weekly={}, monthly={}, _years=set(), _dirty=set())
+        parts = []
+        for year in wanted:
+            loaded = load_partition(store.partition_path(year, stats_file))
+            if loaded is None:
+                return None
+            rest, cols = loaded
+            store.merge_partition(stats, year, rest)
+            parts.append(cols)
+
+        cols = DailyColumns.concat(parts)
+        stats["daily"] = DailyView(cols)
+        # 로그 꼬리가 과거 날짜의 활동 여부를 바꾸면 스트릭을 다시 훑도록 전부 읽음
+        everything = meta.get("partitions", [])
+        if len(wanted) == len(everything) or not store.rewrites_streak(stats, tail):
+            break
+        wanted = list(everything)
+    store.replay(stats, tail)
+    return stats, cols
+
+
+class DailyView(MutableMapping):
+    """
+    DailyColumns 위의 stats['daily'] 호환 뷰 (store.replay로 로그 꼬리를 반영할 수 있도록).
+    reading은 책 제목 대신 True/False
+    """
+
+    def __init__(self, cols: DailyColumns):
+        self.cols = cols
+
+    def _index(self, date_str: str) -> int:
+        try:
+            i = date.fromisoformat(date_str).toordinal() - self.cols.start
+        except (TypeError, ValueError):
+            raise KeyError(date_str) from None
+        if not 0 <= i < len(self.cols) or not self.cols.present[i]:
+            raise KeyError(date_str)
+        return i
+
+    def __getitem__(self, date_str: str) -> dict:
+        i = self._index(date_str)
+        return self.cols.day(self.cols.start + i)
+
+    def __setitem__(self, date_str: str, day_data: dict) -> None:
+        self.cols.set_day(date.fromisoformat(date_str).toordinal(), day_data)
+
+    def __delitem__(self, date_str: str) -> None:
+        i = self._index(date_str)
+        self.cols.set_day(self.cols.start + i, {})
+        self.cols.present[i] = 0
+
+    def __iter__(self):
+        start = self.cols.start
+        for i, p in enumerate(self.cols.present):
+            if p:
+                yield date.fromordinal(start + i).isoformat()
+
+    def __len__(self) -> int:
+        return sum(self.cols.present)
@@ -1,50 +1,80 @@
 #!/usr/bin/env python3
 import os
 import re
+import sys
 import json
-from datetime import datetime
-from pathlib import Path
-import pytz
+import time
+from datetime import datetime, timedelta, timezone
+
+import instrument
+import store
+from atomic import WriteBatch, file_lock
+from instrument import traced
+from weeklog import WeekFile, upsert_section
 
 # 한국 시간대
-KST = pytz.timezone('Asia/Seoul')
+# 한국은 서머타임이 없으므로 고정 UTC+9 (pytz/tzdata 없이)
+KST = timezone(timedelta(hours=9), 'KST')
+
+# 이모지 → 습관 (분기문 대신 데이터로 관리)
+HABIT_EMOJI = {
+    '💪': 'fitness',
+    '🗣️': 'english',
+    '🗣': 'english',
+    '🔬': 'research',
+    '📚': 'reading',
+}
+
+# 독서 항목에서 "비어 있음"으로 취급하는 값
+EMPTY_READING = {'.', '-', '_', '~'}
+
+# HTML 주석
+COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+
+# 습관 토크나이저: 본문 전체에서 습관 이모지(+선택적 variation selector)를 찾아
+# 같은 줄의 "시간 - 메모"(독서는 "제목 - 메모")를 한 번의 매치로 분리
+HABIT_RE = re.compile(
+    '([' + ''.join(sorted({e[0] for e in HABIT_EMOJI})) + '])\ufe0f?'
+    r'[^\S\n]*([^\n-]*)(?:-([^\n]*))?'
+)
+
+# 시간 토큰: 1h, 1.5h, 1시간, 2.5시간, 30m, 30분 (1h 30m, 1시간 30분 조합 가능)
+TIME_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:(h|시간)|m|분)')
 
 def parse_time(time_str):
     """시간 문자열을 분(minutes)으로 변환"""
     if not time_str:
         return 0
     
-    # 패턴: 1h, 1시간, 30m, 30분, 1.5h, 1시간 30분 등
-    hours = 0
-    minutes = 0
-    
-    # 1.5h, 2.5h 같은 소수점 형식
-    decimal_pattern = r'(\d+\.?\d*)h'
-    decimal_match = re.search(decimal_pattern, time_str)
-    if decimal_match:
-        hours = float(decimal_match.group(1))
-        return int(hours * 60)
-    
-    # 1h, 2h, 1시간 형식
-    hour_pattern = r'(\d+)\s*(?:h|시간)'
-    hour_match = re.search(hour_pattern, time_str)
-    if hour_match:
-        hours = int(hour_match.group(1))
-    
-    # 30m, 45분 형식
-    min_pattern = r'(\d+)\s*(?:m|분)'
-    min_match = re.search(min_pattern, time_str)
-    if min_match:
-        minutes = int(min_match.group(1))
-    
-    return hours * 60 + minutes
+    # 첫 번째 시간 단위와 첫 번째 분 단위만 사용
+    hours = None
+    minutes = None
+    for match in TIME_RE.finditer(time_str):
+        if match.group(2):
+            if hours is None:
+                hours = float(match.group(1))
+        elif minutes is None:
+            minutes = float(match.group(1))
+    
+    return int((hours or 0) * 60 + (minutes or 0))
+
+def is_daily_log(body):
+    """
+    습관 줄(💪🗣️🔬📚)이 하나라도 있는지 - 없으면 daily log가 아닌 issue이므로
+    모든 값이 0인 기록으로 그날의 통계를 덮어쓰지 않도록 건너뜀
+    """
+    return HABIT_RE.search(COMMENT_RE.sub('', body or '')) is not None
 
+@traced
 def parse_issue_body(body):
-    """Issue 본문 파싱"""
-    # HTML 주석 제거
-    body = re.sub(r'<!--.*?-->', '', body, flags=re.DOTALL)
+    """
+    Issue 본문 파싱 - 습관 줄마다 HABIT_RE 한 번으로 분류
     
-    lines = body.split('\n')
+    같은 습관이 여러 줄이면 마지막 줄이 이기므로(메모는 메모가 있는 마지막 줄)
+    매치를 뒤에서부터 보고 모든 항목이 정해지면 바로 멈춘다.
+    """
+    # HTML 주석 제거
+    body = COMMENT_RE.sub('', body)
     
     result = {
         'fitness': {'time': 0, 'note': ''},
@@ -53,54 +83,49 @@ def parse_issue_body(body):
         'reading': {'title': '', 'note': ''}
     }
     
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('#') or line.startswith('```'):
+    timed = set()  # 시간이 정해진 습관
+    done = set()   # 더 볼 필요가 없는 습관
+    for match in reversed(list(HABIT_RE.finditer(body))):
+        habit = HABIT_EMOJI[match.group(1)]
+        note = match.group(3)
+        if habit in done or (habit in timed and note is None):
             continue
         
-        # 💪 헬스
-        if '💪' in line:
-            parts = line.split('💪', 1)[1].strip()
-            if not parts:  # 비어있으면 스킵
-                continue
-            time_part = parts.split('-')[0].strip() if '-' in parts else parts
-            result['fitness']['time'] = parse_time(time_part)
-            if '-' in parts:
-                result['fitness']['note'] = parts.split('-', 1)[1].strip()
+        # 한 줄에서는 처음 나온 이모지만 사용하고, 제목(#)/코드펜스(```) 줄은 무시
+        start = match.start()
+        line_start = body.rfind('\n', 0, start) + 1
+        if HABIT_RE.search(body, line_start, start):
+            continue
+        prefix = body[line_start:start].lstrip()
+        if prefix.startswith('#') or prefix.startswith('```'):
+            continue
         
-        # 🗣️ 영어
-        elif '🗣️' in line or '🗣' in line:
-            parts = line.split('🗣️' if '🗣️' in line else '🗣', 1)[1].strip()
-            if not parts:  # 비어있으면 스킵
-                continue
-            time_part = parts.split('-')[0].strip() if '-' in parts else parts
-            result['english']['time'] = parse_time(time_part)
-            if '-' in parts:
-                result['english']['note'] = parts.split('-', 1)[1].strip()
+        head = match.group(2).strip()
+        if not head and note is None:  # 비어있으면 스킵
+            continue
+        note = note.strip() if note is not None else None
         
-        # 🔬 연구
-        elif '🔬' in line:
-            parts = line.split('🔬', 1)[1].strip()
-            if not parts:  # 비어있으면 스킵
+        if habit == 'reading':
+            # 제목과 메모는 같은 줄(마지막 유효한 📚 줄)에서만 가져온다.
+            # 예전 줄 단위 파서는 메모가 없는 마지막 줄의 제목에 앞 줄의 메모를 남겨
+            # 다른 책의 메모가 붙을 수 있었다 - 이제 그런 경우 메모는 ''
+            # 빈 값이나 특수문자만 있거나 너무 짧으면 스킵
+            value = head if note is None else f"{head}-{note}"
+            if value in EMPTY_READING or len(value) < 2:
                 continue
-            time_part = parts.split('-')[0].strip() if '-' in parts else parts
-            result['research']['time'] = parse_time(time_part)
-            if '-' in parts:
-                result['research']['note'] = parts.split('-', 1)[1].strip()
+            result['reading']['title'] = head
+            result['reading']['note'] = note or ''
+            done.add(habit)
+        else:
+            if habit not in timed:
+                result[habit]['time'] = parse_time(head)
+                timed.add(habit)
+            if note is not None:
+                result[habit]['note'] = note
+                done.add(habit)
         
-        # 📚 독서
-        elif '📚' in line:
-            parts = line.split('📚', 1)[1].strip()
-            if not parts or parts in ['.', '-', '_', '~']:  # 빈 값이나 특수문자만 있으면 스킵
-                continue
-            # 공백만 있거나 너무 짧으면 스킵
-            if len(parts.strip()) < 2:
-                continue
-            if '-' in parts:
-                result['reading']['title'] = parts.split('-')[0].strip()
-                result['reading']['note'] = parts.split('-', 1)[1].strip()
-            else:
-                result['reading']['title'] = parts
+        if len(done) == len(result):
+            break
     
     return result
 
@@ -108,10 +133,6 @@ def get_week_number(date):
     """ISO 주차 계산"""
     return date.isocalendar()[1]
 
-def ensure_dir(path):
-    """디렉토리 생성"""
-    Path(path).mkdir(parents=True, exist_ok=True)
-
 def format_time(minutes):
     """분을 시간 형식으로 변환"""
     if minutes == 0:
@@ -122,27 +143,19 @@ def format_time(minutes):
         return f"{hours}h"
     return f"{hours}h {mins}m"
 
-def update_weekly_log(date, data):
-    """주간 로그 업데이트 - 입력한 항목만 표시"""
-    year = date.year
-    month = date.month
-    week = get_week_number(date)
-    
-    log_dir = f"logs/{year}/{month:02d}"
-    ensure_dir(log_dir)
-    
-    week_file = f"{log_dir}/week-{week}.md"
+def week_file_path(date):
+    """날짜에 해당하는 주간 로그 파일 경로"""
+    return f"logs/{date.year}/{date.month:02d}/week-{get_week_number(date)}.md"
+
+def week_file_header(date):
+    """새 주간 로그 파일의 헤더"""
+    return f"# Week {get_week_number(date)} - {date.year}.{date.month:02d}\n\n"
+
+def render_day_section(date, data):
+    """하루치 섹션 생성 - 입력한 항목만 표시, 아무것도 없으면 None"""
     date_str = date.strftime('%Y-%m-%d')
     day_name = date.strftime('%A')
     
-    # 기존 파일 읽기 또는 새로 생성
-    if os.path.exists(week_file):
-        with open(week_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-    else:
-        content = f"# Week {week} - {year}.{month:02d}\n\n"
-    
-    # 새로운 날짜 섹션 생성 - 입력한 것만!
     day_section = f"## {date_str} ({day_name})\n\n"
     has_content = False
     
@@ -180,136 +193,48 @@ def update_weekly_log(date, data):
     
     # 아무것도 입력 안 했으면 기록 안 함
     if not has_content:
+        return None
+    
+    return day_section + "\n"
+
+@traced
+def update_weekly_log(date, data, batch):
+    """주간 로그 업데이트 - 입력한 항목만 표시"""
+    day_section = render_day_section(date, data)
+    date_str = date.strftime('%Y-%m-%d')
+    if day_section is None:
         print(f"⚠️ No activity recorded for {date_str}")
         return
     
-    day_section += "\n"
-    
-    # 기존 파일에서 해당 날짜 섹션 찾아서 제거
-    # f-string에서 백슬래시를 사용할 수 없으므로 변수로 분리
-    date_pattern = f"## {date_str}[^\\n]*\\n.*?(?=\\n## |\\Z)"
-    content = re.sub(date_pattern, '', content, flags=re.DOTALL)
-    
-    # 날짜순 정렬을 위해 모든 섹션 파싱
-    sections = {}
-    header = content.split('\n## ')[0]  # "# Week XX - YYYY.MM" 부분
-    
-    # 기존 섹션들 추출
-    section_pattern = r'## (\d{4}-\d{2}-\d{2})[^\\n]*\\n(.*?)(?=\\n## |\\Z)'
-    for match in re.finditer(section_pattern, content, re.DOTALL):
-        section_date = match.group(1)
-        section_content = match.group(2).strip()
-        # f-string에서 백슬래시 사용 불가하므로 변수로 분리
-        full_match = match.group(0)
-        first_line = full_match.split('\n', 1)[0]
-        sections[section_date] = f"## {first_line}\n\n{section_content}\n\n"
-    
-    # 새 섹션 추가
-    sections[date_str] = day_section
-    
-    # 날짜순 정렬해서 재구성
-    sorted_sections = sorted(sections.items())
-    new_content = header + "\n"
-    for _, section in sorted_sections:
-        new_content += section
-    
-    with open(week_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
-
-def update_stats(date, data):
-    """통계 JSON 업데이트"""
-    stats_file = "logs/stats.json"
-    ensure_dir("logs")
-    
-    # 기존 통계 읽기
-    if os.path.exists(stats_file):
-        with open(stats_file, 'r', encoding='utf-8') as f:
-            stats = json.load(f)
-    else:
-        stats = {
-            'daily': {},
-            'weekly': {},
-            'monthly': {},
-            'yearly': {},
-            'books': []
-        }
-    
+    # 해당 날짜 섹션만 교체/삽입 (마지막 날짜 뒤면 append)
+    upsert_section(week_file_path(date), date_str, day_section, week_file_header(date), batch)
+
+@traced
+def update_stats(date, data, batch, expect_version=None):
+    """
+    통계 업데이트 - 이벤트 로그에 한 줄 추가하고 필요하면 스냅샷으로 접기.
+    반영된 최신 stats를 반환 (README 단계가 그대로 받음)
+    """
+    stats, compacted = store.record_events([store.make_event(date, data)], batch, expect_version=expect_version)
+    if compacted:
+        print("🗜️ Compacted event log into stats.json")
+    return stats
+
+def book_file_path(title):
+    """책 제목으로 독서 로그 파일 경로 생성 (특수문자 제거)"""
+    return f"books/{store.book_slug(title)}.md"
+
+def book_file_header(title):
+    """새 독서 로그 파일의 헤더"""
+    return f"# {title}\n\n## 📖 독서 기록\n\n"
+
+def render_book_note(date, data):
+    """독서 노트 섹션 생성"""
     date_str = date.strftime('%Y-%m-%d')
-    year_str = str(date.year)
-    month_str = f"{date.year}-{date.month:02d}"
-    week_str = f"{date.year}-W{get_week_number(date):02d}"
-    
-    # ⭐ 중요: daily 업데이트 BEFORE old_data 가져오기
-    old_data = stats['daily'].get(date_str, {'fitness': 0, 'english': 0, 'research': 0, 'reading': None})
-    
-    # 일간 통계 업데이트
-    stats['daily'][date_str] = {
-        'fitness': data['fitness']['time'],
-        'english': data['english']['time'],
-        'research': data['research']['time'],
-        'reading': data['reading']['title'] if data['reading']['title'] else None
-    }
-    
-    # 주간 통계
-    if week_str not in stats['weekly']:
-        stats['weekly'][week_str] = {'fitness': 0, 'english': 0, 'research': 0, 'days': 0}
-    
-    # 기존 데이터 빼고 새 데이터 더하기
-    stats['weekly'][week_str]['fitness'] = stats['weekly'][week_str]['fitness'] - old_data.get('fitness', 0) + data['fitness']['time']
-    stats['weekly'][week_str]['english'] = stats['weekly'][week_str]['english'] - old_data.get('english', 0) + data['english']['time']
-    stats['weekly'][week_str]['research'] = stats['weekly'][week_str]['research'] - old_data.get('research', 0) + data['research']['time']
-    
-    # 월간 통계
-    if month_str not in stats['monthly']:
-        stats['monthly'][month_str] = {'fitness': 0, 'english': 0, 'research': 0, 'days': 0}
-    
-    stats['monthly'][month_str]['fitness'] = stats['monthly'][month_str]['fitness'] - old_data.get('fitness', 0) + data['fitness']['time']
-    stats['monthly'][month_str]['english'] = stats['monthly'][month_str]['english'] - old_data.get('english', 0) + data['english']['time']
-    stats['monthly'][month_str]['research'] = stats['monthly'][month_str]['research'] - old_data.get('research', 0) + data['research']['time']
-    
-    # 연간 통계
-    if year_str not in stats['yearly']:
-        stats['yearly'][year_str] = {'fitness': 0, 'english': 0, 'research': 0, 'days': 0}
-    
-    stats['yearly'][year_str]['fitness'] = stats['yearly'][year_str]['fitness'] - old_data.get('fitness', 0) + data['fitness']['time']
-    stats['yearly'][year_str]['english'] = stats['yearly'][year_str]['english'] - old_data.get('english', 0) + data['english']['time']
-    stats['yearly'][year_str]['research'] = stats['yearly'][year_str]['research'] - old_data.get('research', 0) + data['research']['time']
-    stats['yearly'][year_str]['days'] = len([d for d in stats['daily'] if d.startswith(year_str)])
-    
-    # 독서 목록 - 제목이 실제로 있을 때만
-    if data['reading']['title'] and data['reading']['title'].strip():
-        book_exists = False
-        for book in stats['books']:
-            if book['title'] == data['reading']['title']:
-                book['last_read'] = date_str
-                if data['reading']['note']:
-                    if 'notes' not in book:
-                        book['notes'] = []
-                    book['notes'].append({
-                        'date': date_str,
-                        'note': data['reading']['note']
-                    })
-                book_exists = True
-                break
-        
-        if not book_exists:
-            new_book = {
-                'title': data['reading']['title'],
-                'first_read': date_str,
-                'last_read': date_str,
-                'notes': []
-            }
-            if data['reading']['note']:
-                new_book['notes'].append({
-                    'date': date_str,
-                    'note': data['reading']['note']
-                })
-            stats['books'].append(new_book)
-    
-    with open(stats_file, 'w', encoding='utf-8') as f:
-        json.dump(stats, f, ensure_ascii=False, indent=2)
+    return f"### {date_str}\n{data['reading']['note']}\n\n"
 
-def update_book_log(data):
+@traced
+def update_book_log(data, batch, date=None):
     """독서 로그 업데이트"""
     if not data['reading']['title']:
         return
@@ -318,29 +243,24 @@ def update_book_log(data):
     if not data['reading']['title'].strip():
         return
     
-    books_dir = "books"
-    ensure_dir(books_dir)
-    
-    # 파일명 생성 (특수문자 제거)
-    safe_title = re.sub(r'[^\w\s-]', '', data['reading']['title'])
-    safe_title = re.sub(r'[-\s]+', '-', safe_title).lower()
-    book_file = f"{books_dir}/{safe_title}.md"
+    book_file = book_file_path(data['reading']['title'])
     
     # 기존 파일 읽기
     if os.path.exists(book_file):
         with open(book_file, 'r', encoding='utf-8') as f:
             content = f.read()
     else:
-        content = f"# {data['reading']['title']}\n\n## 📖 독서 기록\n\n"
+        content = book_file_header(data['reading']['title'])
     
-    # 오늘 날짜 섹션 추가
+    # 기록 날짜 섹션 추가 (날짜가 없으면 오늘, 같은 날짜의 같은 메모가 이미 있으면 그대로)
     if data['reading']['note']:
-        date_str = datetime.now(KST).strftime('%Y-%m-%d')
-        note_section = f"### {date_str}\n{data['reading']['note']}\n\n"
-        content += note_section
+        content = append_book_note(content, render_book_note(date or datetime.now(KST), data))
     
-    with open(book_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    batch.write(book_file, content)
+
+def append_book_note(content, note):
+    """issue를 고쳐 다시 반영해도 같은 메모 섹션이 두 번 붙지 않도록"""
+    return content if note in content else content + note
 
 def parse_date_from_body(body):
     """Issue 본문에서 날짜 추출"""
@@ -369,7 +289,7 @@ def parse_date_from_body(body):
                         month, day = int(groups[0]), int(groups[1])
                     
                     try:
-                        return KST.localize(datetime(year, month, day))
+                        return datetime(year, month, day, tzinfo=KST)
                     except ValueError:
                         continue
     
@@ -398,25 +318,237 @@ def parse_date_from_title(title):
                 month, day = int(groups[0]), int(groups[1])
             
             try:
-                return KST.localize(datetime(year, month, day))
+                return datetime(year, month, day, tzinfo=KST)
             except ValueError:
                 continue
     
     return None
 
-def main():
-    # 환경 변수에서 Issue 내용 가져오기
-    issue_body = os.environ.get('ISSUE_BODY', '')
-    issue_title = os.environ.get('ISSUE_TITLE', '')
+def resolve_date(issue_body, issue_title, fallback=None):
+    """본문 → 제목 → fallback(없으면 현재 시간) 순으로 기록 날짜 결정"""
+    date = parse_date_from_body(issue_body)
+    if date is None:
+        date = parse_date_from_title(issue_title)
+    if date is None and fallback is not None:
+        date = fallback
+    return date
+
+def parse_created_at(created_at):
+    """GitHub created_at(ISO 8601)을 KST 날짜로 변환"""
+    if not created_at:
+        return None
+    try:
+        created = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if created.tzinfo is None:
+        return created.replace(tzinfo=KST)
+    return created.astimezone(KST)
+
+def read_issues(stream):
+    """JSONL/NDJSON 스트림에서 issue 목록 읽기 (title, body, number, created_at)"""
+    issues = []
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            issue = json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"⚠️ Skipping line {line_no}: {e}")
+            continue
+        if isinstance(issue, dict):
+            issues.append(issue)
+    # 같은 날짜를 여러 번 기록했다면 나중 issue가 이기도록 번호순 정렬
+    issues.sort(key=lambda issue: issue.get('number') or 0)
+    return issues
+
+PARSE_CACHE_FILE = "logs/.parse-cache.json"
+PARSE_CACHE_SIZE = 512  # 최근에 반영한 순서로 유지할 issue 수
+
+def normalize_issue_text(text):
+    """주석, 줄바꿈 형식, 앞뒤 공백, 빈 줄 차이는 무시하도록 정규화"""
+    text = COMMENT_RE.sub('', text or '').replace('\r\n', '\n')
+    lines = (line.strip() for line in text.split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+def issue_digest(issue_title, issue_body):
+    """정규화한 제목 + 본문의 해시"""
+    import hashlib
     
-    if not issue_body:
-        print("No issue body found")
-        return
+    content = normalize_issue_text(issue_title) + '\0' + normalize_issue_text(issue_body)
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+@traced
+def load_parse_cache(cache_file=PARSE_CACHE_FILE):
+    """issue 번호 → {digest, date, data} (파일이 없거나 깨졌으면 빈 캐시)"""
+    if not os.path.exists(cache_file):
+        return {}
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_parse_cache(cache, batch, cache_file=PARSE_CACHE_FILE):
+    batch.write(cache_file, json.dumps(cache, ensure_ascii=False, separators=(',', ':')))
+
+def cache_lookup(cache, issue_number):
+    """
+    캐시 항목 조회 - 순서는 바꾸지 않음 (그대로인 issue를 다시 받아도
+    캐시 파일이 바뀌어 커밋되지 않도록, 순서는 cache_store만 갱신)
+    """
+    return cache.get(str(issue_number))
+
+def cache_store(cache, issue_number, digest, date, data, max_size=PARSE_CACHE_SIZE):
+    """파싱 결과 저장, 가장 오래전에 반영한 항목부터 제거"""
+    key = str(issue_number)
+    cache.pop(key, None)
+    cache[key] = {'digest': digest, 'date': date.strftime('%Y-%m-%d'), 'data': data}
+    while len(cache) > max_size:
+        del cache[next(iter(cache))]
+
+def cached_date(entry):
+    """캐시에 저장된 기록 날짜를 KST datetime으로"""
+    return datetime.fromisoformat(entry['date']).replace(tzinfo=KST)
+
+def write_github_output(name, value):
+    """GitHub Actions step output 기록 (로컬 실행이면 무시)"""
+    output_file = os.environ.get('GITHUB_OUTPUT')
+    if output_file:
+        with open(output_file, 'a', encoding='utf-8') as f:
+            f.write(f"{name}={value}\n")
+
+@traced
+def ingest_batch(issues, cache=None, expect_version=None):
+    """
+    여러 issue를 한 프로세스에서 처리:
+    - 모든 issue를 파싱해서 메모리에서 병합
+    - 변경된 week-NN.md, 책 파일은 각각 한 번만 기록
+    - 이벤트는 한 번에 이벤트 로그 끝에 append (로그 꼬리가 COMPACT_THRESHOLD에 닿을 때만
+      스냅샷으로 compaction - 실행마다 올해 파티션과 manifest를 다시 써서 커밋하지 않도록)
+    - cache가 주어지면 이미 반영된 그대로인 issue(텍스트가 같거나, 달라도 같은 날짜/내용으로
+      파싱되는 issue)는 건너뜀 - 반영할 이벤트가 없으면 통계는 건드리지 않고,
+      캐시 항목이 바뀌지 않았으면 캐시 파일도 다시 쓰지 않음
+    - 모든 파일은 하나의 WriteBatch로 한 번에 commit
+    - expect_version이 주어지면 그 사이 다른 쓰기가 있었을 때 VersionConflict
+    반영한 issue가 있으면 최신 stats, 없으면 None
+    """
+    started = time.perf_counter()
+    events = []
+    week_files = {}
+    book_files = {}
+    processed = 0
+    unchanged = 0
+    cache_changed = False
+    
+    for issue in issues:
+        issue_body = issue.get('body') or ''
+        issue_title = issue.get('title') or ''
+        issue_number = issue.get('number')
+        if not issue_body:
+            continue
+        if not is_daily_log(issue_body):
+            print(f"⚠️ Skipping issue #{issue_number}: no habit lines")
+            continue
+        
+        digest = None
+        entry = None
+        if cache is not None and issue_number is not None:
+            digest = issue_digest(issue_title, issue_body)
+            entry = cache_lookup(cache, issue_number)
+            if entry is not None and entry['digest'] == digest:
+                unchanged += 1
+                continue
+        
+        # 날짜가 없는 issue를 고쳐도 처음 기록한 날짜에 그대로 (ingest_issue와 같음)
+        fallback = cached_date(entry) if entry else parse_created_at(issue.get('created_at') or issue.get('createdAt'))
+        date = resolve_date(issue_body, issue_title, fallback)
+        if date is None:
+            print(f"⚠️ Skipping issue #{issue_number}: no date")
+            continue
+        data = parse_issue_body(issue_body)
+        date_str = date.strftime('%Y-%m-%d')
+        if digest is not None:
+            changed = entry is None or entry['date'] != date_str or entry['data'] != data
+            cache_store(cache, issue_number, digest, date, data)
+            cache_changed = True
+            if not changed:
+                # 텍스트는 바뀌었지만 파싱 결과가 같음 - 이벤트나 독서 메모를 다시 붙이지 않음
+                unchanged += 1
+                continue
+        
+        # 주간 로그
+        day_section = render_day_section(date, data)
+        if day_section is not None:
+            week_file = week_file_path(date)
+            if week_file not in week_files:
+                if os.path.exists(week_file):
+                    week_files[week_file] = WeekFile.load(week_file)
+                else:
+                    week_files[week_file] = WeekFile(week_file_header(date).encode('utf-8'))
+            week_files[week_file].set(date_str, day_section)
+        
+        # 통계
+        events.append(store.make_event(date, data))
+        
+        # 독서 로그
+        title = data['reading']['title']
+        if title and title.strip():
+            book_file = book_file_path(title)
+            if book_file not in book_files:
+                if os.path.exists(book_file):
+                    with open(book_file, 'r', encoding='utf-8') as f:
+                        book_files[book_file] = f.read()
+                else:
+                    book_files[book_file] = book_file_header(title)
+            if data['reading']['note']:
+                book_files[book_file] = append_book_note(book_files[book_file], render_book_note(date, data))
+        
+        processed += 1
+    
+    # 변경된 파일만 한 번씩, 모두 함께 commit
+    with WriteBatch() as batch:
+        for path, week in week_files.items():
+            batch.write(path, week.to_bytes())
+        for path, content in book_files.items():
+            batch.write(path, content)
+        stats = None
+        if events:
+            stats, _ = store.record_events(events, batch, expect_version=expect_version)
+        if cache_changed:
+            save_parse_cache(cache, batch)
+    
+    elapsed = time.perf_counter() - started
+    rate = processed / elapsed if elapsed > 0 else 0
+    print(f"✅ Ingested {processed}/{len(issues)} issues in {elapsed:.2f}s "
+          f"({rate:.0f} issues/s) → {len(week_files)} week file(s), {len(book_files)} book file(s)"
+          + (f", {unchanged} unchanged" if unchanged else ""))
+    return stats if processed else None
+
+@traced
+def ingest_issue(issue_title, issue_body, issue_number, cache=None, expect_version=None):
+    """
+    issue 하나 처리, 로그가 바뀌었으면 최신 stats (아니면 None)
+    - cache가 주어지면 이미 반영된 그대로인 issue는 건너뜀
+    - expect_version이 주어지면 그 사이 다른 쓰기가 있었을 때 VersionConflict
+    """
+    if not is_daily_log(issue_body):
+        print(f"⏭️ Issue #{issue_number} has no habit lines, skipping")
+        return None
     
-    # 본문에서 먼저 날짜 찾기, 없으면 제목에서, 그것도 없으면 현재 시간
-    now = parse_date_from_body(issue_body)
-    if now is None:
-        now = parse_date_from_title(issue_title)
+    # 같은 issue가 실질적으로 바뀌지 않았으면 (예: 주석만 수정) 파일을 건드리지 않음
+    entry = None
+    if cache is not None:
+        digest = issue_digest(issue_title, issue_body)
+        entry = cache_lookup(cache, issue_number)
+        if entry is not None and entry['digest'] == digest:
+            print(f"⏭️ Issue #{issue_number} unchanged, skipping")
+            return None
+    
+    # 본문에서 먼저 날짜 찾기, 없으면 제목에서, 그것도 없으면 처음 기록한 날짜 또는 현재 시간
+    now = resolve_date(issue_body, issue_title, cached_date(entry) if entry else None)
     if now is None:
         now = datetime.now(KST)
         print(f"Using current date: {now.strftime('%Y-%m-%d')}")
@@ -426,12 +558,105 @@ def main():
     # Issue 파싱
     data = parse_issue_body(issue_body)
     
-    # 로그 업데이트
-    update_weekly_log(now, data)
-    update_stats(now, data)
-    update_book_log(data)
+    if cache is not None:
+        changed = entry is None or entry['date'] != now.strftime('%Y-%m-%d') or entry['data'] != data
+        cache_store(cache, issue_number, digest, now, data)
+        if not changed:
+            # 텍스트는 바뀌었지만 파싱 결과가 같음
+            with WriteBatch() as batch:
+                save_parse_cache(cache, batch)
+            print(f"⏭️ Issue #{issue_number} parsed to the same log, skipping")
+            return None
+    
+    # 로그 업데이트 - 주간 로그, 통계, 독서 로그, 캐시를 한 번에 commit
+    with WriteBatch() as batch:
+        update_weekly_log(now, data, batch)
+        stats = update_stats(now, data, batch, expect_version)
+        update_book_log(data, batch, now)
+        if cache is not None:
+            save_parse_cache(cache, batch)
     
     print(f"✅ Log updated for {now.strftime('%Y-%m-%d')}")
+    return stats
+
+INGEST_RETRIES = 3
+
+def run_locked(work):
+    """
+    store.LOCK_FILE을 잡고 work(현재 버전)을 실행.
+    잠금을 거치지 않은 쓰기와 겹쳐 VersionConflict가 나면 파일을 다시 읽어 재시도
+    """
+    with file_lock(store.LOCK_FILE):
+        for attempt in range(1, INGEST_RETRIES + 1):
+            try:
+                return work(store.current_version())
+            except store.VersionConflict as e:
+                if attempt == INGEST_RETRIES:
+                    raise
+                print(f"⚠️ {e}, retrying ({attempt}/{INGEST_RETRIES})")
+
+def ingest_stream(source, use_cache=True, outputs=False):
+    """
+    JSONL 파일(또는 '-': stdin)의 issue들을 잠금 안에서 한 번에 반영.
+    outputs면 'changed', 'issues' step output 기록. 바뀌었으면 최신 stats (아니면 None)
+    """
+    if source == '-':
+        issues = read_issues(sys.stdin)
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            issues = read_issues(f)
+    # 시도마다 캐시를 다시 읽어야 재시도 때 이미 처리한 것으로 착각하지 않음
+    stats = run_locked(lambda version: ingest_batch(
+        issues, load_parse_cache() if use_cache else None, version))
+    if outputs:
+        # 닫는 단계가 쓰므로 daily log인 issue만 (다른 issue에 완료 댓글을 달고 닫지 않도록)
+        numbers = sorted({str(issue['number']) for issue in issues
+                          if issue.get('number') is not None and is_daily_log(issue.get('body'))}, key=int)
+        write_github_output('changed', 'true' if stats is not None else 'false')
+        write_github_output('issues', ','.join(numbers))
+    return stats
+
+def ingest_env(use_cache=True):
+    """환경 변수(ISSUE_BODY, ISSUE_TITLE, ISSUE_NUMBER)의 issue 하나 반영, 바뀌었으면 최신 stats"""
+    issue_body = os.environ.get('ISSUE_BODY', '')
+    issue_title = os.environ.get('ISSUE_TITLE', '')
+    issue_number = os.environ.get('ISSUE_NUMBER', '')
+    
+    if not issue_body:
+        print("No issue body found")
+        return None
+    
+    use_cache = use_cache and issue_number
+    stats = run_locked(lambda version: ingest_issue(
+        issue_title, issue_body, issue_number, load_parse_cache() if use_cache else None, version))
+    write_github_output('changed', 'true' if stats is not None else 'false')
+    return stats
+
+def main():
+    import argparse
+    
+    arg_parser = argparse.ArgumentParser(description="Daily log issue parser")
+    arg_parser.add_argument('--batch', metavar='FILE',
+                            help="JSONL/NDJSON issue stream to ingest in one run ('-' for stdin)")
+    arg_parser.add_argument('--queue', metavar='FILE',
+                            help="pending issues (JSONL, '-' for stdin) to apply in one serialized batch; "
+                                 "sets the 'changed' and 'issues' step outputs")
+    arg_parser.add_argument('--compact', action='store_true',
+                            help="fold logs/events.jsonl into logs/stats.json and exit")
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help=f"ignore {PARSE_CACHE_FILE} and reprocess every issue")
+    instrument.add_arguments(arg_parser)
+    args = arg_parser.parse_args()
+    
+    with instrument.session("parser", args.trace, args.profile):
+        if args.compact:
+            with file_lock(store.LOCK_FILE):
+                store.compact()
+            print("✅ Event log compacted")
+        elif args.queue or args.batch:
+            ingest_stream(args.queue or args.batch, not args.no_cache, outputs=bool(args.queue))
+        else:
+            ingest_env(not args.no_cache)
 
-if __name__ == '__main__':
+if __name__ == "__main__":
     main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+issue 반영 파이프라인: 파싱 → 주간 로그 → 통계 → 독서 로그 → README
+
+parser.py(반영)와 dashboard.py(README)를 한 프로세스에서 잇는다.
+통계 단계(parser.update_stats)가 돌려준 stats를 README 단계가 그대로 받으므로
+stats.json을 다시 읽지 않는다. 반영과 렌더링은 같은 잠금 안에서 하므로
+동시에 실행돼도 README가 더 오래된 통계로 덮어써지지 않는다.
+
+    python scripts/pipeline.py                 # 환경 변수의 issue 하나
+    python scripts/pipeline.py --queue -       # 대기 중인 issue들 (JSONL)
+"""
+
+import instrument
+import parser
+import store
+from atomic import file_lock
+from instrument import traced
+
+
+@traced
+def render(stats=None, force=False):
+    """README 단계 (stats가 없으면 입력이 바뀌었을 때만 디스크에서 읽어 렌더링)"""
+    # 렌더링할 때만 dashboard(columns, packed)를 import
+    import dashboard
+    return dashboard.update_readme(force, stats)
+
+
+def run_issue(use_cache=True, force_render=False):
+    """환경 변수(ISSUE_*)의 issue 하나를 반영하고 README 갱신, 반영한 최신 stats 반환"""
+    with file_lock(store.LOCK_FILE):
+        stats = parser.ingest_env(use_cache)
+        render(stats, force_render)
+    return stats
+
+
+def run_queue(source, use_cache=True, force_render=False):
+    """대기 중인 issue들(JSONL 파일, '-'면 stdin)을 한 번에 반영하고 README 갱신"""
+    with file_lock(store.LOCK_FILE):
+        stats = parser.ingest_stream(source, use_cache, outputs=True)
+        render(stats, force_render)
+    return stats
+
+
+def main():
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Ingest daily log issues and update README in one process")
+    arg_parser.add_argument("--queue", metavar="FILE",
+                            help="pending issues (JSONL, '-' for stdin) to apply in one serialized batch")
+    arg_parser.add_argument("--no-cache", action="store_true",
+                            help=f"ignore {parser.PARSE_CACHE_FILE} and reprocess every issue")
+    arg_parser.add_argument("--force-render", action="store_true",
+                            help="render README even if nothing changed")
+    instrument.add_arguments(arg_parser)
+    args = arg_parser.parse_args()
+
+    with instrument.session("pipeline", args.trace, args.profile):
+        if args.queue:
+            run_queue(args.queue, not args.no_cache, args.force_render)
+        else:
+            run_issue(not args.no_cache, args.force_render)
+
+
+if __name__ == "__main__":
+    main()
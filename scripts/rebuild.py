@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+주간 로그(원본)에서 stats.json 다시 만들기
+
+logs/*/*/week-*.md의 날짜 섹션을 하루치 기록으로 되읽어(파일마다 프로세스 풀에서 병렬)
+날짜순으로 모은 뒤 빈 통계에 재생해 daily/weekly/monthly/yearly/books/streak를 새로 만든다.
+같은 입력이면 항상 같은 결과(결정적)이다.
+
+    python scripts/rebuild.py            # stats.json 교체 (이벤트 로그는 비움)
+    python scripts/rebuild.py --check    # 비교만, 다르면 exit 1
+    python scripts/rebuild.py --jobs 1   # 프로세스 풀 없이
+
+현재 통계에만 있는 기록이 있으면(주간 로그가 유실된 경우) --force 없이는 교체하지 않는다.
+
+주간 로그에는 아무것도 하지 않은 날의 섹션이 없으므로 그런 날은 daily에서 빠진다
+(합계, 활동일수, 스트릭 길이에는 영향 없음).
+"""
+
+import os
+import sys
+import glob
+import time
+
+import store
+from atomic import WriteBatch, file_lock
+from parser import parse_time
+from store import HABITS
+from weeklog import WeekFile, section_entries
+
+WEEK_GLOB = "logs/*/*/week-*.md"
+
+# 파일이 이보다 적으면 프로세스를 띄우는 비용이 더 커서 그냥 순서대로 읽음
+POOL_MIN_FILES = 32
+
+
+def parse_week_file(path: str) -> list:
+    """week 파일 하나를 make_event와 같은 모양의 하루치 기록 목록으로"""
+    events = []
+    for date_str, section in WeekFile.load(path).sections():
+        entries = section_entries(section)
+        title, note = entries.get("reading", (None, None))
+        event = {"date": date_str}
+        for k in HABITS:
+            event[k] = parse_time(entries[k][0]) if k in entries else 0
+        event["reading"] = title or None
+        event["note"] = note or None
+        events.append(event)
+    return events
+
+
+def scan(paths: list, jobs: int = None) -> list:
+    """모든 week 파일의 기록을 (날짜, 파일 순서)로 정렬해 반환 - 같은 날짜가 여러 번이면 뒤 파일이 이김"""
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(paths) >= POOL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            per_file = list(pool.map(parse_week_file, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+    else:
+        per_file = [parse_week_file(path) for path in paths]
+
+    keyed = [(event["date"], i, event) for i, events in enumerate(per_file) for event in events]
+    keyed.sort(key=lambda item: (item[0], item[1]))
+    return [event for _, _, event in keyed]
+
+
+def rebuild(paths: list = None, jobs: int = None) -> dict:
+    """week 파일들에서 새 통계 구조 생성 (meta.seq는 0)"""
+    if paths is None:
+        paths = sorted(glob.glob(WEEK_GLOB))
+    return store.replay(store.new_stats(), scan(paths, jobs))
+
+
+def diff_daily(current: dict, rebuilt: dict) -> list:
+    """daily 차이를 사람이 읽을 줄로 (활동 없는 날은 양쪽 다 없는 것으로 봄)"""
+    def active(daily):
+        return {d: v for d, v in daily.items() if store.is_active(v) or v.get("reading")}
+
+    cur, new = active(current.get("daily", {})), active(rebuilt["daily"])
+    lines = []
+    for d in sorted(cur.keys() | new.keys()):
+        a = {k: cur.get(d, {}).get(k) or 0 for k in HABITS + ("reading",)}
+        b = {k: new.get(d, {}).get(k) or 0 for k in HABITS + ("reading",)}
+        if a != b:
+            lines.append(f"{d}: stats {a} != week log {b}")
+    return lines
+
+
+def main():
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Rebuild logs/stats.json from the weekly markdown logs")
+    arg_parser.add_argument("--check", action="store_true", help="only compare with the current stats; exit 1 on drift")
+    arg_parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    arg_parser.add_argument("--force", action="store_true", help="replace stats.json even if it differs from the week logs")
+    args = arg_parser.parse_args()
+
+    with file_lock(store.LOCK_FILE):
+        started = time.perf_counter()
+        paths = sorted(glob.glob(WEEK_GLOB))
+        events = scan(paths, args.jobs)
+        stats = store.replay(store.new_stats(), events)
+        elapsed = time.perf_counter() - started
+        print(f"🔁 Rebuilt {len(stats['daily'])} days from {len(paths)} week file(s) in {elapsed:.2f}s",
+              file=sys.stderr)
+
+        try:
+            current = store.load_stats()
+        except (OSError, ValueError) as e:  # 깨진 stats.json이나 없어진 파티션 - 다시 만드는 것이 목적
+            print(f"⚠️ Current stats unreadable: {e}", file=sys.stderr)
+            current = None
+
+        drift = diff_daily(current, stats) if current is not None else []
+        for line in drift[:20]:
+            print(line)
+        if drift:
+            print(f"⚠️ {len(drift)} day(s) differ from the week logs", file=sys.stderr)
+        if args.check:
+            if drift or current is None:
+                sys.exit(1)
+            print("✅ stats match the week logs", file=sys.stderr)
+            return
+        if drift and not args.force:
+            print("❌ Not replacing stats.json (use --force to trust the week logs)", file=sys.stderr)
+            sys.exit(1)
+
+        # 지금까지의 이벤트는 모두 week 파일에도 반영되어 있으므로 버전을 이어받고 로그는 비움
+        # (stats.json이 깨졌으면 로그의 마지막 seq부터)
+        stats["meta"]["seq"] = current["meta"]["seq"] if current is not None else store.ledger_bounds()[1]
+        with WriteBatch() as batch:
+            store.replace_snapshot(stats, batch)
+        print("✅ stats.json rebuilt", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
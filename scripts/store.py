@@ -0,0 +1,704 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+통계 저장소: append-only 이벤트 로그 + 스냅샷
+
+- logs/events.jsonl : 기록된 날(또는 수정)마다 한 줄씩 추가되는 이벤트 로그
+- logs/stats.json   : 이벤트를 접어 넣은(compaction) 스냅샷의 manifest
+                      (meta, 연도별/전체 합계, 스트릭, 책 색인 - 연수에만 비례하는 작은 파일)
+- logs/stats/YYYY.json: 연도 파티션 (그 해의 daily와 그 해 날짜들의 weekly/monthly 합계)
+- books/*.md        : parser가 쓰는 책별 독서 메모 (스냅샷에는 책 색인만)
+
+쓰기는 이벤트 한 줄 append(O(1))이고, 읽기는 스냅샷 + 아직 접히지 않은
+로그 꼬리(tail)를 재생한다. 로그가 COMPACT_THRESHOLD를 넘으면 스냅샷으로 접는다.
+읽을 때는 필요한 연도의 파티션만 읽을 수 있고(load_stats(years=...)), 접을 때는
+바뀐 연도의 파티션과 manifest만 다시 쓴다 (지난 해 파티션은 고치지 않는 한 그대로).
+
+동시 실행: 쓰는 쪽은 LOCK_FILE을 잡고, 마지막 seq를 버전(etag)으로 삼아
+읽은 뒤 다른 쓰기가 끼어들었으면 VersionConflict로 거절한다 (optimistic check).
+"""
+
+import os
+import re
+import json
+from datetime import date, datetime
+
+from atomic import WriteBatch
+from instrument import traced
+
+STATS_FILE = "logs/stats.json"
+EVENTS_FILE = "logs/events.jsonl"
+LOCK_FILE = "logs/.lock"
+
+# 로그 꼬리가 이 개수를 넘으면 스냅샷으로 compaction
+COMPACT_THRESHOLD = 100
+
+HABITS = ("fitness", "english", "research")
+
+# rollup 스키마 버전: 2부터 days(활동일수)와 active(습관별 활동일수)를 증분 관리,
+# 3부터 weekly 키의 연도가 ISO 연도 (이전 스냅샷은 로드할 때 다시 계산됨)
+ROLLUP_VERSION = 3
+
+# books 스키마 버전: 2부터 제목 → {first_read, last_read, notes(개수)} 색인 (메모 본문은 books/*.md)
+BOOKS_VERSION = 2
+
+
+# -----------------------------
+# Stats structure
+# -----------------------------
+def new_stats() -> dict:
+    """빈 통계 구조"""
+    return {
+        "meta": {"seq": 0, "rollups": ROLLUP_VERSION, "books": BOOKS_VERSION},
+        "daily": {},
+        "weekly": {},
+        "monthly": {},
+        "yearly": {},
+        "books": {},
+        "streak": new_streak(),
+    }
+
+
+def get_week_number(date: datetime) -> int:
+    """ISO 주차 계산"""
+    return date.isocalendar()[1]
+
+
+def week_key(date: datetime) -> str:
+    """ISO 주 키 - 연도도 ISO 연도 (2025-12-29는 2026-W01, 2027-01-01은 2026-W53)"""
+    iso_year, week, _ = date.isocalendar()
+    return f"{iso_year}-W{week:02d}"
+
+
+def month_key(date: datetime) -> str:
+    return f"{date.year}-{date.month:02d}"
+
+
+def year_key(date: datetime) -> str:
+    return str(date.year)
+
+
+def new_rollup() -> dict:
+    return {
+        "fitness": 0,
+        "english": 0,
+        "research": 0,
+        "days": 0,
+        "active": {"fitness": 0, "english": 0, "research": 0},
+    }
+
+
+def is_active(day_data: dict) -> bool:
+    """하루에 어떤 습관이든 기록이 있는지"""
+    return any(int(day_data.get(k, 0) or 0) > 0 for k in HABITS)
+
+
+def apply_rollup_delta(rollup: dict, old_data: dict, new_data: dict) -> None:
+    """
+    rollup에 (new - old) 차이만 반영:
+    - 습관별 시간 합계
+    - days: 하나라도 활동한 날 수
+    - active: 습관별 활동한 날 수
+    """
+    active = rollup.setdefault("active", {k: 0 for k in HABITS})
+    for k in HABITS:
+        old_min = int(old_data.get(k, 0) or 0)
+        new_min = int(new_data.get(k, 0) or 0)
+        rollup[k] = rollup.get(k, 0) - old_min + new_min
+        active[k] = active.get(k, 0) - (old_min > 0) + (new_min > 0)
+    rollup["days"] = rollup.get("days", 0) - is_active(old_data) + is_active(new_data)
+
+
+def rollup_keys(date: datetime) -> tuple:
+    return (("weekly", week_key(date)), ("monthly", month_key(date)), ("yearly", year_key(date)))
+
+
+def rebuild_rollups(stats: dict) -> dict:
+    """daily에서 weekly/monthly/yearly를 처음부터 다시 계산 (스키마 이전용, 모든 연도 파티션을 다시 씀)"""
+    for bucket in ("weekly", "monthly", "yearly"):
+        stats[bucket] = {}
+    empty = {}
+    years = set()
+    for date_str, day_data in stats["daily"].items():
+        try:
+            date = datetime.fromisoformat(date_str)
+        except (TypeError, ValueError):
+            continue
+        for bucket, key in rollup_keys(date):
+            rollup = stats[bucket].setdefault(key, new_rollup())
+            apply_rollup_delta(rollup, empty, day_data)
+        years.add(date_str[:4])
+    stats.setdefault("meta", {})["rollups"] = ROLLUP_VERSION
+    stats["_dirty"] = years
+    return stats
+
+
+def add_rollup(into: dict, rollup: dict) -> dict:
+    """into += rollup (서로 다른 날들의 합계끼리는 그냥 더하면 됨)"""
+    for k in HABITS:
+        into[k] = into.get(k, 0) + rollup.get(k, 0)
+    into["days"] = into.get("days", 0) + rollup.get("days", 0)
+    active = into.setdefault("active", {k: 0 for k in HABITS})
+    for k in HABITS:
+        active[k] = active.get(k, 0) + rollup.get("active", {}).get(k, 0)
+    return into
+
+
+def get_rollup(stats: dict, bucket: str, key: str) -> dict:
+    """저장된 rollup (없으면 0으로 채운 rollup)"""
+    rollup = stats.get(bucket, {}).get(key)
+    return rollup if isinstance(rollup, dict) else new_rollup()
+
+
+# -----------------------------
+# Streak tracker
+# -----------------------------
+def new_streak() -> dict:
+    """
+    스트릭 상태 (달력상 연속 활동일 기준):
+    - run_start/run_end: 가장 최근 연속 구간
+    - best/best_start/best_end: 가장 긴 연속 구간
+    - last_date: 마지막 기록일 (이 날이 run_end이면 current = 구간 길이)
+    """
+    return {"run_start": None, "run_end": None, "best": 0, "best_start": None, "best_end": None, "last_date": None}
+
+
+def _ordinal(date_str: str) -> int:
+    return date.fromisoformat(date_str).toordinal()
+
+
+def _iso(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat()
+
+
+def _scan_runs(stats: dict, first: int, last: int) -> None:
+    """[first, last] 날짜를 하루씩 훑으며 연속 구간과 최고 기록 갱신"""
+    daily = stats["daily"]
+    st = stats["streak"]
+    run_start = None
+    for o in range(first, last + 1):
+        if is_active(daily.get(_iso(o), {})):
+            if run_start is None:
+                run_start = o
+            length = o - run_start + 1
+            st["run_start"], st["run_end"] = _iso(run_start), _iso(o)
+            if length > st["best"]:
+                st["best"], st["best_start"], st["best_end"] = length, _iso(run_start), _iso(o)
+        else:
+            run_start = None
+
+
+def rebuild_streak(stats: dict) -> dict:
+    """daily 전체에서 스트릭 상태를 다시 계산"""
+    stats["streak"] = new_streak()
+    dates = []
+    for date_str in stats["daily"]:
+        try:
+            dates.append(_ordinal(date_str))
+        except (TypeError, ValueError):
+            continue
+    if dates:
+        stats["streak"]["last_date"] = _iso(max(dates))
+        _scan_runs(stats, min(dates), max(dates))
+    return stats
+
+
+def _recompute_streak_from(stats: dict, ordinal: int) -> None:
+    """
+    과거 날짜가 수정됐을 때: 수정된 날이 속한 구간의 시작부터 앞으로만 다시 계산.
+    최고 기록 구간이 그 범위에 걸쳐 있으면 최고 기록이 줄어들 수 있으므로 전체 재계산.
+    """
+    daily = stats["daily"]
+    st = stats["streak"]
+    first = ordinal
+    while is_active(daily.get(_iso(first - 1), {})):
+        first -= 1
+    if st["best_end"] is None or _ordinal(st["best_end"]) >= first:
+        rebuild_streak(stats)
+        return
+    st["run_start"] = st["run_end"] = None
+    _scan_runs(stats, first, _ordinal(st["last_date"]))
+
+
+def update_streak(stats: dict, date_str: str, was_active: bool, now_active: bool) -> None:
+    """
+    기록 하나를 스트릭 상태에 반영:
+    - 마지막 기록일 이후의 새 날짜는 O(1)
+    - 과거 날짜는 활동 여부가 바뀐 경우에만 그 날짜부터 다시 계산
+    """
+    if "streak" not in stats:
+        rebuild_streak(stats)
+        return
+    st = stats["streak"]
+    o = _ordinal(date_str)
+    if st["last_date"] is None or o > _ordinal(st["last_date"]):
+        st["last_date"] = date_str
+        if not now_active:
+            return
+        if st["run_end"] is not None and _ordinal(st["run_end"]) == o - 1:
+            st["run_end"] = date_str
+        else:
+            st["run_start"] = st["run_end"] = date_str
+        length = o - _ordinal(st["run_start"]) + 1
+        if length > st["best"]:
+            st["best"], st["best_start"], st["best_end"] = length, st["run_start"], st["run_end"]
+        return
+    if was_active != now_active:
+        _recompute_streak_from(stats, o)
+
+
+def streak_summary(stats: dict) -> dict:
+    """현재/최고 스트릭 (마지막 기록일이 쉬는 날이면 current = 0)"""
+    st = stats.get("streak") or new_streak()
+    current = 0
+    if st["run_end"] is not None and st["run_end"] == st["last_date"]:
+        current = _ordinal(st["run_end"]) - _ordinal(st["run_start"]) + 1
+    return {"current": current, "best": st["best"]}
+
+
+def make_event(date: datetime, data: dict) -> dict:
+    """parse_issue_body 결과를 이벤트 레코드로 변환"""
+    return {
+        "date": date.strftime("%Y-%m-%d"),
+        "fitness": data["fitness"]["time"],
+        "english": data["english"]["time"],
+        "research": data["research"]["time"],
+        "reading": data["reading"]["title"] if data["reading"]["title"] else None,
+        "note": data["reading"]["note"] or None,
+    }
+
+
+def apply_event(stats: dict, event: dict, track_streak: bool = True) -> dict:
+    """
+    메모리 상의 통계에 이벤트(하루치 기록) 반영
+    (track_streak=False면 스트릭은 건드리지 않으므로 나중에 rebuild_streak 필요)
+    """
+    date_str = event["date"]
+    date = datetime.fromisoformat(date_str)
+
+    # ⭐ 중요: daily 업데이트 BEFORE old_data 가져오기
+    old_data = stats["daily"].get(date_str, {"fitness": 0, "english": 0, "research": 0, "reading": None})
+
+    # 일간 통계 업데이트
+    new_data = {
+        "fitness": event["fitness"],
+        "english": event["english"],
+        "research": event["research"],
+        "reading": event["reading"],
+    }
+    stats["daily"][date_str] = new_data
+
+    # 이 날의 연도 파티션은 메모리에 있고, 다음 저장 때 다시 써야 함
+    year = date_str[:4]
+    stats.setdefault("_years", set()).add(year)
+    stats.setdefault("_dirty", set()).add(year)
+    meta = stats.setdefault("meta", {})
+    if meta.get("first_date") is None or date_str < meta["first_date"]:
+        meta["first_date"] = date_str
+
+    # 주간/월간/연간 통계: 기존 데이터 빼고 새 데이터 더하기 (O(1))
+    for bucket, key in rollup_keys(date):
+        rollup = stats[bucket].setdefault(key, new_rollup())
+        apply_rollup_delta(rollup, old_data, new_data)
+
+    if track_streak:
+        update_streak(stats, date_str, is_active(old_data), is_active(new_data))
+
+    # 독서 색인 - 제목이 실제로 있을 때만 (메모 본문은 parser.update_book_log가 books/*.md에 기록)
+    title = event["reading"]
+    if title and title.strip():
+        book = stats["books"].get(title)
+        if book is None:
+            book = stats["books"][title] = {"first_read": date_str, "last_read": date_str, "notes": 0}
+        else:
+            book["first_read"] = min(book["first_read"], date_str)
+            book["last_read"] = max(book["last_read"], date_str)
+        if event.get("note"):
+            book["notes"] += 1
+
+    if "seq" in event:
+        stats.setdefault("meta", {})["seq"] = event["seq"]
+    return stats
+
+
+# -----------------------------
+# Books
+# -----------------------------
+def book_slug(title: str) -> str:
+    """책 제목 → 파일 이름 (특수문자 제거, 공백/하이픈은 하나의 하이픈으로)"""
+    slug = re.sub(r'[^\w\s-]', '', title)
+    return re.sub(r'[-\s]+', '-', slug).lower()
+
+
+def migrate_books(stats: dict) -> dict:
+    """
+    예전 books 목록(메모 포함)을 색인으로 변환.
+    예전 메모는 update_book_log가 books/*.md에도 써 두었으므로 개수만 남긴다
+    """
+    books = stats.get("books")
+    if isinstance(books, list):
+        index = {}
+        for book in books:
+            if not isinstance(book, dict) or not book.get("title"):
+                continue
+            notes = book.get("notes") or []
+            index[book["title"]] = {
+                "first_read": book.get("first_read") or book.get("last_read") or "",
+                "last_read": book.get("last_read") or book.get("first_read") or "",
+                "notes": len(notes),
+            }
+        stats["books"] = index
+    elif not isinstance(books, dict):
+        stats["books"] = {}
+    stats.setdefault("meta", {})["books"] = BOOKS_VERSION
+    return stats
+
+
+# -----------------------------
+# Snapshot
+# -----------------------------
+def partition_path(year: str, stats_file: str = STATS_FILE) -> str:
+    """연도 파티션 경로 (logs/stats.json → logs/stats/2025.json)"""
+    return f"{os.path.splitext(stats_file)[0]}/{year}.json"
+
+
+@traced
+def read_manifest(stats_file: str = STATS_FILE) -> dict:
+    """stats.json만 읽기 (파티션은 읽지 않음, 없으면 빈 구조)"""
+    if not os.path.exists(stats_file):
+        return new_stats()
+    with open(stats_file, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    manifest.setdefault("meta", {}).setdefault("seq", 0)
+    return manifest
+
+
+def years_to_load(manifest: dict, years, events=()) -> list:
+    """
+    읽을 파티션 연도 목록: years(None이면 전부) + 재생할 events의 연도.
+    rollup 스키마가 바뀌었거나 스트릭이 없으면 다시 계산해야 하므로 전부.
+    과거 날짜의 활동 여부가 바뀌는지는 파티션을 읽어 봐야 알 수 있으므로 rewrites_streak 참고
+    """
+    meta = manifest["meta"]
+    available = meta.get("partitions", [])
+    if years is None or meta.get("rollups") != ROLLUP_VERSION or "streak" not in manifest:
+        return list(available)
+    wanted = set(years) | {e["date"][:4] for e in events}
+    return [y for y in available if y in wanted]
+
+
+def rewrites_streak(stats: dict, events) -> bool:
+    """
+    events를 순서대로 반영하면 마지막 기록일 이전(또는 그날)의 활동 여부가 바뀌는지 -
+    그때만 스트릭을 앞쪽 연도까지 다시 훑어야 하므로 모든 파티션이 필요하다.
+    같은 날을 같은 활동 여부로 고치는 이벤트는 rollup 차이만 반영하면 된다
+    (stats에는 events의 연도 파티션이 읽혀 있어야 함)
+    """
+    last_date = (stats.get("streak") or {}).get("last_date")
+    seen = {}
+    for event in events:
+        date_str = event["date"]
+        was = seen[date_str] if date_str in seen else is_active(stats["daily"].get(date_str, {}))
+        now = seen[date_str] = is_active(event)
+        if last_date is not None and date_str <= last_date and was != now:
+            return True
+        if last_date is None or date_str > last_date:
+            last_date = date_str
+    return False
+
+
+def merge_partition(stats: dict, year: str, part: dict) -> None:
+    """연도 파티션 하나를 메모리의 stats에 합침 (해를 걸친 주는 두 파티션의 합)"""
+    stats["daily"].update(part.get("daily", {}))
+    for bucket in ("weekly", "monthly"):
+        target = stats[bucket]
+        for key, rollup in part.get(bucket, {}).items():
+            add_rollup(target.setdefault(key, new_rollup()), rollup)
+    stats["_years"].add(year)
+
+
+@traced
+def read_partition(year: str, stats_file: str = STATS_FILE) -> dict:
+    with open(partition_path(year, stats_file), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_snapshot(stats_file: str = STATS_FILE, years=None, events=(), manifest: dict = None) -> dict:
+    """
+    스냅샷 읽기 (없으면 빈 구조) - manifest + years_to_load의 파티션.
+    메모리의 stats에는 읽은 연도(_years)와 다음 저장 때 다시 쓸 연도(_dirty)를 표시
+    """
+    stats = manifest if manifest is not None else read_manifest(stats_file)
+    meta = stats["meta"]
+    if "daily" in stats:
+        # 파티션 이전의 단일 파일 스냅샷: 전부 메모리에 있고, 다음 저장 때 연도별로 나눠 씀
+        dates = [d for d in stats["daily"] if isinstance(d, str) and len(d) >= 4]
+        stats["_years"] = {d[:4] for d in dates}
+        stats["_dirty"] = set(stats["_years"])
+        if dates:
+            meta.setdefault("first_date", min(dates))
+    else:
+        stats.update(daily={}, weekly={}, monthly={}, _years=set(), _dirty=set())
+        for year in years_to_load(stats, years, events):
+            merge_partition(stats, year, read_partition(year, stats_file))
+        if rewrites_streak(stats, events):
+            ensure_years(stats, None, stats_file)
+    # 예전 스냅샷은 days가 갱신되지 않았으므로 한 번 다시 계산
+    if meta.get("rollups") != ROLLUP_VERSION:
+        rebuild_rollups(stats)
+    if "streak" not in stats:
+        rebuild_streak(stats)
+    if meta.get("books") != BOOKS_VERSION:
+        migrate_books(stats)
+    return stats
+
+
+def ensure_years(stats: dict, years, stats_file: str = STATS_FILE) -> dict:
+    """
+    아직 읽지 않은 연도의 파티션을 필요할 때 더 읽어 합침 (로그 꼬리의 연도는 이미 읽혀 있음).
+    years가 None이면 모든 파티션
+    """
+    loaded = stats.setdefault("_years", set())
+    available = set(stats.get("meta", {}).get("partitions", []))
+    if years is None:
+        years = available
+    for year in sorted(set(years) - loaded):
+        if year in available:
+            merge_partition(stats, year, read_partition(year, stats_file))
+    return stats
+
+
+def partition_of(stats: dict, year: str) -> dict:
+    """메모리의 stats에서 한 해의 파티션 (weekly/monthly는 그 해 날짜들로 다시 계산)"""
+    prefix = year + "-"
+    part = {"daily": {d: stats["daily"][d] for d in sorted(stats["daily"]) if d.startswith(prefix)},
+            "weekly": {}, "monthly": {}, "yearly": {}}
+    rebuild_rollups(part)
+    del part["meta"], part["_dirty"]
+    return part
+
+
+@traced
+def save_snapshot(stats: dict, batch: WriteBatch, stats_file: str = STATS_FILE) -> None:
+    """
+    스냅샷 저장을 batch에 스테이징 (임시 파일 → rename이므로 잘린 파일이 남지 않음):
+    바뀐 연도(_dirty)의 파티션과 dashboard가 mmap으로 읽는 그 압축 사본(.bin), 그리고 manifest.
+    손대지 않은 해의 파티션은 다시 쓰지 않는다
+    """
+    # packed는 columns를 거쳐 store를 import하므로 여기서 import
+    import packed
+
+    meta = stats.setdefault("meta", {})
+    partitions = set(meta.get("partitions", []))
+    for year in sorted(stats.get("_dirty", ())):
+        part = partition_of(stats, year)
+        stats["yearly"][year] = part.pop("yearly").get(year, new_rollup())
+        path = partition_path(year, stats_file)
+        data = json.dumps(part, ensure_ascii=False, indent=2).encode("utf-8")
+        batch.write(path, data)
+        batch.write(packed.packed_path(path), packed.pack(part, data))
+        partitions.add(year)
+    meta["partitions"] = sorted(partitions)
+    stats["totals"] = new_rollup()
+    for year in meta["partitions"]:
+        add_rollup(stats["totals"], stats["yearly"].get(year, new_rollup()))
+
+    manifest = {k: v for k, v in stats.items()
+                if k not in ("daily", "weekly", "monthly") and not k.startswith("_")}
+    batch.write(stats_file, json.dumps(manifest, ensure_ascii=False, indent=2))
+    # 파티션 이전의 전체 압축 사본은 더 이상 쓰지 않음
+    if os.path.exists(packed.packed_path(stats_file)):
+        batch.remove(packed.packed_path(stats_file))
+    stats["_dirty"] = set()
+
+
+# -----------------------------
+# Event log
+# -----------------------------
+def _read_line_at_end(events_file: str) -> str:
+    """파일을 끝에서부터 읽어 마지막 줄만 반환 (전체를 읽지 않음)"""
+    with open(events_file, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        buf = b""
+        pos = end
+        while pos > 0:
+            step = min(4096, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            if buf.rstrip(b"\n").count(b"\n") >= 1:
+                break
+    lines = buf.rstrip(b"\n").split(b"\n")
+    return lines[-1].decode("utf-8") if lines else ""
+
+
+def _read_first_line(events_file: str) -> str:
+    with open(events_file, "r", encoding="utf-8") as f:
+        return f.readline()
+
+
+def _seq_of(line: str) -> int:
+    try:
+        return int(json.loads(line).get("seq", 0))
+    except (ValueError, AttributeError):
+        return 0
+
+
+def ledger_bounds(events_file: str = EVENTS_FILE) -> tuple:
+    """로그의 (첫 seq, 마지막 seq) - 비어 있으면 (0, 0)"""
+    if not os.path.exists(events_file) or os.path.getsize(events_file) == 0:
+        return (0, 0)
+    return (_seq_of(_read_first_line(events_file)), _seq_of(_read_line_at_end(events_file)))
+
+
+def read_events(after_seq: int = 0, events_file: str = EVENTS_FILE):
+    """seq가 after_seq보다 큰 이벤트를 순서대로 생성"""
+    if not os.path.exists(events_file):
+        return
+    with open(events_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                # 중단된 append로 잘린 마지막 줄은 무시
+                continue
+            if event.get("seq", 0) > after_seq:
+                yield event
+
+
+def next_seq(stats_file: str = STATS_FILE, events_file: str = EVENTS_FILE) -> int:
+    """다음 이벤트에 붙일 seq"""
+    _, last_seq = ledger_bounds(events_file)
+    if last_seq == 0:
+        # 로그가 비어 있으면 스냅샷이 마지막으로 접은 seq부터 이어감
+        last_seq = read_manifest(stats_file)["meta"]["seq"]
+    return last_seq + 1
+
+
+def current_version(stats_file: str = STATS_FILE, events_file: str = EVENTS_FILE) -> int:
+    """저장소 버전: 마지막으로 기록된 이벤트의 seq (이벤트가 하나 기록될 때마다 증가)"""
+    return next_seq(stats_file, events_file) - 1
+
+
+class VersionConflict(Exception):
+    """읽은 뒤 다른 쓰기가 먼저 반영됨"""
+
+
+def _needs_newline(events_file: str) -> bool:
+    """중단된 append로 마지막 줄에 줄바꿈이 없으면 다음 줄과 붙지 않도록"""
+    if not os.path.exists(events_file) or os.path.getsize(events_file) == 0:
+        return False
+    with open(events_file, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) != b"\n"
+
+
+def pending_events(events_file: str = EVENTS_FILE) -> int:
+    """아직 스냅샷으로 접히지 않은 이벤트 수 (근사치: 로그 전체 길이)"""
+    first, last = ledger_bounds(events_file)
+    return 0 if last == 0 else last - first + 1
+
+
+# -----------------------------
+# Read / compaction
+# -----------------------------
+def replay(stats: dict, events) -> dict:
+    """
+    이벤트들을 순서대로 반영.
+    과거 날짜의 활동 여부를 바꾸는 이벤트가 나오면 이벤트마다 스트릭을 다시 계산하지 않고
+    끝에서 한 번만 rebuild (백필 재생이 O(n^2)이 되지 않도록).
+    활동 여부가 그대로인 과거 날짜 수정은 스트릭을 건드리지 않으므로 읽은 연도만으로 충분하다
+    """
+    deferred = False
+    for event in events:
+        if not deferred:
+            last_date = stats.get("streak", {}).get("last_date")
+            deferred = (last_date is not None and event["date"] < last_date
+                        and is_active(stats["daily"].get(event["date"], {})) != is_active(event))
+        apply_event(stats, event, track_streak=not deferred)
+    if deferred:
+        rebuild_streak(stats)
+    return stats
+
+
+@traced
+def load_stats(stats_file: str = STATS_FILE, events_file: str = EVENTS_FILE, years=None,
+               upcoming: list = ()) -> dict:
+    """
+    스냅샷 + 로그 꼬리를 재생한 최신 통계.
+    years가 주어지면 그 연도와 로그 꼬리/upcoming(곧 반영할 이벤트)의 연도 파티션만 읽는다
+    (years_to_load 참고). 나머지 연도는 ensure_years로 나중에 더 읽을 수 있다
+    """
+    manifest = read_manifest(stats_file)
+    tail = list(read_events(manifest["meta"]["seq"], events_file))
+    stats = load_snapshot(stats_file, years, tail + list(upcoming), manifest)
+    return replay(stats, tail)
+
+
+def has_stats(stats_file: str = STATS_FILE, events_file: str = EVENTS_FILE) -> bool:
+    return os.path.exists(stats_file) or os.path.exists(events_file)
+
+
+@traced
+def compact(batch: WriteBatch = None, stats_file: str = STATS_FILE, events_file: str = EVENTS_FILE,
+            extra_events: list = ()) -> dict:
+    """
+    로그(+ 아직 기록하지 않은 extra_events)를 스냅샷으로 접기:
+    같은 batch 안에서 스냅샷 교체 → 로그 비우기 순서로 반영된다. 그 사이에 중단되어도
+    스냅샷의 meta.seq 이하 이벤트는 재생 시 건너뛰므로 중복 반영되지 않는다.
+    로그 꼬리와 extra_events가 건드린 연도의 파티션만 읽고 다시 쓴다.
+    """
+    if batch is None:
+        with WriteBatch() as batch:
+            return compact(batch, stats_file, events_file, extra_events)
+    stats = load_stats(stats_file, events_file, years=(), upcoming=extra_events)
+    replay(stats, extra_events)
+    replace_snapshot(stats, batch, stats_file, events_file)
+    return stats
+
+
+def replace_snapshot(stats: dict, batch: WriteBatch, stats_file: str = STATS_FILE,
+                     events_file: str = EVENTS_FILE) -> None:
+    """stats(로그까지 모두 반영된 상태)를 새 스냅샷으로 쓰고 로그 비우기를 batch에 스테이징"""
+    save_snapshot(stats, batch, stats_file)
+    if os.path.exists(events_file):
+        batch.write(events_file, b"")
+
+
+@traced
+def record_events(events: list, batch: WriteBatch = None, threshold: int = COMPACT_THRESHOLD,
+                  stats_file: str = STATS_FILE, events_file: str = EVENTS_FILE,
+                  expect_version: int = None) -> tuple:
+    """
+    이벤트들에 seq를 붙여 기록을 batch에 스테이징:
+    - 보통은 로그 끝에 append (쓰기는 O(1))
+    - 로그 꼬리가 threshold에 닿으면 대신 스냅샷으로 compaction
+    - expect_version이 주어졌는데 현재 버전과 다르면 VersionConflict
+    (이벤트까지 반영한 최신 stats, compaction 여부) 반환 - 렌더링이 stats.json을 다시 읽지 않도록.
+    stats에는 이벤트와 로그 꼬리가 건드린 연도의 파티션만 읽혀 있다 (나머지는 ensure_years)
+    """
+    if batch is None:
+        with WriteBatch() as batch:
+            return record_events(events, batch, threshold, stats_file, events_file, expect_version)
+
+    seq = next_seq(stats_file, events_file)
+    if expect_version is not None and seq - 1 != expect_version:
+        raise VersionConflict(f"stats version {seq - 1} != expected {expect_version}")
+    numbered = [{"seq": seq + i, **event} for i, event in enumerate(events)]
+    stats = load_stats(stats_file, events_file, years=(), upcoming=numbered)
+    compacting = pending_events(events_file) + len(numbered) >= threshold
+    if compacting:
+        replay(stats, numbered)
+        replace_snapshot(stats, batch, stats_file, events_file)
+    else:
+        lines = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in numbered)
+        if _needs_newline(events_file):
+            lines = "\n" + lines
+        batch.append(events_file, lines)
+        # append는 아직 batch에만 있으므로 새 이벤트는 직접 재생
+        replay(stats, numbered)
+    return stats, compacting
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+주간 로그(logs/YYYY/MM/week-NN.md) 구조 모델
+
+파일을 헤더 + 날짜별 섹션("## YYYY-MM-DD (Day)"부터 다음 날짜 제목 직전까지)으로 보고
+각 섹션의 바이트 오프셋을 날짜로 색인한다. 하루를 넣거나 바꿀 때는
+그 섹션 자리만 잘라 붙이고(splice), 마지막 날짜 뒤에 추가하는 경우는
+끝에 덧붙이기만 한다. 모델은 원본 바이트를 그대로 들고 있으므로
+읽고 다시 쓰면 바이트 단위로 같다(round-trip safe).
+
+디스크에는 atomic.WriteBatch로 파일 단위 교체(임시 파일 → rename)를 하므로
+쓰는 도중 중단되어도 반쯤 쓰인 week 파일이 남지 않는다.
+"""
+
+import os
+import re
+
+from atomic import WriteBatch
+
+# 날짜 섹션 제목 (줄 시작의 "## YYYY-MM-DD ...")
+HEADING_RE = re.compile(rb"^## (\d{4}-\d{2}-\d{2})[^\n]*(?:\n|\Z)", re.MULTILINE)
+
+# 섹션 안의 기록 줄: "💪 **헬스**: 1h 30m - 메모", "📚 **독서**: 제목 - 메모"
+ENTRY_RE = re.compile(r"^(💪|🗣️?|🔬|📚) \*\*[^*\n]+\*\*: ?(.*)$", re.MULTILINE)
+ENTRY_HABITS = {"💪": "fitness", "🗣️": "english", "🗣": "english", "🔬": "research", "📚": "reading"}
+
+
+class WeekFile:
+    """헤더 + 날짜별 섹션 바이트 오프셋 인덱스"""
+
+    def __init__(self, data: bytes = b""):
+        self.data = data
+        self.index = []  # (date_str, start, end) - 파일에 나오는 순서대로
+        self._reindex()
+
+    @classmethod
+    def load(cls, path: str) -> "WeekFile":
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def _reindex(self) -> None:
+        heads = [(m.group(1).decode("ascii"), m.start()) for m in HEADING_RE.finditer(self.data)]
+        self.index = [
+            (date_str, start, heads[i + 1][1] if i + 1 < len(heads) else len(self.data))
+            for i, (date_str, start) in enumerate(heads)
+        ]
+
+    # -----------------------------
+    # Read
+    # -----------------------------
+    @property
+    def header(self) -> str:
+        end = self.index[0][1] if self.index else len(self.data)
+        return self.data[:end].decode("utf-8")
+
+    def dates(self) -> list:
+        return [date_str for date_str, _, _ in self.index]
+
+    def sections(self):
+        """(날짜, 섹션 텍스트)를 파일 순서대로 생성"""
+        for date_str, start, end in self.index:
+            yield date_str, self.data[start:end].decode("utf-8")
+
+    def get(self, date_str: str):
+        for d, start, end in self.index:
+            if d == date_str:
+                return self.data[start:end].decode("utf-8")
+        return None
+
+    # -----------------------------
+    # Write
+    # -----------------------------
+    def plan(self, date_str: str, section: str) -> tuple:
+        """
+        섹션을 넣거나 바꾸기 위한 splice 계획 (offset, end, new_bytes):
+        data[offset:end]를 new_bytes로 바꾸면 된다. offset == end == len(data)이면 순수 append.
+        - 같은 날짜가 있으면 그 섹션 자리
+        - 없으면 더 늦은 첫 날짜 섹션 앞 (날짜순 유지)
+        - 그것도 없으면 파일 끝
+        """
+        new = section.encode("utf-8")
+        for d, start, end in self.index:
+            if d == date_str:
+                return start, end, new
+        for d, start, _ in self.index:
+            if d > date_str:
+                return start, start, new
+        # 파일 끝: 앞 섹션과 빈 줄 하나로 구분
+        size = len(self.data)
+        if size and not self.data.endswith(b"\n\n"):
+            new = (b"\n" if self.data.endswith(b"\n") else b"\n\n") + new
+        return size, size, new
+
+    def set(self, date_str: str, section: str) -> str:
+        """메모리 상에서 섹션 반영, 'append' 또는 'splice' 반환"""
+        offset, end, new = self.plan(date_str, section)
+        mode = "append" if offset == end == len(self.data) else "splice"
+        self.data = self.data[:offset] + new + self.data[end:]
+        self._reindex()
+        return mode
+
+    def to_bytes(self) -> bytes:
+        return self.data
+
+
+def section_entries(section: str) -> dict:
+    """
+    하루 섹션의 기록 줄을 {습관: (값, 메모)}로 되읽기
+    - 습관(fitness/english/research): 값은 시간 표기 ("1h 30m")
+    - 독서(reading): 값은 책 제목
+    시간 표기와 책 제목에는 "-"가 없으므로 첫 " - " 뒤가 메모
+    """
+    entries = {}
+    for emoji, text in ENTRY_RE.findall(section):
+        value, _, note = text.partition(" - ")
+        entries[ENTRY_HABITS[emoji]] = (value.strip(), note.strip())
+    return entries
+
+
+def upsert_section(path: str, date_str: str, section: str, header: str, batch: WriteBatch) -> str:
+    """
+    파일에 하루치 섹션 반영을 batch에 스테이징:
+    - 새 파일: 헤더 + 섹션 ('create')
+    - 마지막 날짜 뒤: 끝에 덧붙임 ('append')
+    - 그 외: 해당 자리 splice ('splice')
+    """
+    if not os.path.exists(path):
+        batch.write(path, header + section)
+        return "create"
+
+    week = WeekFile.load(path)
+    mode = week.set(date_str, section)
+    batch.write(path, week.to_bytes())
+    return mode
@@ -0,0 +1,41 @@
+import copy
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import store  # noqa: E402
+from columns import DailyColumns  # noqa: E402
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """빈 저장소 디렉토리 - 스크립트들은 logs/, books/ 상대 경로로 읽고 쓴다"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
+    return tmp_path
+
+
+def event(date_str, fitness=0, english=0, research=0, reading=None, note=None):
+    """store.make_event와 같은 모양의 하루치 기록"""
+    return {"date": date_str, "fitness": fitness, "english": english, "research": research,
+            "reading": reading, "note": note}
+
+
+def rebuilt(daily):
+    """daily에서 처음부터 다시 계산한 rollup과 스트릭"""
+    full = {"daily": copy.deepcopy(dict(daily))}
+    store.rebuild_rollups(full)
+    store.rebuild_streak(full)
+    return full
+
+
+def assert_consistent(stats):
+    full = rebuilt(stats["daily"])
+    for bucket in ("weekly", "monthly", "yearly"):
+        assert stats[bucket] == full[bucket], bucket
+    assert stats["streak"] == full["streak"]
+    assert store.streak_summary(stats) == DailyColumns.from_daily(stats["daily"]).streaks()
@@ -0,0 +1,75 @@
+import os
+import stat
+
+import pytest
+
+from atomic import WriteBatch, write_file
+
+
+def leftovers(directory):
+    return [name for name in os.listdir(directory) if name.endswith(".tmp")]
+
+
+def test_commit_applies_every_staged_operation(repo):
+    (repo / "old.txt").write_text("old\n", encoding="utf-8")
+    (repo / "gone.txt").write_text("x", encoding="utf-8")
+    with WriteBatch(fsync=False) as batch:
+        batch.write("sub/dir/new.txt", "새 파일\n")
+        batch.write("old.txt", b"replaced\n")
+        batch.append("log.jsonl", "1\n")
+        batch.append("log.jsonl", "2\n")
+        batch.remove("gone.txt")
+        batch.remove("never-existed.txt")
+        # 커밋 전에는 아무것도 바뀌지 않음
+        assert (repo / "old.txt").read_text(encoding="utf-8") == "old\n"
+        assert not (repo / "log.jsonl").exists()
+
+    assert (repo / "sub/dir/new.txt").read_text(encoding="utf-8") == "새 파일\n"
+    assert (repo / "old.txt").read_text(encoding="utf-8") == "replaced\n"
+    assert (repo / "log.jsonl").read_text(encoding="utf-8") == "1\n2\n"
+    assert not (repo / "gone.txt").exists()
+    assert leftovers(repo) == [] and leftovers(repo / "sub/dir") == []
+
+
+def test_exception_aborts_the_batch(repo):
+    (repo / "keep.txt").write_text("original", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        with WriteBatch(fsync=False) as batch:
+            batch.write("keep.txt", "half-done")
+            batch.write("other.txt", "new")
+            batch.append("log.jsonl", "line\n")
+            raise RuntimeError("boom")
+
+    assert (repo / "keep.txt").read_text(encoding="utf-8") == "original"
+    assert not (repo / "other.txt").exists()
+    assert not (repo / "log.jsonl").exists()
+    assert leftovers(repo) == []
+
+
+def test_rewriting_a_path_keeps_only_the_last_version(repo):
+    batch = WriteBatch(fsync=False)
+    batch.write("a.txt", "first")
+    batch.write("a.txt", "second")
+    assert len(batch) == 1
+    assert len(leftovers(repo)) == 1
+    batch.commit()
+    assert (repo / "a.txt").read_text(encoding="utf-8") == "second"
+    assert leftovers(repo) == []
+
+
+def test_explicit_abort_discards_temp_files(repo):
+    batch = WriteBatch(fsync=False)
+    batch.write("a.txt", "data")
+    batch.abort()
+    assert len(batch) == 0
+    assert not (repo / "a.txt").exists()
+    assert leftovers(repo) == []
+
+
+def test_replace_keeps_file_mode(repo):
+    path = repo / "run.sh"
+    path.write_text("#!/bin/sh\n", encoding="utf-8")
+    os.chmod(path, 0o755)
+    write_file(str(path), "#!/bin/sh\necho hi\n", fsync=False)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o755
+    assert path.read_text(encoding="utf-8") == "#!/bin/sh\necho hi\n"
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+import dashboard
+import packed
+import store
+from conftest import event
+
+
+def test_fingerprint_covers_partitions(repo):
+    store.record_events([event("2024-05-01", fitness=30), event("2025-01-02", english=20)], threshold=0)
+    now = datetime(2025, 1, 3, tzinfo=dashboard.KST)
+    manifest = (repo / store.STATS_FILE).read_bytes()
+    first = dashboard.input_fingerprint(now, "")
+
+    # manifest는 그대로 두고 지난 해 파티션만 고침 (손으로 고치거나 fsck --repair/rebuild.py)
+    path = repo / store.partition_path("2024")
+    path.write_text(path.read_text(encoding="utf-8").replace('"fitness": 30', '"fitness": 45'), encoding="utf-8")
+    assert (repo / store.STATS_FILE).read_bytes() == manifest
+    second = dashboard.input_fingerprint(now, "")
+    assert second != first
+
+    bin_path = repo / packed.packed_path(store.partition_path("2025"))
+    bin_path.write_bytes(bin_path.read_bytes() + b"\0")
+    assert dashboard.input_fingerprint(now, "") != second
@@ -0,0 +1,77 @@
+from datetime import date, timedelta
+
+import pytest
+
+import packed
+import store
+from columns import DailyColumns
+from conftest import event
+
+
+def history():
+    events = []
+    for i in range(0, 800, 1):
+        d = date(2023, 3, 1) + timedelta(days=i)
+        if i % 5 == 4:
+            continue  # 기록이 없는 날 (daily에 없음)
+        events.append(event(d.isoformat(), fitness=(i * 7) % 90, english=20 * (i % 3 == 0),
+                            research=0 if i % 4 else 150, reading="Book A" if i % 6 == 0 else None))
+    return events
+
+
+def assert_same_days(cols, daily):
+    expected = DailyColumns.from_daily(daily)
+    assert (cols.start, len(cols)) == (expected.start, len(expected))
+    for o in range(expected.start, expected.start + len(expected)):
+        assert cols.day(o) == expected.day(o)
+
+
+def test_round_trip_matches_json(repo):
+    store.record_events(history(), threshold=0)
+    loaded = packed.load()
+    assert loaded is not None
+    stats, cols = loaded
+    json_stats = store.load_stats()
+
+    assert_same_days(cols, json_stats["daily"])
+    for key in ("weekly", "monthly", "yearly", "totals", "streak", "books", "meta"):
+        assert stats[key] == json_stats[key], key
+    assert cols.streaks() == store.streak_summary(json_stats)
+
+
+@pytest.mark.parametrize("edit", [
+    event("2024-02-10", fitness=1),            # 활동 여부 그대로 - 그 해만 읽음
+    event("2023-03-02", fitness=0, english=0, research=0),  # 과거 날짜를 쉬는 날로
+    event("2025-06-01", research=30),          # 새 날짜
+])
+def test_log_tail_replays_over_mmap(repo, edit):
+    store.record_events(history(), threshold=0)
+    store.record_events([edit], threshold=10 ** 6)
+
+    stats, cols = packed.load(years=())
+    json_stats = store.load_stats(years=())
+    assert stats["_years"] == json_stats["_years"]
+    for key in ("yearly", "totals", "streak", "books"):
+        assert stats[key] == json_stats[key], key
+    assert_same_days(cols, json_stats["daily"])
+    assert stats["streak"] == store.load_stats()["streak"]
+
+
+def test_stale_bin_falls_back_to_json(repo):
+    store.record_events(history(), threshold=0)
+    path = repo / store.partition_path("2024")
+    # 사람이 JSON만 고치면 .bin은 짝이 맞지 않으므로 쓰지 않음
+    text = path.read_text(encoding="utf-8")
+    edited = text.replace('"fitness": 0,', '"fitness": 1,', 1)
+    assert edited != text
+    path.write_text(edited, encoding="utf-8")
+    assert packed.load_partition(str(path)) is None
+    assert packed.load() is None
+    assert packed.load_partition(str(repo / store.partition_path("2023"))) is not None
+
+
+def test_legacy_snapshot_has_no_packed_copy(repo):
+    (repo / "logs").mkdir()
+    (repo / store.STATS_FILE).write_text('{"daily": {}, "weekly": {}, "monthly": {}, "books": []}',
+                                         encoding="utf-8")
+    assert packed.load() is None
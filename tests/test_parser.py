@@ -0,0 +1,143 @@
+import json
+
+import parser
+import store
+
+BODY = """📅 2025-03-04
+
+💪 1h - 스쿼트
+🗣️ 30m
+🔬 .
+📚 Deep Work - 2장
+
+<!--
+⏰ 시간 형식: 1h, 30m, 1.5h
+-->
+"""
+
+# 주석과 빈 줄만 다름 - 정규화한 해시가 같음
+COMMENT_ONLY = BODY.replace("⏰ 시간 형식: 1h, 30m, 1.5h", "수정함") + "\n\n"
+
+# 텍스트는 다르지만 같은 날짜/내용으로 파싱됨
+SAME_PARSE = BODY.replace("💪 1h - 스쿼트", "💪 60m - 스쿼트")
+
+EDITED = BODY.replace("🗣️ 30m", "🗣️ 45m")
+
+
+def snapshot_files(repo):
+    """통계, 독서/주간 로그와 파싱 캐시 내용"""
+    return {str(p.relative_to(repo)): p.read_bytes() for p in sorted(repo.rglob("*")) if p.is_file()}
+
+
+def test_parse_equivalent_edits():
+    assert parser.issue_digest("t", COMMENT_ONLY) == parser.issue_digest("t", BODY)
+    assert parser.issue_digest("t", SAME_PARSE) != parser.issue_digest("t", BODY)
+    assert parser.parse_issue_body(SAME_PARSE) == parser.parse_issue_body(BODY)
+
+
+def test_ingest_issue_skips_no_op_edits(repo):
+    cache = {}
+    assert parser.ingest_issue("Daily", BODY, 7, cache) is not None
+    files = snapshot_files(repo)
+    version = store.current_version()
+
+    # 다시 받거나 주석만 고친 issue는 파싱 캐시까지 바이트 그대로
+    for body in (BODY, COMMENT_ONLY):
+        assert parser.ingest_issue("Daily", body, 7, parser.load_parse_cache()) is None
+        assert snapshot_files(repo) == files
+    # 같은 내용으로 파싱되는 수정은 캐시의 digest만 갱신
+    assert parser.ingest_issue("Daily", SAME_PARSE, 7, parser.load_parse_cache()) is None
+    cache = parser.PARSE_CACHE_FILE
+    assert {k: v for k, v in snapshot_files(repo).items() if k != cache} == \
+        {k: v for k, v in files.items() if k != cache}
+    assert store.current_version() == version
+
+    stats = parser.ingest_issue("Daily", EDITED, 7, parser.load_parse_cache())
+    assert stats["daily"]["2025-03-04"]["english"] == 45
+    assert store.current_version() == version + 1
+    # 같은 메모가 다시 붙지 않음
+    assert (repo / parser.book_file_path("Deep Work")).read_text(encoding="utf-8").count("2장") == 1
+
+
+def issue(number, body, created_at="2025-03-04T12:00:00Z"):
+    return {"number": number, "title": "Daily", "body": body, "created_at": created_at}
+
+
+def test_ingest_batch_skips_no_op_edits(repo):
+    other = BODY.replace("📅 2025-03-04", "📅 2025-03-05").replace("📚 Deep Work - 2장", "📚 .")
+    assert parser.ingest_batch([issue(7, BODY), issue(8, other)], {}) is not None
+    files = snapshot_files(repo)
+    version = store.current_version()
+
+    for body in (BODY, COMMENT_ONLY):
+        assert parser.ingest_batch([issue(7, body), issue(8, other)], parser.load_parse_cache()) is None
+        assert snapshot_files(repo) == files
+    assert parser.ingest_batch([issue(7, SAME_PARSE), issue(8, other)], parser.load_parse_cache()) is None
+    cache = parser.PARSE_CACHE_FILE
+    assert {k: v for k, v in snapshot_files(repo).items() if k != cache} == \
+        {k: v for k, v in files.items() if k != cache}
+    assert store.current_version() == version
+
+    stats = parser.ingest_batch([issue(7, EDITED), issue(8, other)], parser.load_parse_cache())
+    assert stats["daily"]["2025-03-04"]["english"] == 45
+    assert stats["daily"]["2025-03-05"]["english"] == 30
+    assert store.current_version() == version + 1
+    assert (repo / parser.book_file_path("Deep Work")).read_text(encoding="utf-8").count("2장") == 1
+
+
+def test_dateless_edit_keeps_first_date(repo):
+    dateless = BODY.replace("📅 2025-03-04\n", "")
+    parser.ingest_batch([issue(9, dateless, created_at="2025-03-10T01:00:00Z")], {})
+    cache = parser.load_parse_cache()
+    assert cache["9"]["date"] == "2025-03-10"
+
+    # 나중에 고쳐도 (created_at이 없어도) 처음 기록한 날짜로
+    stats = parser.ingest_batch([{"number": 9, "title": "Daily", "body": dateless.replace("30m", "40m")}], cache)
+    assert stats["daily"]["2025-03-10"]["english"] == 40
+    assert sorted(store.load_stats()["daily"]) == ["2025-03-10"]
+
+
+def test_unrelated_issue_does_not_overwrite_a_day(repo, monkeypatch):
+    parser.ingest_batch([issue(7, BODY)], {})
+    bug = {"number": 8, "title": "Bug: README typo", "body": "README에 오타가 있어요.\n\n- 2번째 문단",
+           "createdAt": "2025-03-04T01:00:00Z"}
+    assert not parser.is_daily_log(bug["body"])
+    assert parser.is_daily_log(BODY)
+
+    output = repo / "github-output.txt"
+    monkeypatch.setenv("GITHUB_OUTPUT", str(output))
+    source = repo / "queue.jsonl"
+    source.write_text(json.dumps(bug, ensure_ascii=False) + "\n" + json.dumps(issue(7, BODY), ensure_ascii=False)
+                      + "\n", encoding="utf-8")
+    parser.ingest_stream(str(source), outputs=True)
+
+    assert store.load_stats()["daily"]["2025-03-04"]["fitness"] == 60
+    # 닫을 issue 목록에도 들어가지 않음
+    assert "issues=7\n" in output.read_text(encoding="utf-8")
+    assert parser.ingest_issue(bug["title"], bug["body"], 8, {}) is None
+    assert store.load_stats()["daily"]["2025-03-04"]["fitness"] == 60
+
+
+def test_no_op_run_does_not_rewrite_the_parse_cache(repo):
+    other = BODY.replace("📅 2025-03-04", "📅 2025-03-05")
+    parser.ingest_batch([issue(7, BODY), issue(8, other)], {})
+    # 7을 나중에 고쳐서 캐시 순서가 8, 7이 됨
+    parser.ingest_batch([issue(7, EDITED)], parser.load_parse_cache())
+    path = repo / parser.PARSE_CACHE_FILE
+    before = path.read_bytes()
+    inode = path.stat().st_ino
+
+    # 번호순으로 다시 받아도 (조회 순서 7, 8) 캐시 파일은 다시 쓰지 않음
+    assert parser.ingest_batch([issue(7, EDITED), issue(8, other)], parser.load_parse_cache()) is None
+    assert parser.ingest_issue("Daily", other, 8, parser.load_parse_cache()) is None
+    assert path.read_bytes() == before
+    assert path.stat().st_ino == inode
+
+
+def test_batch_appends_to_the_event_log(repo):
+    parser.ingest_batch([issue(7, BODY)], {})
+    parser.ingest_batch([issue(7, EDITED)], parser.load_parse_cache())
+    # 스냅샷은 로그 꼬리가 COMPACT_THRESHOLD에 닿을 때만 다시 씀
+    assert not (repo / store.STATS_FILE).exists()
+    assert store.pending_events() == 2
+    assert store.load_stats()["daily"]["2025-03-04"]["english"] == 45
@@ -0,0 +1,75 @@
+from datetime import date, timedelta
+
+import pytest
+
+import store
+from conftest import assert_consistent, event
+
+
+def snapshot(events):
+    """events를 모두 스냅샷으로 접은 뒤 로그는 비움"""
+    store.record_events(events, threshold=0)
+    assert store.pending_events() == 0
+
+
+def tail(events):
+    """events를 스냅샷에 접지 않고 로그 꼬리로만 기록"""
+    store.record_events(events, threshold=10 ** 6)
+
+
+def three_years():
+    events = []
+    for year in (2022, 2023, 2024):
+        for i in range(0, 365, 2):
+            d = date(year, 1, 1) + timedelta(days=i)
+            events.append(event(d.isoformat(), fitness=30, english=20 * (i % 3 == 0)))
+    # 해를 넘기는 긴 연속 구간 (2023-12-20 ~ 2024-01-10)이 최고 기록
+    for i in range(22):
+        d = date(2023, 12, 20) + timedelta(days=i)
+        events.append(event(d.isoformat(), research=60))
+    return events
+
+
+@pytest.mark.parametrize("edit, loaded", [
+    # 같은 활동 여부로 과거 날짜를 고치면 그 해만
+    (event("2023-12-25", research=120), {"2023"}),
+    # 마지막 기록일을 같은 활동 여부로 다시 기록
+    (event("2024-12-30", fitness=45), {"2024"}),
+    # 새 날짜
+    (event("2025-01-03", fitness=10), {"2025"}),
+    # 과거 날짜를 쉬는 날로 바꾸면 스트릭을 다시 훑어야 하므로 전부
+    (event("2024-01-02", research=0), {"2022", "2023", "2024"}),
+    (event("2022-03-05", english=10), {"2022", "2023", "2024"}),
+])
+def test_partial_load_matches_full_load(repo, edit, loaded):
+    snapshot(three_years())
+    tail([edit])
+
+    partial = store.load_stats(years=())
+    assert partial["_years"] == loaded
+    full = store.load_stats()
+    assert full["_years"] >= {"2022", "2023", "2024"}
+    for key in ("yearly", "totals", "streak", "books", "meta"):
+        assert partial[key] == full[key], key
+    for d, day in partial["daily"].items():
+        assert full["daily"][d] == day
+    assert_consistent(full)
+
+
+def test_partial_compaction_rewrites_only_touched_years(repo):
+    snapshot(three_years())
+    before = {y: (repo / store.partition_path(y)).read_bytes() for y in ("2022", "2023", "2024")}
+    store.record_events([event("2024-06-01", fitness=99)], threshold=0)
+    after = {y: (repo / store.partition_path(y)).read_bytes() for y in ("2022", "2023", "2024")}
+    assert after["2022"] == before["2022"] and after["2023"] == before["2023"]
+    assert after["2024"] != before["2024"]
+    assert_consistent(store.load_stats())
+
+
+def test_ensure_years_loads_the_rest(repo):
+    snapshot(three_years())
+    stats = store.load_stats(years=["2024"])
+    assert stats["_years"] == {"2024"}
+    store.ensure_years(stats, None)
+    assert stats["_years"] == {"2022", "2023", "2024"}
+    assert stats["daily"] == store.load_stats()["daily"]
@@ -0,0 +1,97 @@
+import json
+import random
+from datetime import date, timedelta
+
+import pytest
+
+import store
+from conftest import assert_consistent, event
+
+
+def random_events(rng, first, days, count):
+    """first부터 days일 안의 날짜를 무작위 순서로 (같은 날 다시 고치기, 쉬는 날로 바꾸기 포함)"""
+    events = []
+    for _ in range(count):
+        d = first + timedelta(days=rng.randrange(days))
+        idle = rng.random() < 0.3
+        events.append(event(d.isoformat(),
+                            fitness=0 if idle else rng.choice((0, 30, 60)),
+                            english=0 if idle else rng.choice((0, 20)),
+                            research=0 if idle else rng.choice((0, 90)),
+                            reading=rng.choice((None, "Book A", "Book B"))))
+    return events
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_replay_matches_rebuild(repo, seed):
+    rng = random.Random(seed)
+    events = random_events(rng, date(2023, 11, 1), 500, 300)
+    # 작은 threshold로 기록하면 append와 compaction이 섞인다
+    for i in range(0, len(events), 7):
+        store.record_events(events[i:i + 7], threshold=20)
+
+    assert_consistent(store.load_stats())
+    # 스냅샷을 거치지 않고 한 번에 재생해도 같음
+    assert_consistent(store.replay(store.new_stats(), events))
+
+
+def test_backfill_defers_streak_rebuild(repo):
+    stats = store.replay(store.new_stats(), [event("2024-01-10", fitness=30)])
+    backfill = [event((date(2024, 1, 9) - timedelta(days=i)).isoformat(), fitness=30) for i in range(20)]
+    store.replay(stats, backfill)
+    assert store.streak_summary(stats) == {"current": 21, "best": 21}
+    assert_consistent(stats)
+
+
+def legacy_snapshot():
+    """파티션, 이벤트 로그, meta 이전의 단일 stats.json (books는 메모를 품은 목록)"""
+    daily = {
+        "2024-12-30": {"fitness": 30, "english": 0, "research": 0, "reading": None},
+        "2024-12-31": {"fitness": 0, "english": 30, "research": 0, "reading": "Book A"},
+        "2025-01-01": {"fitness": 0, "english": 0, "research": 60, "reading": "Book A"},
+        "2025-01-03": {"fitness": 0, "english": 0, "research": 0, "reading": None},
+    }
+    return {
+        "daily": daily,
+        # 예전 rollup에는 days/active가 없고 주 키의 연도가 달력 연도
+        "weekly": {"2024-W01": {"fitness": 30, "english": 30, "research": 60}},
+        "monthly": {"2024-12": {"fitness": 30, "english": 30, "research": 0}},
+        "yearly": {},
+        "books": [
+            {"title": "Book A", "first_read": "2024-12-31", "last_read": "2025-01-01",
+             "notes": [{"date": "2024-12-31", "note": "ch.1"}, {"date": "2025-01-01", "note": "ch.2"}]},
+        ],
+    }
+
+
+def test_legacy_snapshot_migration(repo):
+    (repo / "logs").mkdir()
+    (repo / store.STATS_FILE).write_text(json.dumps(legacy_snapshot()), encoding="utf-8")
+
+    stats = store.load_stats()
+    assert stats["books"] == {"Book A": {"first_read": "2024-12-31", "last_read": "2025-01-01", "notes": 2}}
+    assert stats["meta"]["first_date"] == "2024-12-30"
+    assert store.streak_summary(stats) == {"current": 0, "best": 3}
+    assert_consistent(stats)
+
+    # 다음 compaction이 연도 파티션과 manifest로 나눠 씀
+    store.record_events([event("2025-01-04", fitness=20, reading="Book A", note="ch.3")], threshold=0)
+    manifest = json.loads((repo / store.STATS_FILE).read_text(encoding="utf-8"))
+    assert "daily" not in manifest
+    assert manifest["meta"]["partitions"] == ["2024", "2025"]
+    assert manifest["meta"]["rollups"] == store.ROLLUP_VERSION
+    assert manifest["books"]["Book A"] == {"first_read": "2024-12-31", "last_read": "2025-01-04", "notes": 3}
+    assert not (repo / "logs" / "books").exists()
+
+    stats = store.load_stats()
+    assert len(stats["daily"]) == 5
+    assert_consistent(stats)
+
+
+def test_version_conflict(repo):
+    store.record_events([event("2025-01-01", fitness=10)])
+    version = store.current_version()
+    store.record_events([event("2025-01-02", fitness=10)], expect_version=version)
+    with pytest.raises(store.VersionConflict):
+        store.record_events([event("2025-01-03", fitness=10)], expect_version=version)
+    assert store.current_version() == version + 1